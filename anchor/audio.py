@@ -0,0 +1,675 @@
+from __future__ import annotations
+
+import collections
+import hashlib
+import logging
+import os
+import pathlib
+import struct
+import threading
+import typing
+
+import numpy as np
+import scipy.signal
+import soundfile
+
+logger = logging.getLogger("anchor")
+
+MEMMAP_SUBTYPES = {
+    "PCM_16": ("<i2", 32768.0),
+    "PCM_32": ("<i4", 2147483648.0),
+    "FLOAT": ("<f4", None),
+    "DOUBLE": ("<f8", None),
+}
+
+
+class AudioSourceClosedError(Exception):
+    """Raised when reading from an audio source that has been closed"""
+
+
+def find_wav_data_chunk(path: typing.Union[str, os.PathLike]) -> typing.Optional[int]:
+    """Return the byte offset of the ``data`` chunk of a little-endian RIFF/WAVE file"""
+    with open(path, "rb") as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            return None
+        while True:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                return None
+            chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+            if chunk_id == b"data":
+                return f.tell()
+            f.seek(chunk_size + (chunk_size % 2), os.SEEK_CUR)
+
+
+class AudioSource:
+    """
+    Windowed access to a sound file
+
+    PCM WAV files are memory-mapped so that slices are read straight from the page cache,
+    other formats are decoded in fixed size blocks that are kept in a small LRU cache.
+    Memory use is bounded by the requested window and the block cache, not the file length.
+
+    Parameters
+    ----------
+    path: str
+        Path to the sound file
+    block_size: int
+        Number of frames per decoded block for formats that cannot be memory-mapped
+    max_blocks: int
+        Maximum number of decoded blocks to keep
+    data_path: str, optional
+        Path to a transcoded copy of the sound file to read samples from instead
+    """
+
+    def __init__(
+        self,
+        path,
+        block_size: int = 2**16,
+        max_blocks: int = 64,
+        data_path: typing.Optional[str] = None,
+    ):
+        self.path = str(path)
+        self.data_path = str(data_path) if data_path is not None else self.path
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+        info = soundfile.info(self.data_path)
+        self.sample_rate = info.samplerate
+        self.num_channels = info.channels
+        self.num_frames = info.frames
+        self.subtype = info.subtype
+        self.format = info.format
+        self._memmap = None
+        self._scale = None
+        self._blocks: typing.OrderedDict[int, np.ndarray] = collections.OrderedDict()
+        self._sound_file = None
+        self._lock = threading.Lock()
+        self.closed = False
+        if self.format == "WAV" and self.subtype in MEMMAP_SUBTYPES:
+            offset = find_wav_data_chunk(self.data_path)
+            if offset is not None:
+                dtype, self._scale = MEMMAP_SUBTYPES[self.subtype]
+                self._memmap = np.memmap(
+                    self.data_path,
+                    dtype=dtype,
+                    mode="r",
+                    offset=offset,
+                    shape=(self.num_frames, self.num_channels),
+                )
+
+    @property
+    def duration(self) -> float:
+        return self.num_frames / self.sample_rate
+
+    @property
+    def memory_mapped(self) -> bool:
+        return self._memmap is not None
+
+    def close(self):
+        with self._lock:
+            self.closed = True
+            self._memmap = None
+            self._blocks.clear()
+            if self._sound_file is not None:
+                self._sound_file.close()
+                self._sound_file = None
+
+    def time_to_frame(self, time: float) -> int:
+        return min(max(int(time * self.sample_rate), 0), self.num_frames)
+
+    def _read_block(self, block_index: int) -> np.ndarray:
+        try:
+            self._blocks.move_to_end(block_index)
+            return self._blocks[block_index]
+        except KeyError:
+            pass
+        if self._sound_file is None:
+            self._sound_file = soundfile.SoundFile(self.data_path)
+        self._sound_file.seek(block_index * self.block_size)
+        block = self._sound_file.read(self.block_size, dtype="float64", always_2d=True)
+        self._blocks[block_index] = block
+        while len(self._blocks) > self.max_blocks:
+            self._blocks.popitem(last=False)
+        return block
+
+    def read_frames(
+        self,
+        begin_frame: int,
+        end_frame: int,
+        channel: typing.Optional[int] = None,
+        dtype: str = "float64",
+    ) -> np.ndarray:
+        begin_frame = min(max(begin_frame, 0), self.num_frames)
+        end_frame = min(max(end_frame, begin_frame), self.num_frames)
+        if self.num_channels == 1:
+            channel = 0
+        with self._lock:
+            if self.closed:
+                raise AudioSourceClosedError(self.path)
+            if self._memmap is not None:
+                if channel is None:
+                    y = np.array(self._memmap[begin_frame:end_frame], dtype=dtype)
+                else:
+                    y = np.array(self._memmap[begin_frame:end_frame, channel], dtype=dtype)
+                if self._scale is not None:
+                    y /= self._scale
+            else:
+                first_block = begin_frame // self.block_size
+                last_block = max(end_frame - 1, begin_frame) // self.block_size
+                blocks = [self._read_block(i) for i in range(first_block, last_block + 1)]
+                y = np.concatenate(blocks, axis=0) if len(blocks) > 1 else blocks[0]
+                start = begin_frame - first_block * self.block_size
+                y = y[start : start + end_frame - begin_frame]
+                if channel is not None:
+                    y = y[:, channel]
+                y = np.array(y, dtype=dtype)
+        return y
+
+    def read(
+        self,
+        begin: float,
+        end: float,
+        channel: typing.Optional[int] = None,
+        dtype: str = "float64",
+    ) -> np.ndarray:
+        return self.read_frames(
+            self.time_to_frame(begin), self.time_to_frame(end), channel, dtype=dtype
+        )
+
+    def read_padded(self, begin_frame: int, end_frame: int, channel: int) -> np.ndarray:
+        """Read a single channel, zero-padding any part of the range outside the file"""
+        y = self.read_frames(begin_frame, end_frame, channel)
+        pad_before = min(max(-begin_frame, 0), end_frame - begin_frame)
+        pad_after = end_frame - begin_frame - pad_before - y.shape[0]
+        if pad_before or pad_after:
+            y = np.pad(y, (pad_before, max(pad_after, 0)))
+        return y
+
+
+def resample(y: np.ndarray, sample_rate: int, target_rate: int) -> np.ndarray:
+    """Polyphase resampling of ``y`` from ``sample_rate`` to ``target_rate``"""
+    sample_rate = int(sample_rate)
+    target_rate = int(target_rate)
+    if sample_rate == target_rate or y.shape[0] == 0:
+        return y
+    gcd = np.gcd(sample_rate, target_rate)
+    return scipy.signal.resample_poly(y, target_rate // gcd, sample_rate // gcd).astype(
+        y.dtype, copy=False
+    )
+
+
+class ViewAudio:
+    """
+    Samples for the current view, channel-selected, resampled to the analysis rate and cast to
+    float32 once so that every feature worker can share the same read-only buffer
+
+    Parameters
+    ----------
+    samples: :class:`numpy.ndarray`
+        Mono samples at ``sample_rate``
+    sample_rate: int
+        Analysis sample rate
+    begin: float
+        Start of the view in seconds
+    end: float
+        End of the view in seconds
+    channel: int
+        Channel the samples were taken from
+    """
+
+    def __init__(self, samples: np.ndarray, sample_rate: int, begin: float, end: float, channel):
+        samples.flags.writeable = False
+        self.samples = samples
+        self.sample_rate = sample_rate
+        self.begin = begin
+        self.end = end
+        self.channel = channel
+
+    @classmethod
+    def prepare(
+        cls,
+        audio_source: AudioSource,
+        begin: float,
+        end: float,
+        channel: int,
+        max_sample_rate: int = 16000,
+    ) -> ViewAudio:
+        sample_rate = min(audio_source.sample_rate, max_sample_rate)
+        y = audio_source.read(begin, end, channel, dtype="float32")
+        y = resample(y, audio_source.sample_rate, sample_rate)
+        return cls(np.ascontiguousarray(y, dtype=np.float32), sample_rate, begin, end, channel)
+
+
+def min_max_envelope(y: np.ndarray, num_points: int) -> np.ndarray:
+    """
+    Decimate samples to interleaved min/max pairs so that at most ``num_points`` values are
+    returned, keeping the peaks of every bin
+    """
+    if num_points < 2 or y.shape[0] <= num_points:
+        return y
+    bin_size = int(np.ceil(y.shape[0] / (num_points / 2)))
+    num_bins = int(np.ceil(y.shape[0] / bin_size))
+    padding = num_bins * bin_size - y.shape[0]
+    if padding:
+        y = np.pad(y, (0, padding), mode="edge")
+    y = y.reshape(num_bins, bin_size)
+    envelope = np.empty((num_bins, 2), dtype=y.dtype)
+    envelope[:, 0] = np.min(y, axis=1)
+    envelope[:, 1] = np.max(y, axis=1)
+    return envelope.reshape(-1)
+
+
+class PeakPyramid:
+    """
+    Multi-resolution min/max peaks of a sound file
+
+    Level 0 stores the minimum and maximum of every ``base_bin_size`` frames for each channel,
+    and every following level halves the resolution of the previous one.  All levels are
+    stored contiguously in ``data`` with shape ``(num_bins, num_channels, 2)``.
+
+    Parameters
+    ----------
+    data: :class:`~numpy.ndarray`
+        Min/max pairs for all levels
+    level_offsets: list[int]
+        Index of the first bin of each level in ``data``
+    num_frames: int
+        Number of frames in the sound file
+    base_bin_size: int
+        Number of frames summarized by a bin at level 0
+    """
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        level_offsets: typing.List[int],
+        num_frames: int,
+        base_bin_size: int,
+    ):
+        self.data = data
+        self.level_offsets = list(level_offsets)
+        self.num_frames = num_frames
+        self.base_bin_size = base_bin_size
+
+    @property
+    def num_levels(self) -> int:
+        return len(self.level_offsets) - 1
+
+    @property
+    def num_channels(self) -> int:
+        return self.data.shape[1]
+
+    def level(self, level: int) -> np.ndarray:
+        return self.data[self.level_offsets[level] : self.level_offsets[level + 1]]
+
+    @staticmethod
+    def compute_level_offsets(num_frames: int, base_bin_size: int) -> typing.List[int]:
+        num_bins = max(int(np.ceil(num_frames / base_bin_size)), 1)
+        level_offsets = [0, num_bins]
+        while num_bins > 1:
+            num_bins = int(np.ceil(num_bins / 2))
+            level_offsets.append(level_offsets[-1] + num_bins)
+        return level_offsets
+
+    @classmethod
+    def build(
+        cls,
+        audio_source: AudioSource,
+        base_bin_size: int = 256,
+        chunk_bins: int = 4096,
+        stopped: typing.Optional[threading.Event] = None,
+    ) -> typing.Optional[PeakPyramid]:
+        num_frames = audio_source.num_frames
+        num_channels = audio_source.num_channels
+        num_bins = max(int(np.ceil(num_frames / base_bin_size)), 1)
+        level = np.zeros((num_bins, num_channels, 2), dtype=np.float32)
+        for start_bin in range(0, num_bins, chunk_bins):
+            if stopped is not None and stopped.is_set():
+                return None
+            end_bin = min(start_bin + chunk_bins, num_bins)
+            y = audio_source.read_frames(start_bin * base_bin_size, end_bin * base_bin_size)
+            if y.shape[0] == 0:
+                continue
+            if len(y.shape) == 1:
+                y = y[:, np.newaxis]
+            padding = (end_bin - start_bin) * base_bin_size - y.shape[0]
+            if padding:
+                y = np.pad(y, ((0, padding), (0, 0)), mode="edge")
+            y = y.reshape(end_bin - start_bin, base_bin_size, num_channels)
+            level[start_bin:end_bin, :, 0] = np.min(y, axis=1)
+            level[start_bin:end_bin, :, 1] = np.max(y, axis=1)
+        levels = [level]
+        while level.shape[0] > 1:
+            if level.shape[0] % 2:
+                level = np.concatenate([level, level[-1:]], axis=0)
+            next_level = np.empty((level.shape[0] // 2, num_channels, 2), dtype=np.float32)
+            next_level[:, :, 0] = np.minimum(level[0::2, :, 0], level[1::2, :, 0])
+            next_level[:, :, 1] = np.maximum(level[0::2, :, 1], level[1::2, :, 1])
+            levels.append(next_level)
+            level = next_level
+        level_offsets = [0]
+        for level in levels:
+            level_offsets.append(level_offsets[-1] + level.shape[0])
+        return cls(np.concatenate(levels, axis=0), level_offsets, num_frames, base_bin_size)
+
+    def envelope(
+        self, begin_frame: int, end_frame: int, channel: int, num_points: int
+    ) -> typing.Optional[np.ndarray]:
+        """
+        Get interleaved min/max values for a frame range at the coarsest level that still gives
+        at least ``num_points`` values, or None if the range needs finer detail than level 0
+        """
+        if end_frame <= begin_frame or num_points < 2:
+            return None
+        target_bin_size = (end_frame - begin_frame) / (num_points / 2)
+        if target_bin_size < self.base_bin_size:
+            return None
+        level = min(int(np.log2(target_bin_size / self.base_bin_size)), self.num_levels - 1)
+        bin_size = self.base_bin_size * 2**level
+        begin_bin = begin_frame // bin_size
+        end_bin = int(np.ceil(end_frame / bin_size))
+        channel = min(channel, self.num_channels - 1)
+        return np.array(self.level(level)[begin_bin:end_bin, channel], dtype=np.float64).reshape(
+            -1
+        )
+
+
+class FileCache:
+    """
+    On-disk cache of arrays derived from sound files
+
+    Entries are ``.npy`` files keyed on the path, size and modification time of the sound file
+    along with any parameters used to compute them, and are memory-mapped when loaded.  Once
+    the cache grows past ``max_size`` bytes, the least recently used entries are removed.
+
+    Parameters
+    ----------
+    directory: str
+        Directory to store cached arrays
+    max_size: int
+        Maximum size of the cache in bytes
+    """
+
+    suffix = ".npy"
+
+    def __init__(self, directory: typing.Union[str, os.PathLike], max_size: int):
+        self.directory = pathlib.Path(directory)
+        self.max_size = max_size
+
+    def cache_path(self, path: str, *parameters) -> pathlib.Path:
+        stat = os.stat(path)
+        key = "|".join(
+            str(x) for x in (os.path.abspath(path), stat.st_size, stat.st_mtime_ns) + parameters
+        )
+        return self.directory.joinpath(hashlib.sha1(key.encode("utf8")).hexdigest() + self.suffix)
+
+    def load_array(self, audio_source: AudioSource, *parameters) -> typing.Optional[np.ndarray]:
+        try:
+            path = self.cache_path(audio_source.path, *parameters)
+            if not path.exists():
+                return None
+            data = np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def save_array(self, audio_source: AudioSource, data: np.ndarray, *parameters) -> bool:
+        if self.max_size <= 0:
+            return False
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.cache_path(audio_source.path, *parameters)
+            temp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(temp_path, "wb") as f:
+                np.save(f, np.ascontiguousarray(data, dtype=np.float32))
+            os.replace(temp_path, path)
+        except OSError:
+            return False
+        self.evict()
+        return True
+
+    def evict(self):
+        entries = []
+        total_size = 0
+        for path in self.directory.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total_size -= size
+
+
+class PeakCache(FileCache):
+    """On-disk cache of :class:`PeakPyramid` data"""
+
+    def load(
+        self, audio_source: AudioSource, base_bin_size: int = 256
+    ) -> typing.Optional[PeakPyramid]:
+        data = self.load_array(audio_source, base_bin_size)
+        if data is None:
+            return None
+        level_offsets = PeakPyramid.compute_level_offsets(audio_source.num_frames, base_bin_size)
+        if data.shape != (level_offsets[-1], audio_source.num_channels, 2):
+            return None
+        return PeakPyramid(data, level_offsets, audio_source.num_frames, base_bin_size)
+
+    def save(self, audio_source: AudioSource, peaks: PeakPyramid):
+        if not self.save_array(audio_source, peaks.data, peaks.base_bin_size):
+            logger.warning(f"Could not cache waveform peaks for {audio_source.path}")
+
+
+class PitchTrack:
+    """
+    Pitch and NCCF for a full channel of a sound file, one row per frame
+
+    Parameters
+    ----------
+    data: :class:`numpy.ndarray`
+        Array of shape (num_frames, 2) with the NCCF and the pitch in Hz of each frame
+    frame_shift: float
+        Frame shift in seconds
+    """
+
+    def __init__(self, data: np.ndarray, frame_shift: float):
+        self.data = data
+        self.frame_shift = frame_shift
+
+    @property
+    def num_frames(self) -> int:
+        return self.data.shape[0]
+
+    def slice(self, begin: float, end: float) -> np.ndarray:
+        begin_frame = min(max(int(round(begin / self.frame_shift)), 0), self.num_frames)
+        end_frame = min(max(int(round(end / self.frame_shift)), begin_frame), self.num_frames)
+        return np.asarray(self.data[begin_frame:end_frame], dtype=np.float64)
+
+
+class PitchCache(FileCache):
+    """
+    On-disk cache of whole-file :class:`PitchTrack` data, keyed on the channel and the pitch
+    extraction options
+    """
+
+    def load(
+        self, audio_source: AudioSource, channel: int, frame_shift: float, options: tuple
+    ) -> typing.Optional[PitchTrack]:
+        data = self.load_array(audio_source, channel, frame_shift, *options)
+        if data is None or len(data.shape) != 2 or data.shape[1] != 2:
+            return None
+        return PitchTrack(data, frame_shift)
+
+    def save(
+        self, audio_source: AudioSource, channel: int, options: tuple, pitch_track: PitchTrack
+    ):
+        if not self.save_array(
+            audio_source, pitch_track.data, channel, pitch_track.frame_shift, *options
+        ):
+            logger.warning(f"Could not cache pitch track for {audio_source.path}")
+
+
+def needs_transcoding(path: str) -> bool:
+    """Check whether a sound file would be decoded block by block rather than memory-mapped"""
+    try:
+        info = soundfile.info(path)
+    except (soundfile.LibsndfileError, RuntimeError, OSError):
+        return False
+    return info.format != "WAV" or info.subtype not in MEMMAP_SUBTYPES
+
+
+TRANSCODE_SUBTYPES = {
+    "PCM_S8": "PCM_16",
+    "PCM_U8": "PCM_16",
+    "PCM_16": "PCM_16",
+    "PCM_24": "PCM_32",
+    "PCM_32": "PCM_32",
+    "DOUBLE": "DOUBLE",
+}
+
+TRANSCODE_DTYPES = {
+    "PCM_16": "int16",
+    "PCM_32": "int32",
+    "FLOAT": "float32",
+    "DOUBLE": "float64",
+}
+
+
+def transcoded_subtype(subtype: str) -> str:
+    """
+    Get the memory-mappable WAV subtype that holds samples of ``subtype`` without losing
+    precision, with lossy and other floating point formats kept as 32-bit floats
+    """
+    return TRANSCODE_SUBTYPES.get(subtype, "FLOAT")
+
+
+def transcode_audio(path: str, output_path: str, block_size: int = 2**20) -> typing.Optional[str]:
+    """
+    Decode a sound file to a PCM or floating point WAV file that keeps the precision of the
+    source, returning the output path on success
+
+    Run in worker processes, so it only takes and returns plain paths
+    """
+    temp_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        with soundfile.SoundFile(path) as in_file:
+            subtype = transcoded_subtype(in_file.subtype)
+            with soundfile.SoundFile(
+                temp_path,
+                "w",
+                samplerate=in_file.samplerate,
+                channels=in_file.channels,
+                format="WAV",
+                subtype=subtype,
+            ) as out_file:
+                while True:
+                    block = in_file.read(
+                        block_size, dtype=TRANSCODE_DTYPES[subtype], always_2d=True
+                    )
+                    if block.shape[0] == 0:
+                        break
+                    out_file.write(block)
+        os.replace(temp_path, output_path)
+    except (soundfile.LibsndfileError, RuntimeError, OSError):
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return None
+    return output_path
+
+
+class TranscodeCache(FileCache):
+    """
+    On-disk cache of compressed sound files transcoded to uncompressed WAV, so that they can be
+    memory-mapped by :class:`AudioSource`
+    """
+
+    suffix = ".wav"
+
+    def lookup(self, path: str) -> typing.Optional[str]:
+        try:
+            cache_path = self.cache_path(path)
+            if not cache_path.exists():
+                return None
+            os.utime(cache_path)
+        except OSError:
+            return None
+        return str(cache_path)
+
+    def open(self, path: str) -> AudioSource:
+        """Open a sound file, reading from its transcoded copy when one is cached"""
+        data_path = self.lookup(path)
+        if data_path is not None:
+            try:
+                return AudioSource(path, data_path=data_path)
+            except (soundfile.LibsndfileError, RuntimeError):
+                logger.warning(f"Could not read transcoded copy of {path}")
+        return AudioSource(path)
+
+
+class ArrayCache:
+    """
+    Thread-safe LRU cache of numpy arrays bounded by their total size in bytes
+
+    Parameters
+    ----------
+    max_size: int
+        Maximum number of bytes to keep
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.size = 0
+        self._entries: typing.OrderedDict[typing.Hashable, np.ndarray] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key) -> typing.Optional[np.ndarray]:
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return None
+            return self._entries[key]
+
+    def put(self, key, value: np.ndarray):
+        with self._lock:
+            if key in self._entries:
+                self.size -= self._entries.pop(key).nbytes
+            self._entries[key] = value
+            self.size += value.nbytes
+            self._evict()
+
+    def resize(self, max_size: int):
+        with self._lock:
+            self.max_size = max_size
+            self._evict()
+
+    def _evict(self):
+        while self.size > self.max_size and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
@@ -155,11 +155,44 @@ class MainWindow(QtWidgets.QMainWindow):
             "Querying dictionary": None,
             "Querying OOVs": None,
             "Counting OOV results": None,
+            "Counting dictionary results": None,
+            "Estimating utterance results": None,
+            "Estimating speaker results": None,
+            "Estimating dictionary results": None,
+            "Estimating OOV results": None,
+            "Estimating alignment analysis results": None,
             "Clustering speaker utterances": None,
             "Generating speaker MDS": None,
             "Loading speaker ivectors": None,
             "Merging speakers": None,
+            "Transcoding audio": None,
+            "Prefetching next utterances": None,
+            "Prefetching previous utterances": None,
         }
+        self.coalesced_runners = {
+            "Counting utterance results",
+            "Counting speaker results",
+            "Counting alignment analysis results",
+            "Counting OOV results",
+            "Counting dictionary results",
+            "Analyzing alignments",
+            "Querying utterances",
+            "Querying speakers",
+            "Querying dictionary",
+            "Querying OOVs",
+            "Estimating utterance results",
+            "Estimating speaker results",
+            "Estimating dictionary results",
+            "Estimating OOV results",
+            "Estimating alignment analysis results",
+        }
+        self.running_single_runners = {}
+        self.queued_single_runners = {}
+        self.prefetch_runners = {
+            "Prefetching next utterances": "Querying utterances",
+            "Prefetching previous utterances": "Querying utterances",
+        }
+        self.parked_prefetch_runners = {}
         self.sequential_runners = {
             "Exporting files": [],
             # "Changing speakers": [],
@@ -170,6 +203,13 @@ class MainWindow(QtWidgets.QMainWindow):
             "Generating spectrogram",
             "Generating pitch track",
             "Creating speaker tiers",
+            "Prefetching next utterances",
+            "Prefetching previous utterances",
+            "Estimating utterance results",
+            "Estimating speaker results",
+            "Estimating dictionary results",
+            "Estimating OOV results",
+            "Estimating alignment analysis results",
         }
         self.current_query_worker = None
         self.current_count_worker = None
@@ -423,10 +463,14 @@ class MainWindow(QtWidgets.QMainWindow):
             self.set_application_state("loading")
             worker = workers.DuplicateFilesWorker(self.corpus_model.session, **extra_args[0])
             worker.signals.result.connect(finished_function)
-        elif function == "Counting utterance results":
+        elif function in {"Counting utterance results", "Estimating utterance results"}:
             worker = workers.QueryUtterancesWorker(self.corpus_model.session, **extra_args[0])
             worker.signals.result.connect(finished_function)
-        elif function in {"Analyzing alignments", "Counting alignment analysis results"}:
+        elif function in {
+            "Analyzing alignments",
+            "Counting alignment analysis results",
+            "Estimating alignment analysis results",
+        }:
             worker = workers.AlignmentAnalysisWorker(self.corpus_model.session, **extra_args[0])
             worker.signals.result.connect(finished_function)
         elif function == "Diarizing utterances":
@@ -454,19 +498,23 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.corpus_model.session, **extra_args[0]
             )
             worker.signals.finished.connect(finished_function)
-        elif function == "Querying utterances":
+        elif function in {
+            "Querying utterances",
+            "Prefetching next utterances",
+            "Prefetching previous utterances",
+        }:
             worker = workers.QueryUtterancesWorker(self.corpus_model.session, **extra_args[0])
             worker.signals.result.connect(finished_function)
         elif function == "Querying speakers":
             worker = workers.QuerySpeakersWorker(self.corpus_model.session, **extra_args[0])
             worker.signals.result.connect(finished_function)
-        elif function == "Counting speaker results":
+        elif function in {"Counting speaker results", "Estimating speaker results"}:
             worker = workers.QuerySpeakersWorker(self.corpus_model.session, **extra_args[0])
             worker.signals.result.connect(finished_function)
         elif function == "Creating speaker tiers":
             worker = workers.FileUtterancesWorker(self.corpus_model.session, *extra_args)
             worker.signals.result.connect(finished_function)
-        elif function == "Counting dictionary results":
+        elif function in {"Counting dictionary results", "Estimating dictionary results"}:
             worker = workers.QueryDictionaryWorker(self.corpus_model.session, **extra_args[0])
             worker.signals.result.connect(finished_function)
         elif function == "Querying dictionary":
@@ -475,7 +523,7 @@ class MainWindow(QtWidgets.QMainWindow):
         elif function == "Querying OOVs":
             worker = workers.QueryOovWorker(self.corpus_model.session, **extra_args[0])
             worker.signals.result.connect(finished_function)
-        elif function == "Counting OOV results":
+        elif function in {"Counting OOV results", "Estimating OOV results"}:
             worker = workers.QueryOovWorker(self.corpus_model.session, **extra_args[0])
             worker.signals.result.connect(finished_function)
         elif function == "Clustering speaker utterances":
@@ -496,6 +544,9 @@ class MainWindow(QtWidgets.QMainWindow):
             self.ui.loadingScreen.setCorpusName("Saving dictionary changes...")
             worker = workers.ExportLexiconWorker(self.corpus_model.corpus, **extra_args[0])
             worker.signals.result.connect(finished_function)
+        elif function == "Transcoding audio":
+            worker = workers.TranscodeAudioWorker(self.corpus_model.session, *extra_args)
+            worker.signals.result.connect(finished_function)
         elif function == "Exporting files":
             worker = workers.ExportFilesWorker(self.corpus_model.session, *extra_args)
             self.set_application_state("loading", worker)
@@ -506,10 +557,25 @@ class MainWindow(QtWidgets.QMainWindow):
                 extra_args = []
             worker = workers.Worker(function, *extra_args)
             worker.signals.result.connect(finished_function)
+        if self.prefetch_runners.get(function, None) in self.running_single_runners:
+            # Hold off until the page query is done rather than competing with it
+            delayed_start = True
+            self.parked_prefetch_runners[function] = worker
         if function in self.single_runners:
-            if self.single_runners[function] is not None:
-                self.single_runners[function].cancel()
+            previous_worker = self.single_runners[function]
+            if previous_worker is not None:
+                previous_worker.cancel()
+                if previous_worker is self.queued_single_runners.get(function, None):
+                    # Superseded before it started, so release anything tracking it
+                    previous_worker.signals.finished.emit()
             self.single_runners[function] = worker
+            if function in self.coalesced_runners:
+                if function in self.running_single_runners:
+                    delayed_start = True
+                    self.queued_single_runners[function] = worker
+                else:
+                    self.running_single_runners[function] = worker
+                worker.signals.finished.connect(self.update_single_runners)
         if function in self.sequential_runners:
             delayed_start = len(self.sequential_runners[function]) > 0
             if delayed_start:
@@ -528,6 +594,32 @@ class MainWindow(QtWidgets.QMainWindow):
                 worker.name = function
             self.status_indicator.add_worker(worker)
 
+    def update_single_runners(self):
+        sender = self.sender()
+        for function, worker in list(self.running_single_runners.items()):
+            if worker.signals != sender:
+                continue
+            queued_worker = self.queued_single_runners.pop(function, None)
+            if queued_worker is None:
+                del self.running_single_runners[function]
+                for prefetch_function, query_function in self.prefetch_runners.items():
+                    if query_function != function:
+                        continue
+                    parked_worker = self.parked_prefetch_runners.pop(prefetch_function, None)
+                    if parked_worker is not None:
+                        self.thread_pool.start(parked_worker)
+            else:
+                self.running_single_runners[function] = queued_worker
+                self.thread_pool.start(queued_worker)
+
+    def cancel_prefetch_runners(self, functions):
+        for function in functions:
+            self.parked_prefetch_runners.pop(function, None)
+            worker = self.single_runners.get(function, None)
+            if worker is not None:
+                worker.cancel()
+                self.single_runners[function] = None
+
     def update_sequential_runners(self):
         sender = self.sender()
         for k, v in self.sequential_runners.items():
@@ -548,6 +640,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.corpus_model.runFunction.connect(self.execute_runnable)
         self.diarization_model.runFunction.connect(self.execute_runnable)
         self.alignment_analysis_model.runFunction.connect(self.execute_runnable)
+        self.corpus_model.prefetchCancelled.connect(self.cancel_prefetch_runners)
         self.corpus_model.lockCorpus.connect(self.anchor_lock_corpus)
         self.corpus_model.statusUpdate.connect(self.update_status_message)
         self.corpus_model.unlockCorpus.connect(self.anchor_unlock_corpus)
@@ -595,6 +688,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.selection_model.set_current_utterance
         )
         self.selection_model.fileViewRequested.connect(self.file_selection_model.set_current_file)
+        self.selection_model.prefetchRequested.connect(self.file_selection_model.prefetch)
         self.file_selection_model.fileChanged.connect(self.change_file)
         self.selection_model.fileAboutToChange.connect(self.check_media_stop)
         self.media_player.set_models(self.file_selection_model)
@@ -929,6 +1023,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self.corpus_model.redoRequested.connect(self.redo_act.trigger)
         self.corpus_model.playRequested.connect(self.ui.playAct.trigger)
         self.corpus_undo_stack.cleanChanged.connect(self.corpus_changed)
+        self.corpus_undo_stack.indexChanged.connect(self.file_utterances_model.invalidate_prefetch)
+        self.dictionary_undo_stack.indexChanged.connect(
+            self.file_utterances_model.invalidate_prefetch
+        )
         self.ui.lockEditAct.toggled.connect(self.undo_act.setDisabled)
         self.ui.lockEditAct.toggled.connect(self.redo_act.setDisabled)
         self.ui.menuWindow.addAction(self.ui.dictionaryDockWidget.toggleViewAction())
@@ -1001,6 +1099,9 @@ class MainWindow(QtWidgets.QMainWindow):
             self.corpus_model.speaker_plda = result
 
     def finish_merging(self, result=None):
+        self.corpus_model.invalidate_result_counts("speaker", "utterance")
+        self.corpus_model.clear_page_cache()
+        self.speaker_model.clear_page_cache()
         if result is not None:
             self.update_status_message(f"Merged {result} speakers.")
             self.corpus_model.runFunction.emit(
@@ -1032,6 +1133,9 @@ class MainWindow(QtWidgets.QMainWindow):
         )
 
     def finish_mismatched_utterances(self, result=None):
+        self.corpus_model.invalidate_result_counts("speaker", "utterance")
+        self.corpus_model.clear_page_cache()
+        self.speaker_model.clear_page_cache()
         if result is not None:
             self.update_status_message(f"Updated {result} utterances.")
         self.execute_runnable(
@@ -1472,6 +1576,12 @@ class MainWindow(QtWidgets.QMainWindow):
                     self.corpus_model.has_transcriptions = True
                 elif w.workflow_type is WorkflowType.per_speaker_transcription:
                     self.corpus_model.has_transcriptions = True
+        if self.settings.value(self.settings.TRANSCODE_AUDIO):
+            self.execute_runnable("Transcoding audio", self.finish_transcoding_audio, [])
+
+    def finish_transcoding_audio(self, num_transcoded: int):
+        if num_transcoded:
+            self.update_status_message(f"Transcoded {num_transcoded} sound files")
 
     def finalize_load_corpus(self, corpus: AcousticCorpus):
         from montreal_forced_aligner.db import Dictionary
@@ -1703,9 +1813,17 @@ class MainWindow(QtWidgets.QMainWindow):
         self.ui.transcribeCorpusAct.setEnabled(enabled)
         self.ui.evaluateAlignmentsAct.setEnabled(enabled)
 
+    def clear_table_page_caches(self):
+        self.corpus_model.clear_page_cache()
+        self.speaker_model.clear_page_cache()
+        self.alignment_analysis_model.clear_page_cache()
+        self.file_utterances_model.invalidate_prefetch()
+
     def finalize_adding_ivectors(self, speaker_space=None):
         self.speaker_model.speaker_space = speaker_space
         self.corpus_model.corpus.inspect_database()
+        self.corpus_model.invalidate_result_counts("speaker", "utterance")
+        self.clear_table_page_caches()
         selection = self.selection_model.selection()
         self.selection_model.clearSelection()
         self.selection_model.select(
@@ -1725,6 +1843,8 @@ class MainWindow(QtWidgets.QMainWindow):
             self.corpus_model.plda = result[0]
             self.corpus_model.speaker_plda = result[1]
         self.corpus_model.corpus.inspect_database()
+        self.corpus_model.invalidate_result_counts("speaker", "utterance")
+        self.clear_table_page_caches()
         selection = self.selection_model.selection()
         self.selection_model.clearSelection()
         self.selection_model.select(
@@ -1740,6 +1860,8 @@ class MainWindow(QtWidgets.QMainWindow):
     def finalize_clustering_utterances(self):
         self.corpus_model.corpus.inspect_database()
         self.corpus_model.corpus._num_speakers = None
+        self.corpus_model.invalidate_result_counts("speaker", "utterance")
+        self.clear_table_page_caches()
         self.corpus_model.refresh_speakers()
 
         selection = self.selection_model.selection()
@@ -1755,6 +1877,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def finalize_adding_intervals(self):
         self.corpus_model.corpus.inspect_database()
+        self.corpus_model.invalidate_result_counts("speaker", "utterance")
+        self.clear_table_page_caches()
         self.corpus_model.corpusLoaded.emit()
         selection = self.selection_model.selection()
         self.selection_model.clearSelection()
@@ -1770,6 +1894,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def finalize_utterance_alignment(self, utterance_id: int):
         self.corpus_model.session.expire_all()
+        self.corpus_model.invalidate_result_counts("speaker", "utterance")
+        self.clear_table_page_caches()
         self.corpus_model.update_data()
         self.check_actions()
         self.set_application_state("loaded")
@@ -2145,6 +2271,23 @@ class MainWindow(QtWidgets.QMainWindow):
         self.dictionary_model.set_limit(self.settings.value(self.settings.RESULTS_PER_PAGE))
         self.speaker_model.set_limit(self.settings.value(self.settings.RESULTS_PER_PAGE))
         self.diarization_model.set_limit(self.settings.value(self.settings.RESULTS_PER_PAGE))
+        for model in [
+            self.corpus_model,
+            self.dictionary_model,
+            self.oov_model,
+            self.speaker_model,
+            self.alignment_analysis_model,
+        ]:
+            model.set_combined_count(self.settings.value(self.settings.COMBINED_RESULT_COUNTS))
+        self.file_selection_model.prefetch_tiles.resize(
+            self.settings.value(self.settings.PREFETCH_CACHE_SIZE) * 1024 * 1024
+        )
+        self.file_selection_model.spectrogram_tiles.resize(
+            self.settings.value(self.settings.SPECTROGRAM_CACHE_SIZE) * 1024 * 1024
+        )
+        self.file_selection_model.feature_cache.resize(
+            self.settings.value(self.settings.FEATURE_CACHE_SIZE) * 1024 * 1024
+        )
         self.ui.utteranceListWidget.refresh_settings()
         self.ui.dictionaryWidget.refresh_settings()
         self.ui.speakerWidget.refresh_settings()
@@ -2737,6 +2880,19 @@ class OptionsDialog(QtWidgets.QDialog):
         )
         self.ui.enableFadeCheckBox.setChecked(self.settings.value(self.settings.ENABLE_FADE))
         self.ui.resultsPerPageEdit.setValue(self.settings.value(self.settings.RESULTS_PER_PAGE))
+        self.ui.transcodeAudioCheckBox.setChecked(
+            self.settings.value(self.settings.TRANSCODE_AUDIO)
+        )
+        self.ui.transcodeCacheSizeEdit.setValue(
+            self.settings.value(self.settings.TRANSCODE_CACHE_SIZE)
+        )
+        self.ui.waveformCacheSizeEdit.setValue(
+            self.settings.value(self.settings.WAVEFORM_CACHE_SIZE)
+        )
+        self.ui.prefetchCountEdit.setValue(self.settings.value(self.settings.PREFETCH_COUNT))
+        self.ui.prefetchCacheSizeEdit.setValue(
+            self.settings.value(self.settings.PREFETCH_CACHE_SIZE)
+        )
         self.ui.timeDirectionComboBox.setCurrentIndex(
             self.ui.timeDirectionComboBox.findText(
                 self.settings.value(self.settings.TIME_DIRECTION)
@@ -2763,6 +2919,16 @@ class OptionsDialog(QtWidgets.QDialog):
         self.ui.frameLengthEdit.setValue(self.settings.value(self.settings.PITCH_FRAME_LENGTH))
         self.ui.penaltyEdit.setText(str(self.settings.value(self.settings.PITCH_PENALTY_FACTOR)))
         self.ui.pitchDeltaEdit.setText(str(self.settings.value(self.settings.PITCH_DELTA_PITCH)))
+        self.ui.pitchPrecomputeCheckBox.setChecked(
+            self.settings.value(self.settings.PITCH_PRECOMPUTE)
+        )
+        self.ui.pitchCacheSizeEdit.setValue(self.settings.value(self.settings.PITCH_CACHE_SIZE))
+        self.ui.spectrogramCacheSizeEdit.setValue(
+            self.settings.value(self.settings.SPECTROGRAM_CACHE_SIZE)
+        )
+        self.ui.featureCacheSizeEdit.setValue(
+            self.settings.value(self.settings.FEATURE_CACHE_SIZE)
+        )
         self.ui.presetThemeEdit.setCurrentIndex(
             self.ui.presetThemeEdit.findText(str(self.settings.value(self.settings.THEME_PRESET)))
         )
@@ -2902,6 +3068,33 @@ class OptionsDialog(QtWidgets.QDialog):
         self.settings.setValue(
             self.settings.PITCH_DELTA_PITCH, float(self.ui.pitchDeltaEdit.text())
         )
+        self.settings.setValue(
+            self.settings.PITCH_PRECOMPUTE, self.ui.pitchPrecomputeCheckBox.isChecked()
+        )
+        self.settings.setValue(
+            self.settings.TRANSCODE_AUDIO, self.ui.transcodeAudioCheckBox.isChecked()
+        )
+        self.settings.setValue(
+            self.settings.TRANSCODE_CACHE_SIZE, int(self.ui.transcodeCacheSizeEdit.value())
+        )
+        self.settings.setValue(
+            self.settings.WAVEFORM_CACHE_SIZE, int(self.ui.waveformCacheSizeEdit.value())
+        )
+        self.settings.setValue(
+            self.settings.PREFETCH_COUNT, int(self.ui.prefetchCountEdit.value())
+        )
+        self.settings.setValue(
+            self.settings.PREFETCH_CACHE_SIZE, int(self.ui.prefetchCacheSizeEdit.value())
+        )
+        self.settings.setValue(
+            self.settings.PITCH_CACHE_SIZE, int(self.ui.pitchCacheSizeEdit.value())
+        )
+        self.settings.setValue(
+            self.settings.SPECTROGRAM_CACHE_SIZE, int(self.ui.spectrogramCacheSizeEdit.value())
+        )
+        self.settings.setValue(
+            self.settings.FEATURE_CACHE_SIZE, int(self.ui.featureCacheSizeEdit.value())
+        )
         preset_theme = self.ui.presetThemeEdit.currentText()
         self.settings.setValue(self.settings.THEME_PRESET, preset_theme)
 
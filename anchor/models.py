@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import collections
 import datetime
+import functools
 import logging
 import os
 import re
@@ -49,6 +51,7 @@ from sqlalchemy.orm import joinedload
 
 import anchor.db
 from anchor import undo, workers
+from anchor.audio import ArrayCache, AudioSource, PeakPyramid, PitchTrack, ViewAudio
 from anchor.settings import AnchorSettings
 
 if typing.TYPE_CHECKING:
@@ -101,10 +104,62 @@ class TextFilterQuery:
         return text
 
 
+class ResultCountCache:
+    """
+    Bounded cache of exact table result counts keyed by normalized query state, shared
+    between table models so that edits can invalidate every count over the tables they touch
+
+    Parameters
+    ----------
+    max_size: int
+        Maximum number of counts to keep
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._counts: collections.OrderedDict[
+            typing.Tuple, typing.Tuple[typing.FrozenSet[str], int]
+        ] = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._counts)
+
+    def get(self, key: typing.Tuple) -> typing.Optional[int]:
+        if key not in self._counts:
+            return None
+        self._counts.move_to_end(key)
+        return self._counts[key][1]
+
+    def set(self, key: typing.Tuple, tables: typing.Collection[str], count: int):
+        self._counts[key] = (frozenset(tables), count)
+        self._counts.move_to_end(key)
+        while len(self._counts) > self.max_size:
+            self._counts.popitem(last=False)
+
+    def invalidate(self, *tables: str):
+        """
+        Drop counts depending on any of the given tables, or all counts if none are given
+        """
+        if not tables:
+            self._counts.clear()
+            return
+        tables = set(tables)
+        for key in [k for k, (t, _) in self._counts.items() if t & tables]:
+            del self._counts[key]
+
+
+result_count_cache = ResultCountCache()
+
+
 class TableModel(QtCore.QAbstractTableModel):
     runFunction = QtCore.Signal(object, object, object)  # Function plus finished processor
     resultCountChanged = QtCore.Signal(int)
     newResults = QtCore.Signal()
+    prefetchCancelled = QtCore.Signal(object)  # Prefetch runner names
+    combined_count_supported = False
+    count_tables: typing.Tuple[str, ...] = ()
+    page_cache_size = 8
+    prefetch_functions: typing.Tuple[str, ...] = ()
 
     def __init__(self, header_data, parent=None):
         super().__init__(parent)
@@ -116,6 +171,19 @@ class TableModel(QtCore.QAbstractTableModel):
         self.current_offset = 0
         self.limit = 1
         self.text_filter = None
+        self.page_keys = None
+        self.page_seek = None
+        self.combined_count = False
+        self.count_key = None
+        self.result_count_exact = False
+        self.page_cache: collections.OrderedDict[typing.Tuple, typing.Tuple] = (
+            collections.OrderedDict()
+        )
+        self.requested_page_key = None
+        self.set_combined_count(AnchorSettings().value(AnchorSettings.COMBINED_RESULT_COUNTS))
+
+    def set_combined_count(self, combined_count: bool):
+        self.combined_count = combined_count and self.combined_count_supported
 
     def set_text_filter(self, text_filter: typing.Optional[TextFilterQuery]):
         if text_filter != self.text_filter:
@@ -128,10 +196,245 @@ class TableModel(QtCore.QAbstractTableModel):
         self.limit = limit
 
     def set_offset(self, offset):
+        self.page_seek = None
+        if self.page_keys is not None and offset > 0:
+            if offset == self.current_offset + self.limit:
+                self.page_seek = (False, self.page_keys[1])
+            elif offset == self.current_offset - self.limit:
+                self.page_seek = (True, self.page_keys[0])
         self.current_offset = offset
         self.update_data()
         self.update_result_count()
 
+    def run_page_query(self, function: str):
+        """
+        Query the current page, serving it from the page cache if possible.  Otherwise seek
+        from the bounds of the previous page when flipping to an adjacent one and fall back
+        to an offset.  In combined count mode the total is fetched along with the page unless
+        it is already cached.
+
+        Parameters
+        ----------
+        function: str
+            Name of the query runner
+        """
+        kwargs = self.query_kwargs
+        page_key = self.page_cache_key(self.current_offset, kwargs)
+        if page_key != self.requested_page_key and self.prefetch_functions:
+            self.prefetchCancelled.emit(self.prefetch_functions)
+        self.requested_page_key = page_key
+        page_seek = self.page_seek
+        self.page_seek = None
+        self.page_keys = None
+        with_count = False
+        if self.combined_count:
+            count_key = self.result_count_key()
+            with_count = result_count_cache.get(count_key) is None
+        if not with_count and page_key in self.page_cache:
+            self.page_cache.move_to_end(page_key)
+            self.finish_update_data((*self.page_cache[page_key], None))
+            return
+        finished_kwargs = {"page_key": page_key}
+        if with_count:
+            self.count_key = count_key
+            kwargs["with_count"] = True
+            finished_kwargs["count_key"] = count_key
+        elif page_seek is not None:
+            kwargs["seek_previous"], kwargs["seek_key"] = page_seek
+        self.runFunction.emit(
+            function, functools.partial(self.finish_update_data, **finished_kwargs), [kwargs]
+        )
+
+    def unpack_page_result(self, result, count_key=None, page_key=None):
+        """
+        Cache a page query result, finalize the total count returned alongside it in combined
+        count mode and start reading ahead to the adjacent pages
+
+        Parameters
+        ----------
+        result: tuple
+            Page query result with the total count as its last element
+        count_key: tuple, optional
+            Result count key of the query
+        page_key: tuple, optional
+            Page cache key of the query
+
+        Returns
+        -------
+        list, optional
+            Remaining page query result, or None if a different page has been requested since
+        """
+        *result, result_count = result
+        if page_key is not None:
+            self.cache_page(page_key, result)
+        if result_count is not None and count_key is not None:
+            self.finish_result_count(count_key, result_count)
+        if page_key is not None and page_key != self.requested_page_key:
+            return None
+        self.prefetch_pages(result[-1])
+        return result
+
+    def normalized_key(
+        self, kwargs: typing.Dict[str, typing.Any], ignored: typing.Collection[str]
+    ) -> typing.Tuple:
+        key = [type(self).__name__]
+        for k, v in sorted(kwargs.items()):
+            if k in ignored:
+                continue
+            if isinstance(v, TextFilterQuery):
+                v = v.generate_expression(posix=True)
+            elif isinstance(v, np.ndarray):
+                v = v.tobytes()
+            elif isinstance(v, list):
+                v = tuple(v)
+            key.append((k, v))
+        return tuple(key)
+
+    def result_count_key(self) -> typing.Tuple:
+        """
+        Get the normalized filter state of the model, which determines its result count
+
+        Returns
+        -------
+        tuple
+            Hashable result count key
+        """
+        return self.normalized_key(
+            self.count_kwargs, ["count", "limit", "current_offset", "sort_index", "sort_desc"]
+        )
+
+    def page_cache_key(
+        self, offset: int, kwargs: typing.Optional[typing.Dict[str, typing.Any]] = None
+    ) -> typing.Tuple:
+        """
+        Get the normalized filter and sort state of the model along with a page offset
+
+        Parameters
+        ----------
+        offset: int
+            Offset of the page
+        kwargs: dict[str, Any], optional
+            Query arguments, defaults to the current ones
+
+        Returns
+        -------
+        tuple
+            Hashable page cache key
+        """
+        if kwargs is None:
+            kwargs = self.query_kwargs
+        return self.normalized_key(kwargs, ["current_offset"]) + (offset,)
+
+    def cache_page(self, page_key: typing.Tuple, result: typing.Sequence):
+        self.page_cache[page_key] = tuple(result)
+        self.page_cache.move_to_end(page_key)
+        while len(self.page_cache) > self.page_cache_size:
+            self.page_cache.popitem(last=False)
+
+    def clear_page_cache(self):
+        self.page_cache.clear()
+
+    def invalidate_cached_rows(self, indices: typing.Collection[int]):
+        """
+        Drop cached pages containing any of the given rows
+
+        Parameters
+        ----------
+        indices: Collection[int]
+            Database ids of the modified rows
+        """
+        indices = set(indices)
+        for key in [k for k, v in self.page_cache.items() if not indices.isdisjoint(v[1])]:
+            del self.page_cache[key]
+
+    def prefetch_pages(
+        self, page_keys: typing.Optional[typing.Tuple[typing.Tuple, typing.Tuple]]
+    ):
+        """
+        Read ahead to the pages after and before the current one in the background, with one
+        runner per direction
+
+        Parameters
+        ----------
+        page_keys: tuple[tuple, tuple], optional
+            Seek keys of the first and last rows of the current page
+        """
+        if not self.prefetch_functions or page_keys is None:
+            return
+        for function, offset, seek_previous, seek_key in zip(
+            self.prefetch_functions,
+            [self.current_offset + self.limit, self.current_offset - self.limit],
+            [False, True],
+            page_keys[::-1],
+        ):
+            if offset < 0 or (self.result_count is not None and offset >= self.result_count):
+                continue
+            kwargs = self.query_kwargs
+            page_key = self.page_cache_key(offset, kwargs)
+            if page_key in self.page_cache:
+                continue
+            kwargs["current_offset"] = offset
+            kwargs["seek_previous"] = seek_previous
+            kwargs["seek_key"] = seek_key
+            self.runFunction.emit(
+                function,
+                functools.partial(self.finish_prefetch, page_key),
+                [kwargs],
+            )
+
+    def finish_prefetch(self, page_key, result):
+        if not result:
+            return
+        self.cache_page(page_key, result[:-1])
+
+    def invalidate_result_counts(self, *tables: str):
+        result_count_cache.invalidate(*tables)
+
+    def start_result_count(self, estimate_function: str) -> bool:
+        """
+        Serve the result count from the cache if possible, otherwise from a planner estimate
+        until the exact count comes in
+
+        Parameters
+        ----------
+        estimate_function: str
+            Name of the estimating runner
+
+        Returns
+        -------
+        bool
+            Flag for whether the exact count still needs to be queried
+        """
+        self.count_key = self.result_count_key()
+        self.result_count_exact = False
+        result_count = result_count_cache.get(self.count_key)
+        if result_count is not None:
+            self.result_count_exact = True
+            self.finalize_result_count(result_count)
+            return False
+        kwargs = self.count_kwargs
+        kwargs["estimate"] = True
+        self.runFunction.emit(
+            estimate_function,
+            functools.partial(self.finish_estimated_count, self.count_key),
+            [kwargs],
+        )
+        return True
+
+    def finish_estimated_count(self, count_key, result_count):
+        if not isinstance(result_count, int) or self.result_count_exact:
+            return
+        if count_key == self.count_key:
+            self.finalize_result_count(result_count)
+
+    def finish_result_count(self, count_key, result_count):
+        if not isinstance(result_count, int):
+            return
+        result_count_cache.set(count_key, self.count_tables, result_count)
+        if count_key == self.count_key:
+            self.result_count_exact = True
+            self.finalize_result_count(result_count)
+
     def update_sort(self, column, order):
         self.sort_index = column
         self.sort_order = order
@@ -181,6 +484,8 @@ class FileUtterancesModel(QtCore.QAbstractListModel):
     selectionRequested = QtCore.Signal(object)
 
     waveformReady = QtCore.Signal()
+    peaksReady = QtCore.Signal()
+    pitchTrackReady = QtCore.Signal()
     utterancesReady = QtCore.Signal()
     speakersChanged = QtCore.Signal()
     phoneTierChanged = QtCore.Signal(object)
@@ -189,12 +494,18 @@ class FileUtterancesModel(QtCore.QAbstractListModel):
         super().__init__(*args, **kwargs)
         self.utterances = []
         self.file = None
-        self.y = None
+        self.audio_source: typing.Optional[AudioSource] = None
+        self.peaks: typing.Optional[PeakPyramid] = None
+        self.pitch_tracks: typing.Dict[int, PitchTrack] = {}
+        self.settings = AnchorSettings()
         self.speakers = []
         self._indices = []
         self._speaker_indices = []
         self.reversed_indices = {}
         self.speaker_channel_mapping = {}
+        self._utterance_index: typing.Optional[
+            typing.Dict[typing.Optional[int], typing.Tuple[np.ndarray, np.ndarray, list]]
+        ] = None
         self.corpus_model: typing.Optional[CorpusModel] = None
         self.closing = False
         self.cached_begin = None
@@ -202,6 +513,11 @@ class FileUtterancesModel(QtCore.QAbstractListModel):
 
         self.thread_pool = QtCore.QThreadPool()
         self.thread_pool.setMaxThreadCount(4)
+        self.prefetch_thread_pool = QtCore.QThreadPool()
+        self.prefetch_thread_pool.setMaxThreadCount(1)
+        self.prefetch_workers: typing.Dict[typing.Tuple, workers.PrefetchWorker] = {}
+        self.prefetched: typing.Dict[typing.Tuple, typing.Tuple] = {}
+        self.file_workers: typing.List[workers.Worker] = []
 
     def get_utterance(self, utterance_id: int) -> Utterance:
         try:
@@ -209,22 +525,177 @@ class FileUtterancesModel(QtCore.QAbstractListModel):
         except KeyError:
             return None
 
+    def invalidate_utterance_index(self):
+        self._utterance_index = None
+
+    def build_utterance_index(self):
+        grouped = {None: self.utterances}
+        for u in self.utterances:
+            if u.speaker_id not in grouped:
+                grouped[u.speaker_id] = []
+            grouped[u.speaker_id].append(u)
+        self._utterance_index = {}
+        for speaker_id, utterances in grouped.items():
+            utterances = sorted(utterances, key=lambda x: x.begin)
+            begins = np.array([u.begin for u in utterances], dtype=float)
+            max_ends = np.array([u.end for u in utterances], dtype=float)
+            if max_ends.shape[0]:
+                # Running maximum keeps the end array sorted even if utterances overlap
+                max_ends = np.maximum.accumulate(max_ends)
+            self._utterance_index[speaker_id] = (begins, max_ends, utterances)
+
+    def utterances_in_range(
+        self, begin: float, end: float, speaker_id: typing.Optional[int] = None
+    ) -> typing.List[Utterance]:
+        """
+        Look up utterances overlapping a time range
+
+        Parameters
+        ----------
+        begin: float
+            Start of the range
+        end: float
+            End of the range
+        speaker_id: int, optional
+            Only return utterances for this speaker
+
+        Returns
+        -------
+        list[:class:`~montreal_forced_aligner.db.Utterance`]
+            Utterances that end after ``begin`` and start before ``end``, in begin order
+        """
+        if self._utterance_index is None:
+            self.build_utterance_index()
+        if speaker_id not in self._utterance_index:
+            return []
+        begins, max_ends, utterances = self._utterance_index[speaker_id]
+        lower = np.searchsorted(max_ends, begin, side="right")
+        upper = np.searchsorted(begins, end, side="left")
+        return [u for u in utterances[lower:upper] if u.end > begin]
+
     def set_corpus_model(self, corpus_model: CorpusModel):
         self.corpus_model = corpus_model
+        self.corpus_model.changeCommandFired.connect(self.invalidate_prefetch)
 
     def clean_up_for_close(self):
         self.closing = True
+        self.cancel_prefetch()
+        self.cancel_file_workers()
+
+    def cancel_file_workers(self):
+        """Stop the whole-file workers of the current file so they release its audio source"""
+        for worker in self.file_workers:
+            worker.cancel()
+        self.file_workers = []
+
+    @property
+    def query_alignment(self) -> bool:
+        return self.corpus_model.has_alignments or self.corpus_model.has_reference_alignments
 
     def set_file(self, file_id, utterance_id=None, begin=None, end=None):
         self.file = (
             self.corpus_model.session.query(File).options(joinedload(File.sound_file)).get(file_id)
         )
-        self.y = None
+        self.cancel_file_workers()
+        if self.audio_source is not None:
+            self.audio_source.close()
+        self.audio_source = None
+        self.peaks = None
+        self.pitch_tracks = {}
+        prefetched = None
+        if utterance_id is None:
+            prefetched = self.prefetched.pop((file_id, begin, end, self.query_alignment), None)
+        if prefetched is not None:
+            utterances, cached_begin, cached_end, audio_source, peaks = prefetched
+            if utterances is None:
+                self.get_utterances(begin=begin, end=end)
+            else:
+                self.get_utterances(
+                    begin=begin, end=end, results=(utterances, file_id, cached_begin, cached_end)
+                )
+            results = (audio_source, peaks, self.file.sound_file.sound_file_path)
+            # Keep the same asynchronous ordering as when the workers are used
+            QtCore.QTimer.singleShot(0, lambda: self.finalize_loading_wave_form(results))
+            return
         self.get_utterances(utterance_id, begin, end)
         waveform_worker = workers.WaveformWorker(self.file.sound_file.sound_file_path)
         waveform_worker.signals.result.connect(self.finalize_loading_wave_form)
         self.thread_pool.start(waveform_worker)
 
+    def prefetch(
+        self,
+        neighbors: typing.List[typing.Tuple],
+        tile_cache: typing.Optional[ArrayCache] = None,
+    ):
+        """
+        Warm the speaker tiers, audio and spectrogram tiles of the utterances around the
+        current one, cancelling any prefetches for utterances that are no longer neighbors
+        """
+        if self.closing or self.corpus_model is None or self.file is None:
+            return
+        query_alignment = self.query_alignment
+        requested = {}
+        for file_id, begin, end, _, _ in neighbors:
+            key = (file_id, begin, end, query_alignment)
+            # Short files are kept for the whole file, so only the tiles are needed
+            load_file = file_id != self.file.id or self.file.duration >= 500
+            requested[key] = load_file
+        for key in list(self.prefetch_workers.keys()):
+            if key not in requested:
+                self.prefetch_workers.pop(key).cancel()
+        for key in list(self.prefetched.keys()):
+            if key not in requested:
+                audio_source = self.prefetched.pop(key)[3]
+                if audio_source is not None:
+                    audio_source.close()
+        for key, load_file in requested.items():
+            if key in self.prefetch_workers or key in self.prefetched:
+                continue
+            file_id, begin, end, query_alignment = key
+            worker = workers.PrefetchWorker(
+                self.corpus_model.session,
+                file_id,
+                begin,
+                end,
+                query_alignment=query_alignment,
+                load_file=load_file,
+                tile_cache=tile_cache,
+            )
+            worker.signals.result.connect(self.finalize_prefetch)
+            self.prefetch_workers[key] = worker
+            self.prefetch_thread_pool.start(worker)
+
+    def cancel_prefetch(self):
+        for worker in self.prefetch_workers.values():
+            worker.cancel()
+        self.prefetch_workers = {}
+        for prefetched in self.prefetched.values():
+            if prefetched[3] is not None:
+                prefetched[3].close()
+        self.prefetched = {}
+
+    def invalidate_prefetch(self, *args):
+        """
+        Drop prefetched utterance rows after an edit so they are queried again, keeping the
+        prefetched audio and peaks
+        """
+        for worker in self.prefetch_workers.values():
+            worker.cancel()
+        self.prefetch_workers = {}
+        for key, prefetched in self.prefetched.items():
+            self.prefetched[key] = (None, *prefetched[1:])
+
+    def finalize_prefetch(self, results):
+        file_id, begin, end, query_alignment, *prefetched = results
+        key = (file_id, begin, end, query_alignment)
+        audio_source = prefetched[3]
+        if self.closing or self.prefetch_workers.pop(key, None) is None:
+            if audio_source is not None:
+                audio_source.close()
+            return
+        if audio_source is not None:
+            self.prefetched[key] = tuple(prefetched)
+
     def finalize_loading_utterances(self, results):
         if self.closing:
             return
@@ -232,6 +703,7 @@ class FileUtterancesModel(QtCore.QAbstractListModel):
         if file_id != self.file.id:
             return
         self.utterances = utterances
+        self.invalidate_utterance_index()
         for i, u in enumerate(utterances):
             if u.speaker_id not in self.speakers:
                 self.speakers.append(u.speaker_id)
@@ -245,13 +717,45 @@ class FileUtterancesModel(QtCore.QAbstractListModel):
     def finalize_loading_wave_form(self, results):
         if self.closing:
             return
-        y, file_path = results
+        audio_source, peaks, file_path = results
         if self.file is None or file_path != self.file.sound_file.sound_file_path:
+            if audio_source is not None:
+                audio_source.close()
             return
-        self.y = y
+        self.audio_source = audio_source
+        self.peaks = peaks
         self.waveformReady.emit()
+        if audio_source is not None and peaks is None:
+            peak_worker = workers.PeakPyramidWorker(audio_source)
+            peak_worker.signals.result.connect(self.finalize_loading_peaks)
+            self.file_workers.append(peak_worker)
+            self.thread_pool.start(peak_worker)
+        if audio_source is not None and self.settings.value(self.settings.PITCH_PRECOMPUTE):
+            for channel in range(audio_source.num_channels):
+                pitch_worker = workers.PitchTrackWorker(audio_source, channel)
+                pitch_worker.signals.result.connect(self.finalize_loading_pitch_track)
+                self.file_workers.append(pitch_worker)
+                self.thread_pool.start(pitch_worker)
+
+    def finalize_loading_peaks(self, results):
+        if self.closing:
+            return
+        peaks, file_path = results
+        if self.file is None or file_path != self.file.sound_file.sound_file_path:
+            return
+        self.peaks = peaks
+        self.peaksReady.emit()
 
-    def get_utterances(self, utterance_id=None, begin=None, end=None):
+    def finalize_loading_pitch_track(self, results):
+        if self.closing:
+            return
+        pitch_track, channel, file_path = results
+        if self.file is None or file_path != self.file.sound_file.sound_file_path:
+            return
+        self.pitch_tracks[channel] = pitch_track
+        self.pitchTrackReady.emit()
+
+    def get_utterances(self, utterance_id=None, begin=None, end=None, results=None):
         parent_index = self.index(0, 0)
         self.beginRemoveRows(parent_index, 0, len(self.utterances))
         self.utterances = []
@@ -260,16 +764,17 @@ class FileUtterancesModel(QtCore.QAbstractListModel):
         self._speaker_indices = []
         self.speaker_channel_mapping = {}
         self.reversed_indices = {}
+        self.invalidate_utterance_index()
         self.endRemoveRows()
         if self.file is None:
             return
+        if results is not None:
+            QtCore.QTimer.singleShot(0, lambda: self.finalize_loading_utterances(results))
+            return
         speaker_tier_worker = workers.SpeakerTierWorker(
             self.corpus_model.session,
             self.file.id,
-            query_alignment=(
-                self.corpus_model.has_alignments
-                or self.corpus_model.has_reference_alignments
-            ),
+            query_alignment=self.query_alignment,
             utterance_id=utterance_id,
             begin=begin,
             end=end,
@@ -326,6 +831,7 @@ class FileUtterancesModel(QtCore.QAbstractListModel):
             self._speaker_indices.insert(i, utterance.speaker_id)
             self.endInsertRows()
         self.reversed_indices = {u: j for j, u in enumerate(self._indices)}
+        self.invalidate_utterance_index()
         self.selectionRequested.emit(utterances)
 
     def delete_table_utterances(self, utterances: typing.List[Utterance]):
@@ -341,6 +847,7 @@ class FileUtterancesModel(QtCore.QAbstractListModel):
             _ = self._speaker_indices.pop(index)
             self.reversed_indices = {u: j for j, u in enumerate(self._indices)}
             self.endRemoveRows()
+        self.invalidate_utterance_index()
         self.selectionRequested.emit(None)
 
     def change_speaker_table_utterances(self, utterances: typing.List[Utterance]):
@@ -354,6 +861,7 @@ class FileUtterancesModel(QtCore.QAbstractListModel):
                 self.speaker_channel_mapping[utterance.speaker_id] = utterance.channel
                 self.speakersChanged.emit()
             self._speaker_indices[index] = utterance.speaker_id
+        self.invalidate_utterance_index()
 
     def merge_table_utterances(
         self, merged_utterance: Utterance, split_utterances: typing.List[Utterance]
@@ -679,7 +1187,37 @@ class FileUtterancesModel(QtCore.QAbstractListModel):
             return self.utterances[index.row()]
 
 
-class FileSelectionModel(QtCore.QItemSelectionModel):
+class UtteranceSelectionModel(QtCore.QItemSelectionModel):
+    """
+    Selection model that tracks the ids of the selected utterances in a set, so that
+    checking whether an utterance is selected does not scan the selected rows
+    """
+
+    id_column = 0
+
+    def update_selected_ids(
+        self, selected: QtCore.QItemSelection, deselected: QtCore.QItemSelection
+    ):
+        indices = self.model()._indices
+        for selection_range in deselected:
+            for row in range(selection_range.top(), selection_range.bottom() + 1):
+                if row < len(indices):
+                    self.selected_ids.discard(indices[row])
+        for selection_range in selected:
+            for row in range(selection_range.top(), selection_range.bottom() + 1):
+                if row < len(indices):
+                    self.selected_ids.add(indices[row])
+
+    def rebuild_selected_ids(self, *args):
+        indices = self.model()._indices
+        self.selected_ids = {
+            indices[index.row()]
+            for index in self.selectedRows(self.id_column)
+            if index.row() < len(indices)
+        }
+
+
+class FileSelectionModel(UtteranceSelectionModel):
     fileAboutToChange = QtCore.Signal()
     fileChanged = QtCore.Signal()
     channelChanged = QtCore.Signal()
@@ -715,14 +1253,31 @@ class FileSelectionModel(QtCore.QItemSelectionModel):
         self.waveform_x = None
         self.waveform_y = None
         self.requested_utterance_id = None
+        self.plot_width = 1000
+        self.spectrogram_tiles = ArrayCache(
+            self.settings.value(self.settings.SPECTROGRAM_CACHE_SIZE) * 1024 * 1024
+        )
+        self.feature_cache = ArrayCache(
+            self.settings.value(self.settings.FEATURE_CACHE_SIZE) * 1024 * 1024
+        )
+        self.prefetch_tiles = ArrayCache(
+            self.settings.value(self.settings.PREFETCH_CACHE_SIZE) * 1024 * 1024
+        )
+        self.view_generation = workers.ViewGeneration()
         self.closing = False
 
         self.thread_pool = QtCore.QThreadPool()
         self.thread_pool.setMaxThreadCount(self.settings.value(self.settings.PLOT_THREAD_COUNT))
         self.model().waveformReady.connect(self.load_audio_selection)
+        self.model().peaksReady.connect(self.load_auto_wave_form)
+        self.model().pitchTrackReady.connect(self.load_pitch_track)
         self.model().utterancesReady.connect(self.finalize_set_new_file)
         self.viewChanged.connect(self.load_audio_selection)
         self.model().selectionRequested.connect(self.update_selected_utterances)
+        self.selected_ids = set()
+        self.selectionChanged.connect(self.update_selected_ids)
+        self.model().rowsRemoved.connect(self.rebuild_selected_ids)
+        self.model().modelReset.connect(self.rebuild_selected_ids)
         self.view_change_timer = QtCore.QTimer()
         self.view_change_timer.setSingleShot(True)
         self.view_change_timer.setInterval(10)
@@ -737,63 +1292,141 @@ class FileSelectionModel(QtCore.QItemSelectionModel):
         return utts
 
     def load_audio_selection(self):
-        if self.model().y is None:
+        # Any worker still queued or running for a previous view will see the new
+        # generation and exit at its next checkpoint
+        self.view_generation.advance()
+        audio_source = self.model().audio_source
+        if audio_source is None:
             return
-        begin_samp = int(self.min_time * self.model().file.sample_rate)
-        end_samp = int(self.max_time * self.model().file.sample_rate)
         if self.model().cached_begin is not None and (
             self.min_time < self.model().cached_begin + 5
             or self.max_time > self.model().cached_end - 5
         ):
             self.model().get_utterances(begin=self.min_time, end=self.max_time)
-        if len(self.model().y.shape) > 1:
-            y = self.model().y[begin_samp:end_samp, self.selected_channel]
-        else:
-            y = self.model().y[begin_samp:end_samp]
-        if self.settings.value(self.settings.SPECTRAL_FEATURES) == "mfcc":
-            spectrogram_worker = workers.MfccWorker(
-                y,
-                self.model().file.sound_file.sample_rate,
-                self.min_time,
-                self.max_time,
-                self.selected_channel,
-            )
-        else:
+        if self.settings.value(self.settings.SPECTRAL_FEATURES) != "mfcc":
             spectrogram_worker = workers.SpectrogramWorker(
-                y,
-                self.model().file.sound_file.sample_rate,
+                audio_source,
                 self.min_time,
                 self.max_time,
                 self.selected_channel,
+                tile_cache=self.spectrogram_tiles,
+                prefetch_cache=self.prefetch_tiles,
             )
-        spectrogram_worker.signals.result.connect(self.finalize_loading_spectrogram)
-        self.thread_pool.start(spectrogram_worker)
+            spectrogram_worker.set_generation(self.view_generation)
+            spectrogram_worker.signals.result.connect(self.finalize_loading_spectrogram)
+            self.thread_pool.start(spectrogram_worker)
 
-        pitch_track_worker = workers.PitchWorker(
-            y,
-            self.model().file.sound_file.sample_rate,
+        self.load_pitch_track()
+
+        # View samples are only read when MFCCs or a live pitch track are computed from them
+        compute_mfccs = self.settings.value(self.settings.SPECTRAL_FEATURES) == "mfcc"
+        compute_pitch = self.selected_channel not in self.model().pitch_tracks
+        if compute_pitch and self.max_time - self.min_time > self.settings.value(
+            self.settings.PITCH_MAX_TIME
+        ):
+            compute_pitch = False
+            self.finalize_loading_pitch_track(None)
+        if compute_mfccs or compute_pitch:
+            view_audio_worker = workers.ViewAudioWorker(
+                audio_source, self.min_time, self.max_time, self.selected_channel
+            )
+            view_audio_worker.set_generation(self.view_generation)
+            view_audio_worker.signals.result.connect(self.finalize_loading_view_audio)
+            self.thread_pool.start(view_audio_worker)
+        self.load_auto_wave_form()
+
+    def load_auto_wave_form(self):
+        audio_source = self.model().audio_source
+        if audio_source is None:
+            return
+        auto_waveform_worker = workers.AutoWaveformWorker(
+            audio_source,
+            self.separator_point,
+            self.top_point,
             self.min_time,
             self.max_time,
             self.selected_channel,
+            peaks=self.model().peaks,
+            num_points=2 * self.plot_width,
+        )
+        auto_waveform_worker.set_generation(self.view_generation)
+        auto_waveform_worker.signals.result.connect(self.finalize_loading_auto_wave_form)
+        self.thread_pool.start(auto_waveform_worker)
+
+    def finalize_loading_view_audio(self, view_audio: ViewAudio):
+        if self.closing:
+            return
+        if view_audio.begin != self.min_time or view_audio.end != self.max_time:
+            return
+        # The feature workers share the read-only samples rather than each taking a copy
+        if self.settings.value(self.settings.SPECTRAL_FEATURES) == "mfcc":
+            feature_segments = [
+                (u.begin, u.end, u.features)
+                for u in self.model().utterances_in_range(view_audio.begin, view_audio.end)
+                if u.features and u.channel == view_audio.channel
+            ]
+            mfcc_worker = workers.MfccWorker(
+                view_audio.samples,
+                view_audio.sample_rate,
+                view_audio.begin,
+                view_audio.end,
+                view_audio.channel,
+                feature_segments=feature_segments,
+                feature_options=self.model().corpus_model.corpus.feature_options,
+                feature_cache=self.feature_cache,
+            )
+            mfcc_worker.set_generation(self.view_generation)
+            mfcc_worker.signals.result.connect(self.finalize_loading_spectrogram)
+            self.thread_pool.start(mfcc_worker)
+
+        if self.selected_channel in self.model().pitch_tracks:
+            return
+        if view_audio.end - view_audio.begin > self.settings.value(self.settings.PITCH_MAX_TIME):
+            return
+        pitch_track_worker = workers.PitchWorker(
+            view_audio.samples,
+            view_audio.sample_rate,
+            view_audio.begin,
+            view_audio.end,
+            view_audio.channel,
             self.bottom_point,
             self.separator_point,
         )
+        pitch_track_worker.set_generation(self.view_generation)
         pitch_track_worker.signals.result.connect(self.finalize_loading_pitch_track)
         self.thread_pool.start(pitch_track_worker)
 
-        auto_waveform_worker = workers.AutoWaveformWorker(
-            y,
-            self.separator_point,
-            self.top_point,
+    def load_pitch_track(self):
+        pitch_track = self.model().pitch_tracks.get(self.selected_channel, None)
+        audio_source = self.model().audio_source
+        if pitch_track is None or audio_source is None:
+            return
+        pitch_track_worker = workers.PitchWorker(
+            None,
+            audio_source.sample_rate,
             self.min_time,
             self.max_time,
             self.selected_channel,
+            self.bottom_point,
+            self.separator_point,
+            pitch_track=pitch_track,
         )
-        auto_waveform_worker.signals.result.connect(self.finalize_loading_auto_wave_form)
-        self.thread_pool.start(auto_waveform_worker)
+        pitch_track_worker.set_generation(self.view_generation)
+        pitch_track_worker.signals.result.connect(self.finalize_loading_pitch_track)
+        self.thread_pool.start(pitch_track_worker)
 
     def clean_up_for_close(self):
         self.closing = True
+        self.view_generation.advance()
+
+    def set_plot_width(self, width: int):
+        self.plot_width = max(int(width), 1)
+
+    def prefetch(self, neighbors):
+        tile_cache = None
+        if self.settings.value(self.settings.SPECTRAL_FEATURES) != "mfcc":
+            tile_cache = self.prefetch_tiles
+        self.model().prefetch(neighbors, tile_cache)
 
     @property
     def plot_min(self):
@@ -856,6 +1489,12 @@ class FileSelectionModel(QtCore.QItemSelectionModel):
         y, begin, end, channel = results
         if begin != self.min_time or end != self.max_time:
             return
+        if y is None:
+            # Nothing is drawn until the peaks for a long view are ready
+            self.waveform_x = None
+            self.waveform_y = None
+            self.waveformReady.emit()
+            return
         if self.settings.right_to_left:
             y = np.flip(y, 0)
         x = np.linspace(start=self.plot_min, stop=self.plot_max, num=y.shape[0])
@@ -970,20 +1609,16 @@ class FileSelectionModel(QtCore.QItemSelectionModel):
         cur_window = self.max_time - self.min_time
         self.set_view_times(value, value + cur_window)
 
-    def visible_utterances(self) -> typing.List[Utterance]:
-        file_utts = []
+    def visible_utterances(
+        self, speaker_id: typing.Optional[int] = None
+    ) -> typing.List[Utterance]:
         if not self.model().file:
-            return file_utts
+            return []
         if self.model().rowCount() > 1:
-            for u in self.model().utterances:
-                if u.begin >= self.max_time:
-                    break
-                if u.end <= self.min_time:
-                    continue
-                file_utts.append(u)
-        else:
-            file_utts.extend(self.model().utterances)
-        return file_utts
+            return self.model().utterances_in_range(self.min_time, self.max_time, speaker_id)
+        return [
+            u for u in self.model().utterances if speaker_id is None or u.speaker_id == speaker_id
+        ]
 
     def model(self) -> FileUtterancesModel:
         return super().model()
@@ -1062,11 +1697,7 @@ class FileSelectionModel(QtCore.QItemSelectionModel):
         self.fileChanged.emit()
 
     def checkSelected(self, utterance_id: int):
-        m = self.model()
-        for index in self.selectedRows(0):
-            if utterance_id == m._indices[index.row()]:
-                return True
-        return False
+        return utterance_id in self.selected_ids
 
     def update_selected_utterances(self, utterances):
         super().clearSelection()
@@ -1089,7 +1720,7 @@ class FileSelectionModel(QtCore.QItemSelectionModel):
         self.currentUtteranceChanged.emit(current_index)
 
     def update_select(self, utterance_id: int, deselect=False, reset=False):
-        if reset and [x.id for x in self.selected_utterances()] == [utterance_id]:
+        if reset and self.selected_ids == {utterance_id}:
             return
         flags = QtCore.QItemSelectionModel.SelectionFlag.Rows
         if reset:
@@ -1111,7 +1742,8 @@ class FileSelectionModel(QtCore.QItemSelectionModel):
         self.currentUtteranceChanged.emit(utterance_id)
 
 
-class CorpusSelectionModel(QtCore.QItemSelectionModel):
+class CorpusSelectionModel(UtteranceSelectionModel):
+    id_column = 1
     fileChanged = QtCore.Signal()
     channelChanged = QtCore.Signal()
     resetView = QtCore.Signal()
@@ -1120,6 +1752,7 @@ class CorpusSelectionModel(QtCore.QItemSelectionModel):
     selectionAudioChanged = QtCore.Signal()
     currentTimeChanged = QtCore.Signal(object)
     currentUtteranceChanged = QtCore.Signal()
+    prefetchRequested = QtCore.Signal(object)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -1140,6 +1773,11 @@ class CorpusSelectionModel(QtCore.QItemSelectionModel):
         # self.model().newResults.connect(self.check_selection)
         self.model().unlockCorpus.connect(self.fileChanged.emit)
         self.model().layoutChanged.connect(self._update_selection)
+        self.selected_ids = set()
+        self.selectionChanged.connect(self.update_selected_ids)
+        self.model().layoutChanged.connect(self.rebuild_selected_ids)
+        self.model().modelReset.connect(self.rebuild_selected_ids)
+        self.model().rowsRemoved.connect(self.rebuild_selected_ids)
 
     def set_current_utterance(self, utterance_id):
         self.current_utterance_id = utterance_id
@@ -1199,7 +1837,11 @@ class CorpusSelectionModel(QtCore.QItemSelectionModel):
             self.select(index, flags)
 
     def update_select(self, utterance_id: int, deselect=False, reset=False, focus=False):
-        if reset and self.selected_utterances() == [utterance_id]:
+        if (
+            reset
+            and self.current_utterance_id == utterance_id
+            and not self.selected_ids - {utterance_id}
+        ):
             return
         flags = QtCore.QItemSelectionModel.SelectionFlag.Rows
         if reset:
@@ -1276,6 +1918,18 @@ class CorpusSelectionModel(QtCore.QItemSelectionModel):
         self.current_utterance_id = utt
         self.currentUtteranceChanged.emit()
         self.fileViewRequested.emit(*self.model().audio_info_for_utterance(row))
+        self.request_prefetch(row)
+
+    def request_prefetch(self, row: int):
+        count = self.settings.value(self.settings.PREFETCH_COUNT)
+        if count <= 0:
+            return
+        neighbors = []
+        for offset in range(1, count + 1):
+            for neighbor_row in (row + offset, row - offset):
+                if 0 <= neighbor_row < self.model().rowCount():
+                    neighbors.append(self.model().audio_info_for_utterance(neighbor_row))
+        self.prefetchRequested.emit(neighbors)
 
     def model(self) -> CorpusModel:
         return super().model()
@@ -1296,6 +1950,9 @@ class CorpusSelectionModel(QtCore.QItemSelectionModel):
 
 
 class OovModel(TableModel):
+    combined_count_supported = True
+    count_tables = ("word",)
+
     def __init__(self, parent=None):
         super().__init__(["OOV word", "Count"], parent=parent)
         self.settings = AnchorSettings()
@@ -1310,18 +1967,28 @@ class OovModel(TableModel):
 
     def set_corpus_model(self, corpus_model: CorpusModel):
         self.corpus_model = corpus_model
+        self.corpus_model.corpusLoading.connect(self.clear_page_cache)
         self.corpus_model.corpusLoading.connect(self.refresh)
+        self.corpus_model.dictionaryChanged.connect(self.clear_page_cache)
         self.corpus_model.dictionaryChanged.connect(self.refresh)
 
     def refresh(self):
+        self.invalidate_result_counts("word")
         self.update_result_count()
         self.update_data()
 
     def finish_update_data(self, result, *args, **kwargs):
+        if result is None:
+            return
+        result = self.unpack_page_result(result, **kwargs)
         if result is None:
             return
         self.layoutAboutToBeChanged.emit()
-        self._data, self.indices = result
+        (
+            self._data,
+            self.indices,
+            self.page_keys,
+        ) = result
         self.layoutChanged.emit()
         self.newResults.emit()
 
@@ -1344,18 +2011,24 @@ class OovModel(TableModel):
         return kwargs
 
     def update_result_count(self):
+        if not self.start_result_count("Estimating OOV results") or self.combined_count:
+            return
         self.runFunction.emit(
-            "Counting OOV results", self.finalize_result_count, [self.count_kwargs]
+            "Counting OOV results",
+            functools.partial(self.finish_result_count, self.count_key),
+            [self.count_kwargs],
         )
 
     def update_data(self):
-        self.runFunction.emit("Querying OOVs", self.finish_update_data, [self.query_kwargs])
+        self.run_page_query("Querying OOVs")
 
 
 class DictionaryTableModel(TableModel):
     dictionariesRefreshed = QtCore.Signal(object)
     wordCountsRefreshed = QtCore.Signal()
     requestLookup = QtCore.Signal(object)
+    combined_count_supported = True
+    count_tables = ("word",)
 
     def __init__(self, parent=None):
         super().__init__(["Word", "Word type", "Count", "Pronunciation"], parent=parent)
@@ -1415,6 +2088,7 @@ class DictionaryTableModel(TableModel):
 
     def set_corpus_model(self, corpus_model: CorpusModel) -> None:
         self.corpus_model = corpus_model
+        self.corpus_model.corpusLoading.connect(self.clear_page_cache)
         self.corpus_model.corpusLoading.connect(self.setup)
 
     def setup(self) -> None:
@@ -1531,6 +2205,8 @@ class DictionaryTableModel(TableModel):
 
     def finish_refresh_word_counts(self):
         self.corpus_model.session.expire_all()
+        self.invalidate_result_counts("word")
+        self.clear_page_cache()
         self.update_result_count()
         self.update_data()
         self.wordCountsRefreshed.emit()
@@ -1544,10 +2220,18 @@ class DictionaryTableModel(TableModel):
         self.update_data()
 
     def finish_update_data(self, result, *args, **kwargs):
+        if result is None:
+            return
+        result = self.unpack_page_result(result, **kwargs)
         if result is None:
             return
         self.layoutAboutToBeChanged.emit()
-        self._data, self.word_indices, self.pron_indices = result
+        (
+            self._data,
+            self.word_indices,
+            self.pron_indices,
+            self.page_keys,
+        ) = result
         self.layoutChanged.emit()
         self.newResults.emit()
 
@@ -1579,8 +2263,12 @@ class DictionaryTableModel(TableModel):
         self.runFunction.emit("Loading dictionaries", self.finish_update_dictionaries, [])
 
     def update_result_count(self):
+        if not self.start_result_count("Estimating dictionary results") or self.combined_count:
+            return
         self.runFunction.emit(
-            "Counting dictionary results", self.finalize_result_count, [self.count_kwargs]
+            "Counting dictionary results",
+            functools.partial(self.finish_result_count, self.count_key),
+            [self.count_kwargs],
         )
 
     def update_word_counts(self):
@@ -1598,7 +2286,7 @@ class DictionaryTableModel(TableModel):
         )
 
     def update_data(self):
-        self.runFunction.emit("Querying dictionary", self.finish_update_data, [self.query_kwargs])
+        self.run_page_query("Querying dictionary")
 
 
 class SpeakerModel(TableModel):
@@ -1606,6 +2294,8 @@ class SpeakerModel(TableModel):
     mdsFinished = QtCore.Signal()
     speakersChanged = QtCore.Signal(object)
     mdsAboutToChange = QtCore.Signal()
+    combined_count_supported = True
+    count_tables = ("speaker", "utterance")
 
     NAME_COLUMN = 0
     UTTERANCE_COUNT_COLUMN = 1
@@ -1661,6 +2351,7 @@ class SpeakerModel(TableModel):
 
     def finish_breaking_up_speaker(self, utterance_ids):
         self.utterance_ids = utterance_ids
+        self.invalidate_result_counts("speaker", "utterance")
         self.corpus_model.runFunction.emit(
             "Recalculating speaker ivectors",
             self.finish_recalculate,
@@ -1732,6 +2423,8 @@ class SpeakerModel(TableModel):
 
     def set_corpus_model(self, corpus_model: CorpusModel):
         self.corpus_model = corpus_model
+        self.corpus_model.corpusLoading.connect(self.clear_page_cache)
+        self.corpus_model.changeCommandFired.connect(self.clear_page_cache)
         self.corpus_model.corpusLoading.connect(self.update_data)
 
     @property
@@ -1748,10 +2441,17 @@ class SpeakerModel(TableModel):
         return kwargs
 
     def finish_update_data(self, result, *args, **kwargs):
+        if result is None:
+            return
+        result = self.unpack_page_result(result, **kwargs)
         if result is None:
             return
         self.layoutAboutToBeChanged.emit()
-        self._data, self._indices = result
+        (
+            self._data,
+            self._indices,
+            self.page_keys,
+        ) = result
         self.layoutChanged.emit()
         self.newResults.emit()
 
@@ -1776,7 +2476,7 @@ class SpeakerModel(TableModel):
         self.mdsFinished.emit()
 
     def update_data(self):
-        self.runFunction.emit("Querying speakers", self.finish_update_data, [self.query_kwargs])
+        self.run_page_query("Querying speakers")
 
     @property
     def count_kwargs(self) -> typing.Dict[str, typing.Any]:
@@ -1785,8 +2485,12 @@ class SpeakerModel(TableModel):
         return kwargs
 
     def update_result_count(self):
+        if not self.start_result_count("Estimating speaker results") or self.combined_count:
+            return
         self.runFunction.emit(
-            "Counting speaker results", self.finalize_result_count, [self.count_kwargs]
+            "Counting speaker results",
+            functools.partial(self.finish_result_count, self.count_key),
+            [self.count_kwargs],
         )
 
     def change_current_speaker(self, speaker_id: typing.Union[int, typing.List[int]], reset=False):
@@ -1890,6 +2594,9 @@ class SpeakerModel(TableModel):
 
 
 class AlignmentAnalysisModel(TableModel):
+    combined_count_supported = True
+    count_tables = ("utterance",)
+
     def __init__(self, parent=None):
         columns = [
             "Utterance",
@@ -1991,6 +2698,8 @@ class AlignmentAnalysisModel(TableModel):
 
     def set_corpus_model(self, corpus_model: CorpusModel):
         self.corpus_model = corpus_model
+        self.corpus_model.corpusLoading.connect(self.clear_page_cache)
+        self.corpus_model.changeCommandFired.connect(self.clear_page_cache)
         self.corpus_model.corpusLoading.connect(self.update_data)
 
     def update_sort(self, column, order):
@@ -1999,6 +2708,10 @@ class AlignmentAnalysisModel(TableModel):
         self.update_data()
 
     def finish_update_data(self, result, *args, **kwargs):
+        if result is not None:
+            result = self.unpack_page_result(result, **kwargs)
+            if result is None:
+                return
         self.layoutAboutToBeChanged.emit()
         if result is None:
             self._data = []
@@ -2015,6 +2728,7 @@ class AlignmentAnalysisModel(TableModel):
                 self.file_ids,
                 self.speaker_ids,
                 self.reversed_indices,
+                self.page_keys,
             ) = result
         self.layoutChanged.emit()
         self.newResults.emit()
@@ -2046,16 +2760,21 @@ class AlignmentAnalysisModel(TableModel):
         return kwargs
 
     def update_result_count(self):
+        if (
+            not self.start_result_count("Estimating alignment analysis results")
+            or self.combined_count
+        ):
+            return
         self.runFunction.emit(
             "Counting alignment analysis results",
-            self.finalize_result_count,
+            functools.partial(self.finish_result_count, self.count_key),
             [self.count_kwargs],
         )
 
     def update_data(self):
         if not self.corpus_model.has_alignments:
             return
-        self.runFunction.emit("Analyzing alignments", self.finish_update_data, [self.query_kwargs])
+        self.run_page_query("Analyzing alignments")
 
 
 class DiarizationModel(TableModel):
@@ -2340,6 +3059,9 @@ class CorpusModel(TableModel):
     utteranceTextUpdated = QtCore.Signal(object, object)
     refreshUtteranceText = QtCore.Signal(object, object)
     refreshTiers = QtCore.Signal()
+    combined_count_supported = True
+    count_tables = ("utterance", "speaker")
+    prefetch_functions = ("Prefetching next utterances", "Prefetching previous utterances")
 
     def __init__(self, parent=None):
         header = [
@@ -2502,11 +3224,13 @@ class CorpusModel(TableModel):
     def update_utterance_table_row(self, utterance: typing.Union[int, Utterance]):
         if isinstance(utterance, int):
             utterance_id = utterance
+            self.invalidate_cached_rows([utterance_id])
             if utterance_id not in self.reversed_indices:
                 return
             utterance = self.session.query(Utterance).get(utterance_id)
         else:
             utterance_id = utterance.id
+            self.invalidate_cached_rows([utterance_id])
             if utterance_id not in self.reversed_indices:
                 return
         index = self.reversed_indices[utterance_id]
@@ -2518,6 +3242,7 @@ class CorpusModel(TableModel):
         self.layoutChanged.emit()
 
     def change_speaker_table_utterances(self, utterances: typing.List[Utterance]):
+        self.invalidate_cached_rows([u.id for u in utterances])
         self.layoutAboutToBeChanged.emit()
         for u in utterances:
             if u.id not in self.reversed_indices:
@@ -2528,6 +3253,7 @@ class CorpusModel(TableModel):
         self.layoutChanged.emit()
 
     def add_table_utterances(self, utterances: typing.List[Utterance]):
+        self.clear_page_cache()
         self.layoutAboutToBeChanged.emit()
         rows = []
         for utterance in utterances:
@@ -2551,6 +3277,7 @@ class CorpusModel(TableModel):
         self.selectionRequested.emit(rows)
 
     def delete_table_utterances(self, utterances: typing.List[Utterance]):
+        self.clear_page_cache()
         self.layoutAboutToBeChanged.emit()
         for utterance in utterances:
             try:
@@ -2570,6 +3297,7 @@ class CorpusModel(TableModel):
     def split_table_utterances(
         self, merged_utterance: Utterance, split_utterances: typing.List[Utterance]
     ):
+        self.clear_page_cache()
         try:
             index = self.reversed_indices.pop(merged_utterance.id)
         except KeyError:
@@ -2621,6 +3349,7 @@ class CorpusModel(TableModel):
     def merge_table_utterances(
         self, merged_utterance: Utterance, split_utterances: typing.List[Utterance]
     ):
+        self.clear_page_cache()
         try:
             split_utterances = sorted(split_utterances, key=lambda x: self.reversed_indices[x.id])
         except KeyError:
@@ -2750,6 +3479,8 @@ class CorpusModel(TableModel):
         self.corpus = corpus
         if corpus is not None:
             self.session = self.corpus.session
+            self.invalidate_result_counts()
+            self.clear_page_cache()
             self.corpusLoading.emit()
             self.refresh_files()
             self.refresh_speakers()
@@ -2793,6 +3524,7 @@ class CorpusModel(TableModel):
             self.corpusLoaded.emit()
 
     def refresh_utterances(self):
+        self.clear_page_cache()
         self.update_data()
         self.update_result_count()
 
@@ -2853,6 +3585,7 @@ class CorpusModel(TableModel):
                 return QtCore.Qt.CheckState.Unchecked
 
     def update_texts(self, texts: typing.Dict[int, str]):
+        self.invalidate_cached_rows(texts.keys())
         for utt_id, row_ind in self.reversed_indices.items():
             if utt_id in texts:
                 self._data[row_ind][self.text_column] = texts[utt_id]
@@ -2876,6 +3609,9 @@ class CorpusModel(TableModel):
     def finish_update_data(self, result, *args, **kwargs):
         if not result:
             return
+        result = self.unpack_page_result(result, **kwargs)
+        if result is None:
+            return
         self.layoutAboutToBeChanged.emit()
         (
             self._data,
@@ -2883,6 +3619,7 @@ class CorpusModel(TableModel):
             self._file_indices,
             self._speaker_indices,
             self.reversed_indices,
+            self.page_keys,
         ) = result
         self.layoutChanged.emit()
         self.newResults.emit()
@@ -2919,11 +3656,15 @@ class CorpusModel(TableModel):
         self.resultCountChanged.emit(self.result_count)
 
     def update_data(self):
-        self.runFunction.emit("Querying utterances", self.finish_update_data, [self.query_kwargs])
+        self.run_page_query("Querying utterances")
 
     def update_result_count(self):
+        if not self.start_result_count("Estimating utterance results") or self.combined_count:
+            return
         self.runFunction.emit(
-            "Counting utterance results", self.finalize_result_count, [self.count_kwargs]
+            "Counting utterance results",
+            functools.partial(self.finish_result_count, self.count_key),
+            [self.count_kwargs],
         )
 
 
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import collections
 import functools
 import logging
 import os.path
 import re
+import time
 import typing
 from typing import Optional
 
 import numpy as np
 import pyqtgraph as pg
+import scipy.spatial
 import sqlalchemy
 from kalpy.gmm.data import CtmInterval
 from _kalpy.util import align_intervals
@@ -47,6 +50,55 @@ pg.setConfigOptions(antialias=True)
 logger = logging.getLogger("anchor")
 
 
+class GlyphPathCache:
+    """
+    Process-wide LRU cache of centered label paths keyed by font and label
+
+    Parameters
+    ----------
+    max_size: int
+        Maximum number of paths to keep
+    """
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self._cache: collections.OrderedDict[
+            typing.Tuple[str, str], QtGui.QPainterPath
+        ] = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self):
+        self._cache.clear()
+
+    def get(self, font: QtGui.QFont, label: str) -> QtGui.QPainterPath:
+        key = (font.key(), label)
+        path = self._cache.get(key, None)
+        if path is not None:
+            self._cache.move_to_end(key)
+            return path
+        symbol = QtGui.QPainterPath()
+
+        symbol.addText(0, 0, font, label)
+        br = symbol.boundingRect()
+
+        # getting transform object
+        tr = QtGui.QTransform()
+
+        # translating
+        fm = QtGui.QFontMetrics(font)
+        tr.translate(-br.x() - br.width() / 2.0, fm.height() / 2.0)
+        path = tr.map(symbol)
+        self._cache[key] = path
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return path
+
+
+glyph_path_cache = GlyphPathCache()
+
+
 class ClusterLegendItem(pg.ItemSample):
     def mouseClickEvent(self, event):
         event.ignore()
@@ -81,6 +133,7 @@ class ClusterLegend(pg.LegendItem):
 
 class ScatterPlot(pg.ScatterPlotItem):
     selectPoints = QtCore.Signal(object, object)
+    pointClicked = QtCore.Signal(object, object)
 
     def __init__(self, *args, **kwargs):
         super(ScatterPlot, self).__init__(*args, **kwargs)
@@ -88,6 +141,57 @@ class ScatterPlot(pg.ScatterPlotItem):
         self.selection_area.hide()
         self.selection_area.setParentItem(self)
         self.distances = None
+        self.point_tree: typing.Optional[scipy.spatial.cKDTree] = None
+
+    def build_point_tree(self):
+        if len(self.data) == 0:
+            self.point_tree = None
+            return
+        self.point_tree = scipy.spatial.cKDTree(np.column_stack([self.data["x"], self.data["y"]]))
+
+    def points_in_rect(self, left, right, bottom, top) -> np.ndarray:
+        if self.point_tree is None:
+            return np.zeros(0, dtype=int)
+        center = [(left + right) / 2, (bottom + top) / 2]
+        radius = max(right - left, top - bottom) / 2
+        candidates = np.array(
+            self.point_tree.query_ball_point(center, r=radius, p=np.inf), dtype=int
+        )
+        if not candidates.shape[0]:
+            return candidates
+        points = self.point_tree.data[candidates]
+        mask = (
+            (points[:, 0] >= left)
+            & (points[:, 0] <= right)
+            & (points[:, 1] >= bottom)
+            & (points[:, 1] <= top)
+        )
+        return np.sort(candidates[mask])
+
+    def point_at(self, pos) -> typing.Optional[int]:
+        if self.point_tree is None:
+            return None
+        vb = self.getViewBox()
+        if vb is None:
+            return None
+        px = vb.viewPixelSize()
+        half_size = self.opts["size"] / 2 + 1
+        candidates = np.array(
+            self.point_tree.query_ball_point(
+                [pos.x(), pos.y()], r=half_size * max(px), p=np.inf
+            ),
+            dtype=int,
+        )
+        if not candidates.shape[0]:
+            return None
+        points = self.point_tree.data[candidates]
+        pixel_distances = ((points[:, 0] - pos.x()) / px[0]) ** 2 + (
+            (points[:, 1] - pos.y()) / px[1]
+        ) ** 2
+        closest = np.argmin(pixel_distances)
+        if pixel_distances[closest] > half_size**2:
+            return None
+        return int(candidates[closest])
 
     def mouseDragEvent(self, ev):
         if ev.modifiers() in [
@@ -109,35 +213,29 @@ class ScatterPlot(pg.ScatterPlotItem):
             width = pos.x() - start_pos.x()
             height = pos.y() - start_pos.y()
             self.selection_area.setSize((width, height))
-            x_series, y_series = self.getData()
-            selected_indices = []
             right = max(pos.x(), start_pos.x())
             left = min(pos.x(), start_pos.x())
             bottom = min(pos.y(), start_pos.y())
             top = max(pos.y(), start_pos.y())
-            for i, x in enumerate(x_series):
-                y = y_series[i]
-                if left <= x <= right and bottom <= y <= top:
-                    selected_indices.append(i)
-            self.selectPoints.emit(selected_indices, True)
+            selected_indices = self.points_in_rect(left, right, bottom, top)
+            self.selectPoints.emit(selected_indices.tolist(), True)
 
     def mouseClickEvent(self, ev):
         if (
             ev.button() == QtCore.Qt.MouseButton.LeftButton
             or ev.button() == QtCore.Qt.MouseButton.RightButton
         ):
-            pts = self.pointsAt(ev.pos())
-            if len(pts) > 0:
-                self.ptsClicked = pts
+            index = self.point_at(ev.pos())
+            if index is not None:
                 ev.accept()
                 if ev.modifiers() in [
                     QtCore.Qt.KeyboardModifier.ControlModifier,
                     QtCore.Qt.KeyboardModifier.ShiftModifier,
                 ]:
-                    self.selectPoints.emit({self.ptsClicked[0]._index}, False)
+                    self.selectPoints.emit({index}, False)
                 else:
-                    self.selectPoints.emit({self.ptsClicked[0]._index}, True)
-                self.sigClicked.emit(self, self.ptsClicked, ev)
+                    self.selectPoints.emit({index}, True)
+                self.pointClicked.emit(index, ev)
             else:
                 ev.ignore()
         else:
@@ -147,26 +245,24 @@ class ScatterPlot(pg.ScatterPlotItem):
         if self.opts["hoverable"]:
             old = self.data["hovered"]
 
-            if ev.exit:
-                new = np.zeros_like(self.data["hovered"])
-            else:
-                new = self._maskAt(ev.pos())
+            new = np.zeros_like(self.data["hovered"])
+            if not ev.exit:
+                index = self.point_at(ev.pos())
+                if index is not None:
+                    new[index] = True
 
-            if self._hasHoverStyle():
+            if self._hasHoverStyle() and np.any(old ^ new):
                 self.data["sourceRect"][old ^ new] = 0
                 self.data["hovered"] = new
                 self.updateSpots()
 
-            points = self.points()[new][-1:]
-            # Show information about hovered points in a tool tip
-
-            self.sigHovered.emit(self, points, ev)
-
 
 class UtteranceClusterView(pg.PlotWidget):
     utteranceRequested = QtCore.Signal(object)
     plotAvailable = QtCore.Signal(object)
     selectionUpdated = QtCore.Signal()
+    density_threshold = 20000
+    distance_levels = 64
 
     def __init__(self, *args):
         super().__init__(*args)
@@ -181,6 +277,10 @@ class UtteranceClusterView(pg.PlotWidget):
         self.scatter_item = ScatterPlot()
         self.scatter_item.selectPoints.connect(self.update_selection)
         self.addItem(self.scatter_item)
+        self.density_item = pg.ImageItem()
+        self.density_item.setZValue(-1)
+        self.density_item.hide()
+        self.addItem(self.density_item)
         self.hideButtons()
         self.getPlotItem().setDefaultPadding(0)
         self.getPlotItem().hideAxis("left")
@@ -189,7 +289,7 @@ class UtteranceClusterView(pg.PlotWidget):
         # self.getPlotItem().setMouseEnabled(False, False)
 
         self.getPlotItem().setMenuEnabled(False)
-        self.scatter_item.sigClicked.connect(self.update_point)
+        self.scatter_item.pointClicked.connect(self.update_point)
         self.legend_item = ClusterLegend(
             offset=(10, 10),
             sampleType=ClusterLegendItem,
@@ -198,7 +298,14 @@ class UtteranceClusterView(pg.PlotWidget):
             labelTextColor=self.settings.value(self.settings.MAIN_TEXT_COLOR),
         )
         self.pen_colormap = pg.ColorMap(None, [0.0, 1.0])
-        self.pens = []
+        self.pen_lookup = np.empty(self.distance_levels, dtype=object)
+        self.pen_lookup[:] = [
+            pg.mkPen(x, width=2) for x in np.linspace(0.0, 1.0, self.distance_levels)
+        ]
+        self.density_colormap = pg.ColorMap(
+            None, [plot_theme.background_color, plot_theme.break_line_color]
+        )
+        self.pens = np.empty(0, dtype=object)
         self.legend_item.changeCluster.connect(self.change_cluster)
         self.legend_item.setParentItem(self.getPlotItem())
         self.legend_item.setFont(self.settings.font)
@@ -233,13 +340,46 @@ class UtteranceClusterView(pg.PlotWidget):
         )
 
         self.speaker_model.cluster_labels[np.array(list(self.selected_indices))] = cluster_id
-        brushes = [
-            self.brushes[x if x in self.speaker_model.current_speakers else -1]
-            for x in self.speaker_model.cluster_labels
-        ]
-        self.scatter_item.setBrush(brushes)
+        self.scatter_item.setBrush(self.cluster_brushes())
         self.update_highlight()
 
+    def cluster_brushes(self) -> np.ndarray:
+        """Map cluster labels to brushes, labels without a brush use the noise brush"""
+        keys = np.array(list(self.brushes.keys()))
+        lookup = np.empty(keys.shape[0], dtype=object)
+        lookup[:] = list(self.brushes.values())
+        order = np.argsort(keys)
+        sorted_keys = keys[order]
+        labels = np.asarray(self.speaker_model.cluster_labels)
+        positions = np.clip(np.searchsorted(sorted_keys, labels), 0, keys.shape[0] - 1)
+        found = sorted_keys[positions] == labels
+        noise_index = list(self.brushes.keys()).index(-1)
+        return lookup[np.where(found, order[positions], noise_index)]
+
+    def distance_pens(self) -> np.ndarray:
+        if self.speaker_model.distances is None:
+            return np.full(self.speaker_model.mds.shape[0], self.pen_lookup[0], dtype=object)
+        distances = np.nan_to_num(np.asarray(self.speaker_model.distances, dtype=float))
+        levels = np.clip(
+            np.round(distances * (self.distance_levels - 1)), 0, self.distance_levels - 1
+        ).astype(int)
+        return self.pen_lookup[levels]
+
+    def update_density(self):
+        mds = self.speaker_model.mds
+        if mds.shape[0] <= self.density_threshold:
+            self.density_item.hide()
+            return
+        xmin, xmax = np.min(mds[:, 0]), np.max(mds[:, 0])
+        ymin, ymax = np.min(mds[:, 1]), np.max(mds[:, 1])
+        histogram, _, _ = np.histogram2d(
+            mds[:, 0], mds[:, 1], bins=256, range=[[xmin, xmax], [ymin, ymax]]
+        )
+        self.density_item.setLookupTable(self.density_colormap.getLookupTable(nPts=256))
+        self.density_item.setImage(np.log1p(histogram.T), autoLevels=True)
+        self.density_item.setRect(QtCore.QRectF(xmin, ymin, xmax - xmin, ymax - ymin))
+        self.density_item.show()
+
     def set_models(
         self,
         corpus_model: CorpusModel,
@@ -257,11 +397,11 @@ class UtteranceClusterView(pg.PlotWidget):
     def clear_plot(self):
         self.legend_item.clear()
         self.scatter_item.clear()
+        self.scatter_item.build_point_tree()
+        self.density_item.hide()
         self.getPlotItem().update()
 
-    def update_point(self, sender, spots, ev: pg.GraphicsScene.mouseEvents.MouseClickEvent):
-        spot = spots[0]
-        index = spot._index
+    def update_point(self, index: int, ev: pg.GraphicsScene.mouseEvents.MouseClickEvent):
         if ev.button() == QtCore.Qt.MouseButton.LeftButton:
             utterance_id = int(self.speaker_model.utterance_ids[index])
             utterance = self.corpus_model.session.query(Utterance).get(utterance_id)
@@ -286,7 +426,7 @@ class UtteranceClusterView(pg.PlotWidget):
                 current_index = 0
             current_cluster = brush_indices[current_index]
             self.speaker_model.cluster_labels[index] = current_cluster
-            spot.setBrush(self.brushes[current_cluster])
+            self.scatter_item.setBrush(self.cluster_brushes())
             self.selected_indices = set()
             self.update_highlight()
         ev.accept()
@@ -306,17 +446,23 @@ class UtteranceClusterView(pg.PlotWidget):
                 pg.intColor(i, len(self.speaker_model.current_speakers))
             )
         with self.speaker_model.corpus_model.corpus.session() as session:
-            for k, v in self.brushes.items():
-                if k < 0:
-                    label = "Noise"
-                else:
-                    label = session.query(Speaker.name).filter(Speaker.id == k).first()[0]
-                self.legend_item.addItem(pg.ScatterPlotItem(brush=v, name=label), label)
-        brushes = [
-            self.brushes[x if x in self.speaker_model.current_speakers else -1]
-            for x in self.speaker_model.cluster_labels
-        ]
-        self.pens = [pg.mkPen(x, width=2) for x in self.speaker_model.distances]
+            speaker_names = dict(
+                session.query(Speaker.id, Speaker.name).filter(
+                    Speaker.id.in_(self.speaker_model.current_speakers)
+                )
+            )
+        for k, v in self.brushes.items():
+            if k < 0:
+                label = "Noise"
+            else:
+                label = speaker_names.get(k, str(k))
+            self.legend_item.addItem(pg.ScatterPlotItem(brush=v, name=label), label)
+        brushes = self.cluster_brushes()
+        density_mode = self.speaker_model.mds.shape[0] > self.density_threshold
+        if density_mode:
+            self.pens = np.full(self.speaker_model.mds.shape[0], pg.mkPen(None), dtype=object)
+        else:
+            self.pens = self.distance_pens()
         xmin, xmax = np.min(self.speaker_model.mds[:, 0]), np.max(self.speaker_model.mds[:, 0])
         ymin, ymax = np.min(self.speaker_model.mds[:, 1]), np.max(self.speaker_model.mds[:, 1])
         xrange = xmax - xmin
@@ -342,12 +488,14 @@ class UtteranceClusterView(pg.PlotWidget):
 
         self.scatter_item.setData(
             pos=self.speaker_model.mds,
-            size=10,
+            size=4 if density_mode else 10,
             brush=brushes,
             pen=self.pens,
             hoverPen=self.hover_pen,
-            hoverable=True,
+            hoverable=not density_mode,
         )
+        self.scatter_item.build_point_tree()
+        self.update_density()
         self.plotAvailable.emit(True)
 
     def highlight_cluster(self, cluster_id):
@@ -368,15 +516,13 @@ class UtteranceClusterView(pg.PlotWidget):
     def update_highlight(self):
         if self.speaker_model.mds is None:
             return
-        num_utterances = self.speaker_model.mds.shape[0]
-        pens = []
-        for i in range(num_utterances):
-            if i in self.selected_indices:
-                pens.append(self.selected_pen)
-            elif i in self.updated_indices:
-                pens.append(self.updated_pen)
-            else:
-                pens.append(self.pens[i])
+        if self.pens.shape[0] != self.speaker_model.mds.shape[0]:
+            return
+        pens = self.pens.copy()
+        if self.updated_indices:
+            pens[np.array(list(self.updated_indices), dtype=int)] = self.updated_pen
+        if self.selected_indices:
+            pens[np.array(list(self.selected_indices), dtype=int)] = self.selected_pen
         self.scatter_item.setPen(pens)
 
 
@@ -412,6 +558,16 @@ class AudioPlotItem(pg.PlotItem):
         self.hideButtons()
 
 
+class SpeakerTierPlaceholder(pg.GraphicsWidget):
+    """Empty row that stands in for a speaker tier outside of the scroll viewport"""
+
+    def __init__(self):
+        super().__init__()
+        self.setSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding
+        )
+
+
 class SpeakerTierItem(pg.PlotItem):
     def __init__(self, top_point, bottom_point):
         super().__init__()
@@ -420,6 +576,13 @@ class SpeakerTierItem(pg.PlotItem):
         self.setClipToView(True)
         self.hideAxis("left")
         self.hideAxis("bottom")
+        self.set_tier_range(top_point, bottom_point)
+        self.setMouseEnabled(False, False)
+
+        self.setMenuEnabled(False)
+        self.hideButtons()
+
+    def set_tier_range(self, top_point, bottom_point):
         rect = QtCore.QRectF()
         rect.setTop(top_point)
         rect.setBottom(bottom_point)
@@ -427,10 +590,6 @@ class SpeakerTierItem(pg.PlotItem):
         rect.setRight(10)
         rect = rect.normalized()
         self.setRange(rect=rect)
-        self.setMouseEnabled(False, False)
-
-        self.setMenuEnabled(False)
-        self.hideButtons()
 
     def contextMenuEvent(self, event: QtWidgets.QGraphicsSceneContextMenuEvent):
         vb = self.getViewBox()
@@ -505,6 +664,12 @@ class UtteranceView(QtWidgets.QWidget):
         self.speaker_tier_layout.setBackground(self.plot_theme.background_color)
         self.speaker_tiers: dict[SpeakerTier] = {}
         self.speaker_tier_items = {}
+        self.speaker_tier_rows = {}
+        self.speaker_tier_placeholders = {}
+        self.speaker_tier_pool = []
+        self.available_speakers = {}
+        self.speaker_tier_height = None
+        self.speaker_row_height = None
         self.search_term = None
         self.default_speaker_id = None
         self.extra_tiers = {}
@@ -517,6 +682,7 @@ class UtteranceView(QtWidgets.QWidget):
         self.tier_scroll_area.setHorizontalScrollBarPolicy(
             QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff
         )
+        self.tier_scroll_area.verticalScrollBar().valueChanged.connect(self.update_visible_tiers)
         scroll_layout = QtWidgets.QVBoxLayout()
         layout.addWidget(self.audio_scroll_area)
         scroll_layout.addWidget(self.audio_layout)
@@ -538,7 +704,12 @@ class UtteranceView(QtWidgets.QWidget):
         self.corpus_model = corpus_model
         self.file_model = file_model
         self.corpus_model.corpusLoaded.connect(self.set_extra_tiers)
+        self.corpus_model.corpusLoaded.connect(highlighter_context.invalidate_dictionaries)
+        self.corpus_model.dictionaryChanged.connect(highlighter_context.invalidate_dictionaries)
+        self.corpus_model.speakersRefreshed.connect(highlighter_context.invalidate_dictionaries)
+        self.file_model.speakersChanged.connect(highlighter_context.invalidate_dictionaries)
         self.selection_model = selection_model
+        self.selection_model.set_plot_width(self.audio_layout.width())
         self.dictionary_model = dictionary_model
         for t in self.speaker_tiers.values():
             t.set_models(corpus_model, selection_model, dictionary_model)
@@ -556,6 +727,12 @@ class UtteranceView(QtWidgets.QWidget):
         self.file_model.speakersChanged.connect(self.finalize_loading_utterances)
         self.corpus_model.refreshTiers.connect(self.finalize_loading_utterances)
 
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        super().resizeEvent(event)
+        if self.selection_model is not None:
+            self.selection_model.set_plot_width(self.audio_layout.width())
+        self.update_visible_tiers()
+
     def refresh_theme(self):
         self.audio_layout.setBackground(self.plot_theme.background_color)
         self.speaker_tier_layout.setBackground(self.plot_theme.background_color)
@@ -566,6 +743,8 @@ class UtteranceView(QtWidgets.QWidget):
         self.audio_plot_item.getAxis("bottom").setTextPen(self.plot_theme.break_line_color)
 
     def refresh(self):
+        glyph_path_cache.clear()
+        highlighter_context.refresh_theme()
         self.finalize_loading_utterances()
         self.finalize_loading_auto_wave_form()
         self.finalize_loading_pitch_track()
@@ -577,59 +756,39 @@ class UtteranceView(QtWidgets.QWidget):
         scroll_to = None
         self.speaker_tiers = {}
         self.speaker_tier_items = {}
+        self.speaker_tier_rows = {}
+        self.speaker_tier_placeholders = {}
+        self.speaker_tier_pool = []
         self.speaker_tier_layout.clear()
-        available_speakers = {}
+        self.available_speakers = {}
         num_visible_speakers = min(
             len(self.file_model.speakers), self.settings.value(self.settings.TIER_MAX_SPEAKERS)
         )
-        speaker_tier_height = (self.separator_point - self.bottom_point) / num_visible_speakers
+        self.speaker_tier_height = (
+            self.separator_point - self.bottom_point
+        ) / num_visible_speakers
+        row_height = self.tier_scroll_area.height()
+        self.speaker_row_height = row_height / num_visible_speakers
         for i, speaker_id in enumerate(self.file_model.speakers):
             speaker_name = self.corpus_model.get_speaker_name(speaker_id)
-            top_point = i * speaker_tier_height
-            bottom_point = top_point - speaker_tier_height
-            tier = SpeakerTier(
-                top_point,
-                bottom_point,
-                speaker_id,
-                speaker_name,
-                self.corpus_model,
-                self.file_model,
-                self.selection_model,
-                self.dictionary_model,
-                search_term=self.search_term,
-            )
-            tier.draggingLine.connect(self.audio_plot.update_drag_line)
-            tier.lineDragFinished.connect(self.audio_plot.hide_drag_line)
-            tier.receivedWheelEvent.connect(self.audio_plot.wheelEvent)
-            tier.receivedGestureEvent.connect(self.audio_plot.gestureEvent)
-            tier.set_extra_tiers(self.extra_tiers)
-            tier.setZValue(30)
-            available_speakers[speaker_name] = speaker_id
-            self.speaker_tiers[speaker_id] = tier
-        for i, (key, tier) in enumerate(self.speaker_tiers.items()):
-            tier.set_available_speakers(available_speakers)
-            tier.refresh()
-            top_point = i * speaker_tier_height
-            bottom_point = top_point - speaker_tier_height
-            tier_item = SpeakerTierItem(top_point, bottom_point)
-            tier_item.setRange(
-                xRange=[self.selection_model.plot_min, self.selection_model.plot_max]
+            self.available_speakers[speaker_name] = speaker_id
+            placeholder = SpeakerTierPlaceholder()
+            self.speaker_tier_placeholders[i] = placeholder
+            self.speaker_tier_layout.addItem(placeholder, i, 0)
+            self.speaker_tier_layout.centralWidget.layout.setRowFixedHeight(
+                i, self.speaker_row_height
             )
-            tier_item.addItem(tier)
-            self.speaker_tier_items[key] = tier_item
-            self.speaker_tier_layout.addItem(tier_item, i, 0)
-            if tier.speaker_id == self.default_speaker_id:
+            if speaker_id == self.default_speaker_id:
                 scroll_to = i
-        row_height = self.tier_scroll_area.height()
         self.speaker_tier_layout.setFixedHeight(
-            len(self.speaker_tiers) * row_height / num_visible_speakers
+            len(self.file_model.speakers) * row_height / num_visible_speakers
         )
         if len(self.file_model.speakers) > num_visible_speakers:
             self.tier_scroll_area.verticalScrollBar().setSingleStep(row_height)
             self.tier_scroll_area.verticalScrollBar().setPageStep(row_height)
             self.tier_scroll_area.verticalScrollBar().setMinimum(0)
             self.tier_scroll_area.verticalScrollBar().setMaximum(
-                len(self.speaker_tiers) * row_height
+                len(self.file_model.speakers) * row_height
             )
             self.tier_scroll_area.setVerticalScrollBarPolicy(
                 QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOn
@@ -638,15 +797,95 @@ class UtteranceView(QtWidgets.QWidget):
                 0, 0, self.settings.scroll_bar_height, 0
             )
             if scroll_to is not None:
-                self.tier_scroll_area.verticalScrollBar().setValue(
-                    scroll_to * self.tier_scroll_area.height()
-                )
+                with QtCore.QSignalBlocker(self.tier_scroll_area.verticalScrollBar()):
+                    self.tier_scroll_area.verticalScrollBar().setValue(
+                        int(scroll_to * self.speaker_row_height)
+                    )
                 self.default_speaker_id = None
         else:
             self.audio_layout.centralWidget.layout.setContentsMargins(0, 0, 0, 0)
             self.tier_scroll_area.setVerticalScrollBarPolicy(
                 QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff
             )
+        self.update_visible_tiers()
+
+    def update_visible_tiers(self, *args):
+        """
+        Bind speaker tiers to the rows in or next to the scroll viewport and release the rest
+        back to placeholders
+        """
+        if self.file_model is None or self.file_model.file is None:
+            return
+        if not self.speaker_tier_placeholders:
+            return
+        num_speakers = len(self.speaker_tier_placeholders)
+        if self.speaker_row_height:
+            scroll_value = self.tier_scroll_area.verticalScrollBar().value()
+            viewport_height = self.tier_scroll_area.viewport().height()
+            first_row = int(scroll_value // self.speaker_row_height) - 1
+            last_row = int((scroll_value + viewport_height) // self.speaker_row_height) + 1
+        else:
+            first_row = 0
+            last_row = self.settings.value(self.settings.TIER_MAX_SPEAKERS)
+        first_row = max(first_row, 0)
+        last_row = min(last_row, num_speakers - 1)
+        visible_speakers = {
+            self.file_model.speakers[i]: i for i in range(first_row, last_row + 1)
+        }
+        for speaker_id, row in list(self.speaker_tier_rows.items()):
+            if visible_speakers.get(speaker_id, None) != row:
+                self.release_speaker_tier(speaker_id)
+        for speaker_id, row in visible_speakers.items():
+            if speaker_id not in self.speaker_tiers:
+                self.acquire_speaker_tier(speaker_id, row)
+
+    def acquire_speaker_tier(self, speaker_id: int, row: int):
+        speaker_name = self.corpus_model.get_speaker_name(speaker_id)
+        top_point = row * self.speaker_tier_height
+        bottom_point = top_point - self.speaker_tier_height
+        if self.speaker_tier_pool:
+            tier, tier_item = self.speaker_tier_pool.pop()
+            tier.search_term = self.search_term
+            tier.set_speaker(speaker_id, speaker_name, top_point, bottom_point)
+            tier_item.set_tier_range(top_point, bottom_point)
+        else:
+            tier = SpeakerTier(
+                top_point,
+                bottom_point,
+                speaker_id,
+                speaker_name,
+                self.corpus_model,
+                self.file_model,
+                self.selection_model,
+                self.dictionary_model,
+                search_term=self.search_term,
+            )
+            tier.draggingLine.connect(self.audio_plot.update_drag_line)
+            tier.lineDragFinished.connect(self.audio_plot.hide_drag_line)
+            tier.receivedWheelEvent.connect(self.audio_plot.wheelEvent)
+            tier.receivedGestureEvent.connect(self.audio_plot.gestureEvent)
+            tier.setZValue(30)
+            tier_item = SpeakerTierItem(top_point, bottom_point)
+            tier_item.addItem(tier)
+        tier.set_extra_tiers(self.extra_tiers)
+        tier.set_available_speakers(self.available_speakers)
+        placeholder = self.speaker_tier_placeholders[row]
+        self.speaker_tier_layout.removeItem(placeholder)
+        self.speaker_tier_layout.addItem(tier_item, row, 0)
+        self.speaker_tiers[speaker_id] = tier
+        self.speaker_tier_items[speaker_id] = tier_item
+        self.speaker_tier_rows[speaker_id] = row
+        tier.refresh()
+        tier_item.setRange(xRange=[self.selection_model.plot_min, self.selection_model.plot_max])
+
+    def release_speaker_tier(self, speaker_id: int):
+        tier = self.speaker_tiers.pop(speaker_id)
+        tier_item = self.speaker_tier_items.pop(speaker_id)
+        row = self.speaker_tier_rows.pop(speaker_id)
+        self.speaker_tier_layout.removeItem(tier_item)
+        self.speaker_tier_layout.addItem(self.speaker_tier_placeholders[row], row, 0)
+        tier.set_speaker(None, "", tier.top_point, tier.bottom_point)
+        self.speaker_tier_pool.append((tier, tier_item))
 
     def set_default_speaker(self, speaker_id):
         self.default_speaker_id = speaker_id
@@ -729,20 +968,21 @@ class UtteranceView(QtWidgets.QWidget):
             tier.refresh(reset_bounds=True)
 
     def draw_text_grid(self):
-        scroll_to = None
-        for i, (key, tier) in enumerate(self.speaker_tiers.items()):
+        if self.default_speaker_id in self.file_model.speakers and self.speaker_row_height:
+            # Scrolling binds a tier to the speaker's row if it is not visible yet
+            row = self.file_model.speakers.index(self.default_speaker_id)
+            self.tier_scroll_area.verticalScrollBar().setValue(
+                int(row * self.speaker_row_height)
+            )
+            self.update_visible_tiers()
+            self.default_speaker_id = None
+        for key, tier in self.speaker_tiers.items():
             self.speaker_tier_items[key].hide()
             tier.refresh()
-            if tier.speaker_id == self.default_speaker_id:
-                scroll_to = i
-                tier_height = self.speaker_tier_items[key].height()
             self.speaker_tier_items[key].setRange(
                 xRange=[self.selection_model.plot_min, self.selection_model.plot_max]
             )
             self.speaker_tier_items[key].show()
-        if scroll_to is not None:
-            self.tier_scroll_area.verticalScrollBar().setValue(scroll_to * tier_height)
-            self.default_speaker_id = None
 
     def update_show_speakers(self, state):
         self.show_all_speakers = state > 0
@@ -767,11 +1007,13 @@ class UtteranceView(QtWidgets.QWidget):
             return
         new_speaker_id = None
         old_speaker_id = None
-        for tier in self.speaker_tiers.values():
-            if tier.speaker_id == utterance.speaker_id:
-                old_speaker_id = tier.speaker_id
-            if tier.top_point > pos > tier.bottom_point:
-                new_speaker_id = tier.speaker_id
+        for row, speaker_id in enumerate(self.file_model.speakers):
+            top_point = row * self.speaker_tier_height
+            bottom_point = top_point - self.speaker_tier_height
+            if speaker_id == utterance.speaker_id:
+                old_speaker_id = speaker_id
+            if top_point > pos > bottom_point:
+                new_speaker_id = speaker_id
         if new_speaker_id is not None and new_speaker_id != old_speaker_id:
             self.file_model.update_utterance_speaker(utterance, new_speaker_id)
 
@@ -1125,10 +1367,16 @@ class TranscriberErrorHighlighter(QtGui.QSyntaxHighlighter):
         self.highlight_format.setBackground(self.keyword_color)
         self.highlight_format.setForeground(self.keyword_text_color)
         self.search_term = None
+        self.search_regex = None
 
     def setSearchTerm(self, search_term: TextFilterQuery):
         if search_term != self.search_term:
             self.search_term = search_term
+            self.search_regex = None
+            if self.search_term:
+                self.search_regex = highlighter_context.search_pattern(
+                    self.search_term.generate_expression()
+                )
             self.rehighlight()
 
     def set_alignment(self, alignment):
@@ -1169,11 +1417,10 @@ class TranscriberErrorHighlighter(QtGui.QSyntaxHighlighter):
                     self.highlight_format,
                 )
 
-        if self.search_term:
+        if self.search_regex is not None:
             if not self.search_term.case_sensitive:
                 text = text.lower()
-            filter_regex = self.search_term.generate_expression()
-            for word_object in re.finditer(filter_regex, text):
+            for word_object in self.search_regex.finditer(text):
                 for i in range(word_object.start(), word_object.end()):
                     f = self.format(i)
                     f.setFontWeight(QtGui.QFont.Weight.Bold)
@@ -1377,6 +1624,13 @@ class TextAttributeRegion(pg.GraphicsObject):
         self._cached_pixel_size = None
         self.cached_bounds = None
 
+    def set_times(self, begin, end):
+        self.prepareGeometryChange()
+        self.begin = begin
+        self.end = end
+        self.left_point = begin
+        self.width = end - begin
+
     def boundingRect(self):
         visible_begin = max(self.begin, self.selection_model.plot_min)
         visible_end = min(self.end, self.selection_model.plot_max)
@@ -1477,8 +1731,88 @@ class NormalizedTextRegion(TextAttributeRegion):
         return br
 
 
-class Highlighter(QtGui.QSyntaxHighlighter):
+class HighlighterContext:
+    """
+    Shared state for transcript highlighters
+
+    Caches word patterns per dictionary, the most recently compiled search patterns and the
+    theme colors so that highlighting a block does no settings or database lookups.  The
+    caches are invalidated explicitly when the corpus, its dictionaries or speakers, or the
+    settings change.
+    """
+
     WORDS = rf"[^\s{''.join(DEFAULT_WORD_BREAK_MARKERS)+''.join(DEFAULT_PUNCTUATION)}]+"
+    max_search_patterns = 64
+
+    def __init__(self):
+        self.word_patterns: typing.Dict[typing.Optional[int], re.Pattern] = {}
+        self.speaker_dictionaries: typing.Dict[typing.Optional[int], typing.Optional[int]] = {}
+        self.search_patterns: collections.OrderedDict[str, re.Pattern] = (
+            collections.OrderedDict()
+        )
+        self.error_color = None
+        self.search_background_color = None
+        self.search_foreground_color = None
+
+    def invalidate_dictionaries(self, *args):
+        self.word_patterns = {}
+        self.speaker_dictionaries = {}
+
+    def refresh_theme(self):
+        settings = AnchorSettings()
+        self.error_color = settings.error_color
+        self.search_background_color = QtGui.QColor(settings.accent_base_color)
+        self.search_foreground_color = QtGui.QColor(settings.primary_very_dark_color)
+
+    def ensure_theme(self):
+        if self.error_color is None:
+            self.refresh_theme()
+
+    def word_pattern(
+        self, dictionary_model: typing.Optional[DictionaryTableModel], speaker_id: int
+    ) -> re.Pattern:
+        if dictionary_model is None:
+            return self.search_pattern(self.WORDS)
+        corpus = dictionary_model.corpus_model.corpus
+        if speaker_id not in self.speaker_dictionaries:
+            try:
+                self.speaker_dictionaries[speaker_id] = corpus.get_dict_id_for_speaker(speaker_id)
+            except Exception:
+                return self.search_pattern(self.WORDS)
+        dictionary_id = self.speaker_dictionaries[speaker_id]
+        if dictionary_id not in self.word_patterns:
+            words = self.WORDS
+            try:
+                tokenizers = corpus.get_tokenizers()
+                if isinstance(tokenizers, dict) and dictionary_id is not None:
+                    tokenizer = corpus.get_tokenizer(dictionary_id)
+                else:
+                    tokenizer = tokenizers
+                if isinstance(tokenizer, SimpleTokenizer):
+                    extra_symbols = "".join(tokenizer.punctuation) + "".join(
+                        tokenizer.word_break_markers
+                    )
+                    words = rf"[^\s{extra_symbols}]+"
+            except Exception:
+                return self.search_pattern(self.WORDS)
+            self.word_patterns[dictionary_id] = self.search_pattern(words)
+        return self.word_patterns[dictionary_id]
+
+    def search_pattern(self, expression: str) -> re.Pattern:
+        try:
+            self.search_patterns.move_to_end(expression)
+        except KeyError:
+            self.search_patterns[expression] = re.compile(expression)
+            while len(self.search_patterns) > self.max_search_patterns:
+                self.search_patterns.popitem(last=False)
+        return self.search_patterns[expression]
+
+
+highlighter_context = HighlighterContext()
+
+
+class Highlighter(QtGui.QSyntaxHighlighter):
+    WORDS = HighlighterContext.WORDS
 
     def __init__(self, *args):
         super(Highlighter, self).__init__(*args)
@@ -1486,9 +1820,11 @@ class Highlighter(QtGui.QSyntaxHighlighter):
         self.speaker_id = None
         self.dictionary_model: Optional[DictionaryTableModel] = None
         self.search_term: Optional[TextFilterQuery] = None
+        self.search_regex: Optional[re.Pattern] = None
+        highlighter_context.ensure_theme()
         self.spellcheck_format = QtGui.QTextCharFormat()
         self.spellcheck_format.setFontWeight(QtGui.QFont.Weight.ExtraBold)
-        self.spellcheck_format.setUnderlineColor(self.settings.error_color)
+        self.spellcheck_format.setUnderlineColor(highlighter_context.error_color)
         self.spellcheck_format.setUnderlineStyle(
             QtGui.QTextCharFormat.UnderlineStyle.SingleUnderline
         )
@@ -1502,46 +1838,34 @@ class Highlighter(QtGui.QSyntaxHighlighter):
     def setSearchTerm(self, search_term: TextFilterQuery):
         if search_term != self.search_term:
             self.search_term = search_term
+            self.search_regex = None
+            if self.search_term:
+                self.search_regex = highlighter_context.search_pattern(
+                    self.search_term.generate_expression()
+                )
             self.rehighlight()
 
     def highlightBlock(self, text):
-        self.settings.sync()
-        self.spellcheck_format.setUnderlineColor(self.settings.error_color)
-        words = self.WORDS
-        try:
-            tokenizers = self.dictionary_model.corpus_model.corpus.get_tokenizers()
-            dictionary_id = self.dictionary_model.corpus_model.corpus.get_dict_id_for_speaker(
-                self.speaker_id
-            )
-            if isinstance(tokenizers, dict) and dictionary_id is not None:
-                tokenizer = self.dictionary_model.corpus_model.corpus.get_tokenizer(dictionary_id)
-            else:
-                tokenizer = tokenizers
-            if isinstance(tokenizer, SimpleTokenizer):
-                extra_symbols = "".join(tokenizer.punctuation) + "".join(
-                    tokenizer.word_break_markers
-                )
-                words = rf"[^\s{extra_symbols}]+"
-        except Exception:
-            pass
+        highlighter_context.ensure_theme()
+        self.spellcheck_format.setUnderlineColor(highlighter_context.error_color)
         if self.dictionary_model is not None and self.dictionary_model.word_sets:
-            for word_object in re.finditer(words, text):
+            words = highlighter_context.word_pattern(self.dictionary_model, self.speaker_id)
+            for word_object in words.finditer(text):
                 if not self.dictionary_model.check_word(word_object.group(), self.speaker_id):
                     self.setFormat(
                         word_object.start(),
                         word_object.end() - word_object.start(),
                         self.spellcheck_format,
                     )
-        if self.search_term:
+        if self.search_regex is not None:
             if not self.search_term.case_sensitive:
                 text = text.lower()
-            filter_regex = self.search_term.generate_expression()
-            for word_object in re.finditer(filter_regex, text):
+            for word_object in self.search_regex.finditer(text):
                 for i in range(word_object.start(), word_object.end()):
                     f = self.format(i)
                     f.setFontWeight(QtGui.QFont.Weight.Bold)
-                    f.setBackground(QtGui.QColor(self.settings.accent_base_color))
-                    f.setForeground(QtGui.QColor(self.settings.primary_very_dark_color))
+                    f.setBackground(highlighter_context.search_background_color)
+                    f.setForeground(highlighter_context.search_foreground_color)
                     self.setFormat(i, 1, f)
 
 
@@ -1838,6 +2162,7 @@ class IntervalLine(pg.InfiniteLine):
 
 class IntervalTier(pg.GraphicsObject):
     highlightRequested = QtCore.Signal(object)
+    label_threshold = 0.0075
 
     def __init__(
         self,
@@ -1874,7 +2199,7 @@ class IntervalTier(pg.GraphicsObject):
         self.selection_model = selection_model
         self.utterance = utterance
         self.lines = []
-        self.selected = []
+        self.search_matches = np.zeros(0, dtype=bool)
 
         self._boundingRectCache = None
         self._cached_pixel_size = None
@@ -1907,10 +2232,17 @@ class IntervalTier(pg.GraphicsObject):
         self.intervals = sorted(
             getattr(utterance, self.lookup, self.intervals), key=lambda x: x.begin
         )
+        self.clear_lines()
+        self.refresh_tier()
+        self.update_level_of_detail()
+
+    def clear_lines(self):
         for line in self.lines:
             if line.scene() is not None:
                 line.scene().removeItem(line)
         self.lines = []
+
+    def create_lines(self):
         bound_min = self.utterance.begin
         for i, interval in enumerate(self.intervals):
             if i == 0:
@@ -1931,10 +2263,29 @@ class IntervalTier(pg.GraphicsObject):
             )
             line.setZValue(30)
             line.setParentItem(self)
-            # line.sigPositionChanged.connect(self._lineMoved)
+            self.setup_line(line)
             self.lines.append(line)
             bound_min = interval.begin
-        self.refresh_tier()
+
+    def setup_line(self, line: IntervalLine):
+        pass
+
+    @property
+    def detailed(self) -> bool:
+        if self.selection_model.max_time is None or self.selection_model.min_time is None:
+            return False
+        total_time = self.selection_model.max_time - self.selection_model.min_time
+        if total_time <= 0:
+            return True
+        return self.median_duration / total_time > self.label_threshold
+
+    def update_level_of_detail(self):
+        if self.detailed:
+            if not self.lines and len(self.intervals) > 1:
+                self.create_lines()
+        elif self.lines and not any(line.moving for line in self.lines):
+            self.clear_lines()
+        self.update()
 
     def refresh_tier(self):
         self.regenerate_text_boxes()
@@ -1942,30 +2293,29 @@ class IntervalTier(pg.GraphicsObject):
 
     def regenerate_text_boxes(self):
         self.array = pg.Qt.internals.PrimitiveArray(QtCore.QRectF, 4)
-        self.selected_array = pg.Qt.internals.PrimitiveArray(QtCore.QRectF, 4)
         self.array.resize(len(self.intervals))
-        self.selected = []
         memory = self.array.ndarray()
 
-        fm = QtGui.QFontMetrics(self.plot_text_font)
         for i, interval in enumerate(self.intervals):
             memory[i, 0] = interval.begin
             memory[i, 2] = interval.end - interval.begin
-            if interval.label not in self.parentItem().painter_path_cache:
-                symbol = QtGui.QPainterPath()
-
-                symbol.addText(0, 0, self.plot_text_font, interval.label)
-                br = symbol.boundingRect()
-
-                # getting transform object
-                tr = QtGui.QTransform()
-
-                # translating
-                tr.translate(-br.x() - br.width() / 2.0, fm.height() / 2.0)
-                self.parentItem().painter_path_cache[interval.label] = tr.map(symbol)
 
         memory[:, 1] = self.bottom_point
         memory[:, 3] = self.top_point - self.bottom_point
+        self.interval_ends = memory[:, 0] + memory[:, 2]
+        self.median_duration = float(np.median(memory[:, 2])) if memory.shape[0] else 0.0
+
+        self.boundary_array = pg.Qt.internals.PrimitiveArray(QtCore.QLineF, 4)
+        self.boundary_array.resize(max(len(self.intervals) - 1, 0))
+        boundaries = self.boundary_array.ndarray()
+        boundaries[:, 0] = memory[1:, 0]
+        boundaries[:, 1] = self.bottom_point
+        boundaries[:, 2] = memory[1:, 0]
+        boundaries[:, 3] = self.top_point
+        self.update_search_matches()
+
+    def label_path(self, label: str) -> QtGui.QPainterPath:
+        return glyph_path_cache.get(self.plot_text_font, label)
 
     def mousePressEvent(self, e: QtGui.QMouseEvent) -> None:
         if e.button() == QtCore.Qt.MouseButton.LeftButton:
@@ -1994,61 +2344,82 @@ class IntervalTier(pg.GraphicsObject):
         self.search_regex = None
         if self.search_term is not None and self.search_term.text:
             self.search_regex = re.compile(self.search_term.generate_expression())
-            self.selected = []
-            for i, interval in enumerate(self.intervals):
-                if self.search_regex.search(interval.label):
-                    self.selected.append(interval)
-            self.selected_array.resize(len(self.selected))
-            if self.selected:
-                memory = self.selected_array.ndarray()
-                for i, interval in enumerate(self.selected):
-                    memory[i, 0] = interval.begin
-                    memory[i, 2] = interval.end - interval.begin
-                memory[:, 1] = self.bottom_point
-                memory[:, 3] = self.top_point - self.bottom_point
+        self.update_search_matches()
+        self.update()
+
+    def update_search_matches(self):
+        self.search_matches = np.zeros(len(self.intervals), dtype=bool)
+        if self.search_regex is None:
+            return
+        for i, interval in enumerate(self.intervals):
+            if self.search_regex.search(interval.label):
+                self.search_matches[i] = True
+
+    def visible_range(self) -> typing.Tuple[int, int]:
+        memory = self.array.ndarray()
+        begin_index = np.searchsorted(
+            self.interval_ends, self.selection_model.plot_min, side="right"
+        )
+        end_index = np.searchsorted(memory[:, 0], self.selection_model.plot_max, side="left")
+        return int(begin_index), int(max(begin_index, end_index))
 
     def paint(self, painter, *args):
         vb = self.getViewBox()
         px = vb.viewPixelSize()
-        inst = self.array.instances()
         br = self.boundingRect()
         painter.save()
         painter.setPen(self.border_pen)
         painter.drawRect(br)
         painter.restore()
-        total_time = self.selection_model.max_time - self.selection_model.min_time
-        if self.selected:
-            selected_inst = self.selected_array.instances()
+        begin_index, end_index = self.visible_range()
+        if begin_index == end_index:
+            return
+        memory = self.array.ndarray()[begin_index:end_index]
+        matches = self.search_matches[begin_index:end_index]
+        if matches.any():
+            inst = self.array.instances()
             painter.save()
             painter.setPen(self.highlight_text_pen)
             painter.setBrush(pg.mkBrush(self.highlight_interval_color))
-            painter.drawRects(selected_inst)
+            painter.drawRects([inst[begin_index + i] for i in np.flatnonzero(matches)])
             painter.restore()
-        for i, interval in enumerate(self.intervals):
-            r = inst[i]
-            visible_begin = max(r.left(), self.selection_model.plot_min)
-            visible_end = min(r.right(), self.selection_model.plot_max)
-            visible_duration = visible_end - visible_begin
-            if visible_duration / total_time <= 0.0075:
+        if not self.detailed:
+            boundaries = self.boundary_array.instances()[
+                max(begin_index - 1, 0) : max(end_index - 1, 0)
+            ]
+            if boundaries:
+                painter.save()
+                painter.setPen(self.border_pen)
+                painter.drawLines(boundaries)
+                painter.restore()
+            return
+        total_time = self.selection_model.max_time - self.selection_model.min_time
+        visible_begins = np.maximum(memory[:, 0], self.selection_model.plot_min)
+        visible_ends = np.minimum(
+            self.interval_ends[begin_index:end_index], self.selection_model.plot_max
+        )
+        labeled = (visible_ends - visible_begins) / total_time > self.label_threshold
+        if not labeled.any():
+            return
+        centers = memory[:, 0] + memory[:, 2] / 2
+        y = (self.top_point + self.bottom_point) / 2
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing, True)
+        for highlighted, pen, brush in [
+            (False, self.text_pen, self.text_brush),
+            (True, self.highlight_text_pen, self.highlight_text_brush),
+        ]:
+            indices = np.flatnonzero(labeled & (matches == highlighted))
+            if not indices.shape[0]:
                 continue
-            x = (r.left() + r.right()) / 2
-            painter.save()
-            options = QtGui.QTextOption()
-            options.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            painter.setRenderHint(painter.RenderHint.Antialiasing, True)
-            text_pen = self.text_pen
-            text_brush = self.text_brush
-            if self.search_regex is not None:
-                if self.search_regex.search(interval.label):
-                    text_pen = self.highlight_text_pen
-                    text_brush = self.highlight_text_brush
-            painter.setPen(text_pen)
-            painter.setBrush(text_brush)
-            painter.translate(x, (self.top_point + self.bottom_point) / 2)
-            path = self.parentItem().painter_path_cache[interval.label]
-            painter.scale(px[0], -px[1])
-            painter.drawPath(path)
-            painter.restore()
+            batch = QtGui.QPainterPath()
+            for i in indices:
+                tr = QtGui.QTransform(px[0], 0, 0, -px[1], centers[i], y)
+                batch.addPath(tr.map(self.label_path(self.intervals[begin_index + i].label)))
+            painter.setPen(pen)
+            painter.setBrush(brush)
+            painter.drawPath(batch)
+        painter.restore()
 
     def boundingRect(self):
         br = QtCore.QRectF(
@@ -2179,42 +2550,11 @@ class PhoneIntervalTier(IntervalTier):
             movable=True,
         )
 
-    def update_intervals(self, utterance):
-        self.intervals = sorted(
-            getattr(utterance, self.lookup, self.intervals), key=lambda x: x.begin
-        )
-        for line in self.lines:
-            if line.scene() is not None:
-                line.scene().removeItem(line)
-        self.lines = []
-        bound_min = self.utterance.begin
-        for i, interval in enumerate(self.intervals):
-            if i == 0:
-                continue
-
-            line = IntervalLine(
-                interval.begin,
-                index=i - 1,
-                index_count=len(self.intervals) - 1,
-                bound_min=bound_min,
-                bound_max=interval.end,
-                bottom_point=self.bottom_point,
-                top_point=self.top_point,
-                pen=self.border_pen,
-                movingPen=self.movingPen,
-                hoverPen=self.hoverPen,
-                movable=self.movable,
-            )
-            line.setZValue(30)
-            line.setParentItem(self)
-            line.sigPositionChangeFinished.connect(self.lineMoveFinished)
-            # line.sigPositionChanged.connect(self._lineMoved)
-            self.lines.append(line)
-            bound_min = interval.begin
-            line.sigPositionChanged.connect(self.draggingLine.emit)
-            line.sigPositionChangeFinished.connect(self.lineDragFinished.emit)
-            line.hoverChanged.connect(self.update_hover)
-        self.refresh_tier()
+    def setup_line(self, line: IntervalLine):
+        line.sigPositionChangeFinished.connect(self.lineMoveFinished)
+        line.sigPositionChanged.connect(self.draggingLine.emit)
+        line.sigPositionChangeFinished.connect(self.lineDragFinished.emit)
+        line.hoverChanged.connect(self.update_hover)
 
     def update_hover(self, hovered, time):
         if hovered:
@@ -2405,6 +2745,7 @@ class UtteranceRegion(MfaRegion):
             extra_tiers = {}
         self.extra_tiers = extra_tiers
         self.extra_tier_intervals = {}
+        self.extra_tier_points = {}
         visible_tiers = self.settings.visible_tiers
         self.num_tiers = len([x for x in extra_tiers if visible_tiers[x]]) + 1
         self.per_tier_range = (top_point - bottom_point) / self.num_tiers
@@ -2465,7 +2806,6 @@ class UtteranceRegion(MfaRegion):
             search_term=search_term,
             speaker_id=utterance.speaker_id,
         )
-        self._painter_path_cache = {}
         self.text_edit = self.text_item.text_edit
         self.text_edit.gainedFocus.connect(self.select_self)
         self.text_edit.menuRequested.connect(self.generate_text_edit_menu)
@@ -2533,105 +2873,118 @@ class UtteranceRegion(MfaRegion):
                 )
                 self.update_transcription_highlight()
                 continue
-            intervals = getattr(self.item, lookup)
+            self.extra_tier_points[tier_name] = (tier_top_point, tier_bottom_point)
+            self.build_extra_tier(tier_name, lookup)
+        self.selection_model.viewChanged.connect(self.update_view_times)
+        self.lookUpWord.connect(self.dictionary_model.lookup_word)
+        self.createWord.connect(self.dictionary_model.add_word)
+        self.show()
+        self.available_speakers = available_speakers
 
-            self.extra_tier_intervals[tier_name] = []
+    def build_extra_tier(self, tier_name: str, lookup: str):
+        tier_top_point, tier_bottom_point = self.extra_tier_points[tier_name]
+        intervals = getattr(self.item, lookup)
 
-            if intervals is None:
-                continue
-            if not isinstance(intervals, list):
-                intervals = [intervals]
-            min_confidence = None
-            max_confidence = None
-            cmap = pg.ColorMap(
-                None,
-                [
-                    plot_theme.error_color,
-                    plot_theme.interval_background_color,
-                ],
+        self.extra_tier_intervals[tier_name] = []
+
+        if intervals is None:
+            return
+        if not isinstance(intervals, list):
+            intervals = [intervals]
+        min_confidence = None
+        max_confidence = None
+        cmap = pg.ColorMap(
+            None,
+            [
+                self.plot_theme.error_color,
+                self.plot_theme.interval_background_color,
+            ],
+        )
+        cmap.linearize()
+        if "phone_intervals" in lookup:
+            if lookup != "reference_phone_intervals":
+                for interval in intervals:
+                    if interval.confidence is None:
+                        continue
+                    if min_confidence is None or interval.confidence < min_confidence:
+                        min_confidence = interval.confidence
+                    if max_confidence is None or interval.confidence > max_confidence:
+                        max_confidence = interval.confidence
+            interval_tier = PhoneIntervalTier(
+                self,
+                self.item,
+                intervals,
+                self.selection_model,
+                top_point=tier_top_point,
+                bottom_point=tier_bottom_point,
+                lookup=lookup,
             )
-            cmap.linearize()
-            if "phone_intervals" in lookup:
-                if lookup != "reference_phone_intervals":
-                    for interval in intervals:
-                        if interval.confidence is None:
-                            continue
-                        if min_confidence is None or interval.confidence < min_confidence:
-                            min_confidence = interval.confidence
-                        if max_confidence is None or interval.confidence > max_confidence:
-                            max_confidence = interval.confidence
-                interval_tier = PhoneIntervalTier(
-                    self,
-                    self.item,
-                    intervals,
-                    self.selection_model,
-                    top_point=tier_top_point,
-                    bottom_point=tier_bottom_point,
-                    lookup=lookup,
+            interval_tier.draggingLine.connect(self.draggingLine.emit)
+            interval_tier.lineDragFinished.connect(self.lineDragFinished.emit)
+            interval_tier.phoneBoundaryChanged.connect(self.change_phone_boundaries)
+            interval_tier.phoneIntervalChanged.connect(self.change_phone_interval)
+            interval_tier.phoneIntervalDeleted.connect(self.delete_phone_interval)
+            interval_tier.phoneIntervalInserted.connect(self.insert_phone_interval)
+            self.phoneTiersChanged.connect(interval_tier.update_intervals)
+            if lookup.startswith("reference"):
+                interval_tier.deleteReferenceAlignments.connect(
+                    self.delete_reference_alignments
                 )
-                interval_tier.draggingLine.connect(self.draggingLine.emit)
-                interval_tier.lineDragFinished.connect(self.lineDragFinished.emit)
-                interval_tier.phoneBoundaryChanged.connect(self.change_phone_boundaries)
-                interval_tier.phoneIntervalChanged.connect(self.change_phone_interval)
-                interval_tier.phoneIntervalDeleted.connect(self.delete_phone_interval)
-                interval_tier.phoneIntervalInserted.connect(self.insert_phone_interval)
-                self.phoneTiersChanged.connect(interval_tier.update_intervals)
-                if lookup.startswith("reference"):
-                    interval_tier.deleteReferenceAlignments.connect(
-                        self.delete_reference_alignments
-                    )
-                self.extra_tier_intervals[tier_name].append(interval_tier)
+            self.extra_tier_intervals[tier_name].append(interval_tier)
 
-            elif "word_intervals" in lookup:
-                interval_tier = WordIntervalTier(
-                    self,
-                    self.item,
-                    intervals,
-                    self.selection_model,
-                    top_point=tier_top_point,
-                    bottom_point=tier_bottom_point,
-                    lookup=lookup,
+        elif "word_intervals" in lookup:
+            interval_tier = WordIntervalTier(
+                self,
+                self.item,
+                intervals,
+                self.selection_model,
+                top_point=tier_top_point,
+                bottom_point=tier_bottom_point,
+                lookup=lookup,
+            )
+            self.wordBoundariesChanged.connect(interval_tier.refresh_boundaries)
+            interval_tier.highlightRequested.connect(self.set_search_term)
+            interval_tier.wordPronunciationChanged.connect(self.change_word_pronunciation)
+            interval_tier.wordChanged.connect(self.change_word)
+            self.phoneTiersChanged.connect(interval_tier.update_intervals)
+            if self.transcription_text is not None:
+                interval_tier.highlightRequested.connect(
+                    self.transcription_text.highlighter.setSearchTerm
                 )
-                self.wordBoundariesChanged.connect(interval_tier.refresh_boundaries)
-                interval_tier.highlightRequested.connect(self.set_search_term)
-                interval_tier.wordPronunciationChanged.connect(self.change_word_pronunciation)
-                interval_tier.wordChanged.connect(self.change_word)
-                self.phoneTiersChanged.connect(interval_tier.update_intervals)
-                if self.transcription_text is not None:
-                    interval_tier.highlightRequested.connect(
-                        self.transcription_text.highlighter.setSearchTerm
-                    )
-                if self.normalized_text is not None:
-                    interval_tier.highlightRequested.connect(
-                        self.normalized_text.highlighter.setSearchTerm
-                    )
-                self.extra_tier_intervals[tier_name].append(interval_tier)
-
-            for interval in intervals:
-                if "phone_intervals" in lookup or "word_intervals" in lookup:
-                    continue
-                else:
-                    interval_reg = IntervalTextRegion(
-                        interval,
-                        self.text_color,
-                        border=pg.mkPen(plot_theme.break_line_color, width=1),
-                        top_point=tier_top_point,
-                        height=self.per_tier_range,
-                        background_brush=self.background_brush,
-                        selected_brush=pg.mkBrush(self.selected_interval_color),
-                        plot_theme=self.plot_theme,
-                    )
-                    interval_reg.audioSelected.connect(self.setSelected)
-                    interval_reg.setParentItem(self)
+            if self.normalized_text is not None:
+                interval_tier.highlightRequested.connect(
+                    self.normalized_text.highlighter.setSearchTerm
+                )
+            self.extra_tier_intervals[tier_name].append(interval_tier)
 
-                interval_reg.audioSelected.connect(self.audioSelected.emit)
-                interval_reg.viewRequested.connect(self.viewRequested.emit)
-                self.extra_tier_intervals[tier_name].append(interval_reg)
-        self.selection_model.viewChanged.connect(self.update_view_times)
-        self.lookUpWord.connect(self.dictionary_model.lookup_word)
-        self.createWord.connect(self.dictionary_model.add_word)
-        self.show()
-        self.available_speakers = available_speakers
+        for interval in intervals:
+            if "phone_intervals" in lookup or "word_intervals" in lookup:
+                continue
+            else:
+                interval_reg = IntervalTextRegion(
+                    interval,
+                    self.text_color,
+                    border=pg.mkPen(self.plot_theme.break_line_color, width=1),
+                    top_point=tier_top_point,
+                    height=self.per_tier_range,
+                    background_brush=self.background_brush,
+                    selected_brush=pg.mkBrush(self.selected_interval_color),
+                    plot_theme=self.plot_theme,
+                )
+                interval_reg.audioSelected.connect(self.setSelected)
+                interval_reg.setParentItem(self)
+
+            interval_reg.audioSelected.connect(self.audioSelected.emit)
+            interval_reg.viewRequested.connect(self.viewRequested.emit)
+            self.extra_tier_intervals[tier_name].append(interval_reg)
+
+    def clear_extra_tiers(self):
+        for tiers in self.extra_tier_intervals.values():
+            for tier in tiers:
+                if tier.scene() is not None:
+                    tier.scene().removeItem(tier)
+                tier.deleteLater()
+        self.extra_tier_intervals = {}
 
     def update_snap_mode(self, snap_mode):
         self.snap_mode = snap_mode
@@ -2669,12 +3022,6 @@ class UtteranceRegion(MfaRegion):
             if tier and isinstance(tier[0], IntervalTier):
                 tier[0].set_search_term(term)
 
-    @property
-    def painter_path_cache(self):
-        if self.parentItem() is None:
-            return self._painter_path_cache
-        return self.parentItem().painter_path_cache
-
     def update_edit_fields(self):
         begin, end = self.getRegion()
         self.text_item.text_item.update_times(begin, end)
@@ -2684,6 +3031,48 @@ class UtteranceRegion(MfaRegion):
             self.transcription_text.text_item.update_times(begin, end)
         self.phoneTiersChanged.emit(self.item)
 
+    def set_utterance(self, utterance: Utterance):
+        """
+        Rebind a pooled region to a different utterance of the same speaker
+
+        Parameters
+        ----------
+        utterance: :class:`~montreal_forced_aligner.db.Utterance`
+            Utterance to display
+        """
+        if self.timer.isActive():
+            self.timer.stop()
+            self.save_changes()
+        self.item = utterance
+        self.item_min = self.item.begin
+        self.item_max = self.item.end
+        if self.selection_model.settings.right_to_left:
+            self.item_min, self.item_max = -self.item_max, -self.item_min
+        with QtCore.QSignalBlocker(self):
+            self.setRegion((self.item_min, self.item_max))
+        self.update_bounds()
+        self.setZValue(0)
+        self.selected = self.selection_model.checkSelected(self.item.id)
+        self.setSelected(self.selected)
+        self.original_text = self.item.text
+        with QtCore.QSignalBlocker(self.text_edit):
+            self.text_edit.setPlainText(self.item.text)
+        if self.normalized_text is not None:
+            with QtCore.QSignalBlocker(self.normalized_text.text_edit):
+                self.normalized_text.text_edit.setPlainText(self.item.normalized_text)
+        if self.transcription_text is not None:
+            self.transcription_text.item = self.item
+            with QtCore.QSignalBlocker(self.transcription_text.text_edit):
+                self.transcription_text.text_edit.setPlainText(self.item.transcription_text)
+            self.update_transcription_highlight()
+        for text_region in (self.text_item, self.normalized_text, self.transcription_text):
+            if text_region is not None:
+                text_region.set_times(self.item.begin, self.item.end)
+        self.clear_extra_tiers()
+        for tier_name in self.extra_tier_points:
+            self.build_extra_tier(tier_name, self.extra_tiers[tier_name])
+        self.update_edit_fields()
+
     def change_editing(self, editable: bool):
         self.lines[0].movable = editable
         self.lines[1].movable = editable
@@ -2860,6 +3249,11 @@ class UtteranceRegion(MfaRegion):
         self.lines[0].view_max = self.selection_model.plot_max
         self.lines[1].view_min = self.selection_model.plot_min
         self.lines[1].view_max = self.selection_model.plot_max
+        if self.isVisibleTo(self.parentItem()):
+            # Pooled regions are hidden, their tiers are rebuilt when they are reused
+            for tiers in self.extra_tier_intervals.values():
+                if tiers and isinstance(tiers[0], IntervalTier):
+                    tiers[0].update_level_of_detail()
         self.update()
 
     def boundingRect(self):
@@ -3459,6 +3853,7 @@ class SpeakerTier(pg.GraphicsObject):
     receivedGestureEvent = QtCore.Signal(object)
     draggingLine = QtCore.Signal(object)
     lineDragFinished = QtCore.Signal(object)
+    max_pool_size = 32
 
     def __init__(
         self,
@@ -3509,7 +3904,7 @@ class SpeakerTier(pg.GraphicsObject):
         self.selection_model.selectionChanged.connect(self.update_select)
         self.selection_model.model().utterancesReady.connect(self.refresh)
         self.available_speakers = {}
-        self.painter_path_cache = {}
+        self.region_pool: typing.List[UtteranceRegion] = []
         self.grabGesture(QtCore.Qt.PinchGesture)
 
     def wheelEvent(self, ev):
@@ -3551,6 +3946,25 @@ class SpeakerTier(pg.GraphicsObject):
     def set_extra_tiers(self, extra_tiers):
         self.extra_tiers = extra_tiers
 
+    def set_speaker(
+        self, speaker_id: typing.Optional[int], speaker_name: str, top_point, bottom_point
+    ):
+        """
+        Rebind a recycled tier to a different speaker row, a speaker_id of None leaves the
+        tier unbound
+        """
+        self.reset_tier()
+        self.speaker_id = speaker_id
+        self.speaker_name = speaker_name
+        self.speaker_label.setText(self.speaker_name)
+        self.top_point = top_point
+        self.bottom_point = bottom_point
+        self.annotation_range = self.top_point - self.bottom_point
+        self.rect.setTop(self.top_point)
+        self.rect.setBottom(self.bottom_point)
+        if self.speaker_id is not None:
+            self._generate_picture()
+
     def set_available_speakers(self, available_speakers):
         self.available_speakers = available_speakers
 
@@ -3576,20 +3990,69 @@ class SpeakerTier(pg.GraphicsObject):
             break
 
     def reset_tier(self):
-        for reg in self.visible_utterances.values():
+        for reg in list(self.visible_utterances.values()) + self.region_pool:
             if reg.scene() is not None:
                 reg.scene().removeItem(reg)
         self.visible_utterances = {}
+        self.region_pool = []
+
+    def release_region(self, reg: UtteranceRegion):
+        reg.hide()
+        if len(self.region_pool) < self.max_pool_size:
+            self.region_pool.append(reg)
+        elif reg.scene() is not None:
+            reg.scene().removeItem(reg)
+
+    def acquire_region(self, utterance: Utterance) -> UtteranceRegion:
+        if self.region_pool:
+            reg = self.region_pool.pop()
+            reg.set_utterance(utterance)
+            reg.show()
+            return reg
+        reg = UtteranceRegion(
+            self,
+            utterance,
+            self.corpus_model,
+            self.file_model,
+            self.dictionary_model,
+            selection_model=self.selection_model,
+            extra_tiers=self.extra_tiers,
+            available_speakers=self.available_speakers,
+            bottom_point=self.bottom_point,
+            top_point=self.top_point,
+            search_term=self.search_term,
+        )
+        reg.sigRegionChanged.connect(self.check_utterance_bounds)
+        reg.sigRegionChangeFinished.connect(self.update_utterance)
+        reg.draggingLine.connect(self.draggingLine.emit)
+        reg.sigRegionChangeFinished.connect(self.lineDragFinished.emit)
+        reg.undoRequested.connect(self.corpus_model.undoRequested.emit)
+        reg.redoRequested.connect(self.corpus_model.redoRequested.emit)
+        reg.playRequested.connect(self.corpus_model.playRequested.emit)
+        reg.audioSelected.connect(self.selection_model.select_audio)
+        reg.viewRequested.connect(self.selection_model.set_view_times)
+        reg.textEdited.connect(self.update_utterance_text)
+        reg.phoneBoundaryChanged.connect(self.update_phone_boundaries)
+        reg.phoneIntervalChanged.connect(self.update_phone_interval)
+        reg.wordPronunciationChanged.connect(self.update_word_pronunciation)
+        reg.wordChanged.connect(self.update_word)
+        reg.phoneIntervalInserted.connect(self.insert_phone_interval)
+        reg.phoneIntervalDeleted.connect(self.delete_phone_interval)
+        reg.deleteReferenceAlignments.connect(self.delete_reference_alignments)
+        reg.transcribeRequested.connect(self.corpus_model.transcribeRequested.emit)
+        reg.selectRequested.connect(self.selection_model.update_select)
+        return reg
 
     def refresh(self, *args, reset_bounds=False):
         self.hide()
-        if self.selection_model.plot_min is None:
+        if self.speaker_id is None or self.selection_model.plot_min is None:
             return
+        begin = time.time()
         self.has_visible_utterances = False
         self.has_selected_utterances = False
         self.speaker_label.setPos(self.selection_model.plot_min, self.top_point)
         cleanup_ids = []
-        model_visible_utterances = self.selection_model.visible_utterances()
+        model_visible_utterances = self.selection_model.visible_utterances(self.speaker_id)
         visible_ids = {x.id: x for x in model_visible_utterances}
         for reg in self.visible_utterances.values():
             reg.hide()
@@ -3614,12 +4077,13 @@ class SpeakerTier(pg.GraphicsObject):
                     )
                 )
             ):
-                if reg.scene() is not None:
-                    reg.scene().removeItem(reg)
+                self.release_region(reg)
                 cleanup_ids.append(reg.item.id)
         self.visible_utterances = {
             k: v for k, v in self.visible_utterances.items() if k not in cleanup_ids
         }
+        pool_size = len(self.region_pool)
+        num_acquired = 0
         for u in model_visible_utterances:
             if u.speaker_id != self.speaker_id:
                 continue
@@ -3629,42 +4093,16 @@ class SpeakerTier(pg.GraphicsObject):
                 continue
             self.has_visible_utterances = True
             # Utterance region always at the top
-            reg = UtteranceRegion(
-                self,
-                u,
-                self.corpus_model,
-                self.file_model,
-                self.dictionary_model,
-                selection_model=self.selection_model,
-                extra_tiers=self.extra_tiers,
-                available_speakers=self.available_speakers,
-                bottom_point=self.bottom_point,
-                top_point=self.top_point,
-                search_term=self.search_term,
-            )
-            reg.sigRegionChanged.connect(self.check_utterance_bounds)
-            reg.sigRegionChangeFinished.connect(self.update_utterance)
-            reg.draggingLine.connect(self.draggingLine.emit)
-            reg.sigRegionChangeFinished.connect(self.lineDragFinished.emit)
-            reg.undoRequested.connect(self.corpus_model.undoRequested.emit)
-            reg.undoRequested.connect(self.corpus_model.undoRequested.emit)
-            reg.redoRequested.connect(self.corpus_model.redoRequested.emit)
-            reg.playRequested.connect(self.corpus_model.playRequested.emit)
-            reg.audioSelected.connect(self.selection_model.select_audio)
-            reg.viewRequested.connect(self.selection_model.set_view_times)
-            reg.textEdited.connect(self.update_utterance_text)
-            reg.phoneBoundaryChanged.connect(self.update_phone_boundaries)
-            reg.phoneIntervalChanged.connect(self.update_phone_interval)
-            reg.wordPronunciationChanged.connect(self.update_word_pronunciation)
-            reg.wordChanged.connect(self.update_word)
-            reg.phoneIntervalInserted.connect(self.insert_phone_interval)
-            reg.phoneIntervalDeleted.connect(self.delete_phone_interval)
-            reg.deleteReferenceAlignments.connect(self.delete_reference_alignments)
-            reg.transcribeRequested.connect(self.corpus_model.transcribeRequested.emit)
-            reg.selectRequested.connect(self.selection_model.update_select)
+            reg = self.acquire_region(u)
             self.visible_utterances[u.id] = reg
+            num_acquired += 1
 
         self.show()
+        num_reused = min(num_acquired, pool_size)
+        logger.debug(
+            f"Refreshing speaker tier {self.speaker_id} took {time.time() - begin:.3f} seconds "
+            f"({num_reused} regions reused, {num_acquired - num_reused} created)."
+        )
 
     def delete_reference_alignments(self, utterance: Utterance):
         self.selection_model.model().delete_reference_alignments(utterance)
@@ -3709,12 +4147,8 @@ class SpeakerTier(pg.GraphicsObject):
         self.selection_model.model().update_utterance_text(utterance, text=new_text)
 
     def update_select(self):
-        selected_rows = {x.id for x in self.selection_model.selected_utterances()}
         for r in self.visible_utterances.values():
-            if r.item.id in selected_rows:
-                r.setSelected(True)
-            else:
-                r.setSelected(False)
+            r.setSelected(self.selection_model.checkSelected(r.item.id))
 
     def check_utterance_bounds(self):
         reg: UtteranceRegion = self.sender()
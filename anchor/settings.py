@@ -56,6 +56,7 @@ class AnchorSettings(QtCore.QSettings):
     VOLUME = "anchor/audio/volume"
     AUDIO_DEVICE = "anchor/audio/device"
     ENABLE_FADE = "anchor/enable_fade"
+    BUFFER_PLAYBACK = "anchor/audio/buffer_playback"
 
     GEOMETRY = "anchor/MainWindow/geometry"
     WINDOW_STATE = "anchor/MainWindow/windowState"
@@ -109,6 +110,7 @@ class AnchorSettings(QtCore.QSettings):
     LTR = "Left-to-right"
 
     RESULTS_PER_PAGE = "anchor/results_per_page"
+    COMBINED_RESULT_COUNTS = "anchor/combined_result_counts"
     SPEC_MAX_TIME = "anchor/spectrogram/max_time"
     SPEC_DYNAMIC_RANGE = "anchor/spectrogram/dynamic_range"
     SPEC_N_FFT = "anchor/spectrogram/n_fft"
@@ -122,6 +124,14 @@ class AnchorSettings(QtCore.QSettings):
     CLUSTERING_METRIC = "anchor/clustering/metric"
 
     PLOT_THREAD_COUNT = "anchor/plot/max_thread_count"
+    WAVEFORM_CACHE_SIZE = "anchor/cache/waveform_peaks_size"
+    PITCH_CACHE_SIZE = "anchor/cache/pitch_track_size"
+    SPECTROGRAM_CACHE_SIZE = "anchor/cache/spectrogram_tiles_size"
+    FEATURE_CACHE_SIZE = "anchor/cache/mfcc_features_size"
+    PREFETCH_CACHE_SIZE = "anchor/cache/prefetch_size"
+    TRANSCODE_CACHE_SIZE = "anchor/cache/transcode_size"
+    TRANSCODE_AUDIO = "anchor/audio/transcode"
+    PREFETCH_COUNT = "anchor/plot/prefetch_count"
 
     PITCH_MAX_TIME = "anchor/pitch/max_time"
     PITCH_MIN_F0 = "anchor/pitch/min_f0"
@@ -130,6 +140,7 @@ class AnchorSettings(QtCore.QSettings):
     PITCH_FRAME_LENGTH = "anchor/pitch/frame_length"
     PITCH_DELTA_PITCH = "anchor/pitch/delta_pitch"
     PITCH_PENALTY_FACTOR = "anchor/pitch/penalty_factor"
+    PITCH_PRECOMPUTE = "anchor/pitch/precompute"
 
     TIER_NORMALIZED_VISIBLE = "anchor/tier/normalized_visible"
     TIER_MAX_SPEAKERS = "anchor/tier/max_speakers"
@@ -168,6 +179,7 @@ class AnchorSettings(QtCore.QSettings):
             AnchorSettings.VOLUME: 100,
             AnchorSettings.AUDIO_DEVICE: None,
             AnchorSettings.ENABLE_FADE: True,
+            AnchorSettings.BUFFER_PLAYBACK: True,
             AnchorSettings.GEOMETRY: None,
             AnchorSettings.WINDOW_STATE: None,
             AnchorSettings.FONT: QtGui.QFont("Noto Sans", 12).toString(),
@@ -185,6 +197,7 @@ class AnchorSettings(QtCore.QSettings):
             AnchorSettings.UNDO_KEYBIND: "Ctrl+Z",
             AnchorSettings.REDO_KEYBIND: "Ctrl+Shift+Z",
             AnchorSettings.RESULTS_PER_PAGE: 100,
+            AnchorSettings.COMBINED_RESULT_COUNTS: True,
             AnchorSettings.SPEC_MAX_TIME: 30,
             AnchorSettings.SPEC_DYNAMIC_RANGE: 50,
             AnchorSettings.SPEC_N_FFT: 256,
@@ -204,6 +217,7 @@ class AnchorSettings(QtCore.QSettings):
             AnchorSettings.PITCH_FRAME_LENGTH: 25,
             AnchorSettings.PITCH_PENALTY_FACTOR: 0.1,
             AnchorSettings.PITCH_DELTA_PITCH: 0.005,
+            AnchorSettings.PITCH_PRECOMPUTE: False,
             AnchorSettings.LOCKED: True,
             AnchorSettings.UTTERANCES_VISIBLE: True,
             AnchorSettings.DICTIONARY_VISIBLE: False,
@@ -226,6 +240,14 @@ class AnchorSettings(QtCore.QSettings):
             AnchorSettings.VAD_MODEL: "kaldi",
             AnchorSettings.SPECTRAL_FEATURES: "spectrogram",
             AnchorSettings.PLOT_THREAD_COUNT: 10,
+            AnchorSettings.WAVEFORM_CACHE_SIZE: 1024,
+            AnchorSettings.PITCH_CACHE_SIZE: 256,
+            AnchorSettings.SPECTROGRAM_CACHE_SIZE: 256,
+            AnchorSettings.FEATURE_CACHE_SIZE: 64,
+            AnchorSettings.PREFETCH_CACHE_SIZE: 128,
+            AnchorSettings.TRANSCODE_CACHE_SIZE: 4096,
+            AnchorSettings.TRANSCODE_AUDIO: False,
+            AnchorSettings.PREFETCH_COUNT: 2,
         }
         self.default_values.update(self.mfa_theme)
         self.border_radius = 5
@@ -322,6 +344,10 @@ class AnchorSettings(QtCore.QSettings):
     def temp_directory(self) -> pathlib.Path:
         return get_temporary_directory()
 
+    @property
+    def cache_directory(self) -> pathlib.Path:
+        return self.temp_directory.joinpath("anchor_cache")
+
     @property
     def font(self) -> QtGui.QFont:
         font = self.value(AnchorSettings.FONT)
@@ -213,6 +213,63 @@ class Ui_PreferencesDialog(object):
 
         self.formLayout.setWidget(10, QFormLayout.LabelRole, self.hfTokenLabel)
 
+        self.transcodeAudioLabel = QLabel(self.scrollAreaWidgetContents_3)
+        self.transcodeAudioLabel.setObjectName("transcodeAudioLabel")
+
+        self.formLayout.setWidget(15, QFormLayout.LabelRole, self.transcodeAudioLabel)
+
+        self.transcodeAudioCheckBox = QCheckBox(self.scrollAreaWidgetContents_3)
+        self.transcodeAudioCheckBox.setObjectName("transcodeAudioCheckBox")
+
+        self.formLayout.setWidget(15, QFormLayout.FieldRole, self.transcodeAudioCheckBox)
+
+        self.transcodeCacheSizeLabel = QLabel(self.scrollAreaWidgetContents_3)
+        self.transcodeCacheSizeLabel.setObjectName("transcodeCacheSizeLabel")
+
+        self.formLayout.setWidget(16, QFormLayout.LabelRole, self.transcodeCacheSizeLabel)
+
+        self.transcodeCacheSizeEdit = QSpinBox(self.scrollAreaWidgetContents_3)
+        self.transcodeCacheSizeEdit.setObjectName("transcodeCacheSizeEdit")
+        self.transcodeCacheSizeEdit.setMaximum(1000000)
+        self.transcodeCacheSizeEdit.setSingleStep(256)
+
+        self.formLayout.setWidget(16, QFormLayout.FieldRole, self.transcodeCacheSizeEdit)
+
+        self.waveformCacheSizeLabel = QLabel(self.scrollAreaWidgetContents_3)
+        self.waveformCacheSizeLabel.setObjectName("waveformCacheSizeLabel")
+
+        self.formLayout.setWidget(17, QFormLayout.LabelRole, self.waveformCacheSizeLabel)
+
+        self.waveformCacheSizeEdit = QSpinBox(self.scrollAreaWidgetContents_3)
+        self.waveformCacheSizeEdit.setObjectName("waveformCacheSizeEdit")
+        self.waveformCacheSizeEdit.setMaximum(100000)
+        self.waveformCacheSizeEdit.setSingleStep(64)
+
+        self.formLayout.setWidget(17, QFormLayout.FieldRole, self.waveformCacheSizeEdit)
+
+        self.prefetchCountLabel = QLabel(self.scrollAreaWidgetContents_3)
+        self.prefetchCountLabel.setObjectName("prefetchCountLabel")
+
+        self.formLayout.setWidget(18, QFormLayout.LabelRole, self.prefetchCountLabel)
+
+        self.prefetchCountEdit = QSpinBox(self.scrollAreaWidgetContents_3)
+        self.prefetchCountEdit.setObjectName("prefetchCountEdit")
+        self.prefetchCountEdit.setMaximum(10)
+
+        self.formLayout.setWidget(18, QFormLayout.FieldRole, self.prefetchCountEdit)
+
+        self.prefetchCacheSizeLabel = QLabel(self.scrollAreaWidgetContents_3)
+        self.prefetchCacheSizeLabel.setObjectName("prefetchCacheSizeLabel")
+
+        self.formLayout.setWidget(19, QFormLayout.LabelRole, self.prefetchCacheSizeLabel)
+
+        self.prefetchCacheSizeEdit = QSpinBox(self.scrollAreaWidgetContents_3)
+        self.prefetchCacheSizeEdit.setObjectName("prefetchCacheSizeEdit")
+        self.prefetchCacheSizeEdit.setMaximum(100000)
+        self.prefetchCacheSizeEdit.setSingleStep(64)
+
+        self.formLayout.setWidget(19, QFormLayout.FieldRole, self.prefetchCacheSizeEdit)
+
         self.scrollArea_3.setWidget(self.scrollAreaWidgetContents_3)
 
         self.verticalLayout_8.addWidget(self.scrollArea_3)
@@ -678,6 +735,30 @@ class Ui_PreferencesDialog(object):
 
         self.formLayout_6.setWidget(6, QFormLayout.LabelRole, self.label_24)
 
+        self.spectrogramCacheSizeLabel = QLabel(self.scrollAreaWidgetContents_4)
+        self.spectrogramCacheSizeLabel.setObjectName("spectrogramCacheSizeLabel")
+
+        self.formLayout_6.setWidget(7, QFormLayout.LabelRole, self.spectrogramCacheSizeLabel)
+
+        self.spectrogramCacheSizeEdit = QSpinBox(self.scrollAreaWidgetContents_4)
+        self.spectrogramCacheSizeEdit.setObjectName("spectrogramCacheSizeEdit")
+        self.spectrogramCacheSizeEdit.setMaximum(100000)
+        self.spectrogramCacheSizeEdit.setSingleStep(64)
+
+        self.formLayout_6.setWidget(7, QFormLayout.FieldRole, self.spectrogramCacheSizeEdit)
+
+        self.featureCacheSizeLabel = QLabel(self.scrollAreaWidgetContents_4)
+        self.featureCacheSizeLabel.setObjectName("featureCacheSizeLabel")
+
+        self.formLayout_6.setWidget(8, QFormLayout.LabelRole, self.featureCacheSizeLabel)
+
+        self.featureCacheSizeEdit = QSpinBox(self.scrollAreaWidgetContents_4)
+        self.featureCacheSizeEdit.setObjectName("featureCacheSizeEdit")
+        self.featureCacheSizeEdit.setMaximum(100000)
+        self.featureCacheSizeEdit.setSingleStep(64)
+
+        self.formLayout_6.setWidget(8, QFormLayout.FieldRole, self.featureCacheSizeEdit)
+
         self.verticalLayout_11.addLayout(self.formLayout_6)
 
         self.scrollArea_4.setWidget(self.scrollAreaWidgetContents_4)
@@ -785,6 +866,28 @@ class Ui_PreferencesDialog(object):
 
         self.formLayout_7.setWidget(7, QFormLayout.LabelRole, self.label_26)
 
+        self.pitchPrecomputeLabel = QLabel(self.scrollAreaWidgetContents_5)
+        self.pitchPrecomputeLabel.setObjectName("pitchPrecomputeLabel")
+
+        self.formLayout_7.setWidget(8, QFormLayout.LabelRole, self.pitchPrecomputeLabel)
+
+        self.pitchPrecomputeCheckBox = QCheckBox(self.scrollAreaWidgetContents_5)
+        self.pitchPrecomputeCheckBox.setObjectName("pitchPrecomputeCheckBox")
+
+        self.formLayout_7.setWidget(8, QFormLayout.FieldRole, self.pitchPrecomputeCheckBox)
+
+        self.pitchCacheSizeLabel = QLabel(self.scrollAreaWidgetContents_5)
+        self.pitchCacheSizeLabel.setObjectName("pitchCacheSizeLabel")
+
+        self.formLayout_7.setWidget(9, QFormLayout.LabelRole, self.pitchCacheSizeLabel)
+
+        self.pitchCacheSizeEdit = QSpinBox(self.scrollAreaWidgetContents_5)
+        self.pitchCacheSizeEdit.setObjectName("pitchCacheSizeEdit")
+        self.pitchCacheSizeEdit.setMaximum(100000)
+        self.pitchCacheSizeEdit.setSingleStep(64)
+
+        self.formLayout_7.setWidget(9, QFormLayout.FieldRole, self.pitchCacheSizeEdit)
+
         self.verticalLayout_13.addLayout(self.formLayout_7)
 
         self.scrollArea_5.setWidget(self.scrollAreaWidgetContents_5)
@@ -879,6 +982,24 @@ class Ui_PreferencesDialog(object):
         self.hfTokenLabel.setText(
             QCoreApplication.translate("PreferencesDialog", "HuggingFace request token", None)
         )
+        self.transcodeAudioLabel.setText(
+            QCoreApplication.translate("PreferencesDialog", "Transcode compressed audio?", None)
+        )
+        self.transcodeAudioCheckBox.setText("")
+        self.transcodeCacheSizeLabel.setText(
+            QCoreApplication.translate(
+                "PreferencesDialog", "Transcoded audio cache size (MB)", None
+            )
+        )
+        self.waveformCacheSizeLabel.setText(
+            QCoreApplication.translate("PreferencesDialog", "Waveform peak cache size (MB)", None)
+        )
+        self.prefetchCountLabel.setText(
+            QCoreApplication.translate("PreferencesDialog", "Utterances to prefetch", None)
+        )
+        self.prefetchCacheSizeLabel.setText(
+            QCoreApplication.translate("PreferencesDialog", "Prefetch cache size (MB)", None)
+        )
         self.tabWidget.setTabText(
             self.tabWidget.indexOf(self.generalTab),
             QCoreApplication.translate("PreferencesDialog", "General", None),
@@ -990,6 +1111,14 @@ class Ui_PreferencesDialog(object):
         self.label_24.setText(
             QCoreApplication.translate("PreferencesDialog", "Maximum visible time (s)", None)
         )
+        self.spectrogramCacheSizeLabel.setText(
+            QCoreApplication.translate(
+                "PreferencesDialog", "Spectrogram tile cache size (MB)", None
+            )
+        )
+        self.featureCacheSizeLabel.setText(
+            QCoreApplication.translate("PreferencesDialog", "MFCC feature cache size (MB)", None)
+        )
         self.tabWidget.setTabText(
             self.tabWidget.indexOf(self.spectrogramTab),
             QCoreApplication.translate("PreferencesDialog", "Spectrogram", None),
@@ -1017,6 +1146,15 @@ class Ui_PreferencesDialog(object):
         self.label_26.setText(
             QCoreApplication.translate("PreferencesDialog", "Maximum visible time (s)", None)
         )
+        self.pitchPrecomputeLabel.setText(
+            QCoreApplication.translate(
+                "PreferencesDialog", "Precompute pitch for whole files?", None
+            )
+        )
+        self.pitchPrecomputeCheckBox.setText("")
+        self.pitchCacheSizeLabel.setText(
+            QCoreApplication.translate("PreferencesDialog", "Pitch track cache size (MB)", None)
+        )
         self.tabWidget.setTabText(
             self.tabWidget.indexOf(self.pitchTab),
             QCoreApplication.translate("PreferencesDialog", "Pitch", None),
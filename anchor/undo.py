@@ -46,6 +46,7 @@ class CorpusCommand(QtGui.QUndoCommand):
         pass
 
     def update_data(self):
+        self.corpus_model.invalidate_result_counts("utterance")
         if self.resets_tier:
             self.corpus_model.refreshTiers.emit()
 
@@ -107,7 +108,8 @@ class DictionaryCommand(QtGui.QUndoCommand):
             with self.dictionary_model.corpus_model.session() as session:
                 self._redo(session)
                 session.commit()
-
+        self.dictionary_model.invalidate_result_counts("word")
+        self.dictionary_model.clear_page_cache()
         self.dictionary_model.update_data()
 
     def undo(self) -> None:
@@ -115,6 +117,8 @@ class DictionaryCommand(QtGui.QUndoCommand):
             with self.dictionary_model.corpus_model.session() as session:
                 self._undo(session)
                 session.commit()
+        self.dictionary_model.invalidate_result_counts("word")
+        self.dictionary_model.clear_page_cache()
         self.dictionary_model.update_data()
 
 
@@ -132,6 +136,9 @@ class SpeakerCommand(QtGui.QUndoCommand):
         pass
 
     def update_data(self):
+        self.speaker_model.invalidate_result_counts("speaker", "utterance")
+        self.speaker_model.clear_page_cache()
+        self.speaker_model.corpus_model.clear_page_cache()
         if self.auto_refresh:
             self.speaker_model.update_data()
         if self.resets_tier:
@@ -439,6 +446,7 @@ class UpdateUtteranceTimesCommand(FileCommand):
 
     def update_data(self):
         super().update_data()
+        self.file_model.invalidate_utterance_index()
         self.corpus_model.changeCommandFired.emit()
         self.corpus_model.update_utterance_table_row(self.utterance)
 
@@ -1219,6 +1227,8 @@ class ChangeSpeakerCommand(SpeakerCommand):
     def finish_changing_speaker(self, data: typing.List[typing.List[int]]):
         self.data = data
         self.utterance_ids = [x[0] for x in self.data]
+        self.speaker_model.invalidate_result_counts("speaker", "utterance")
+        self.speaker_model.corpus_model.invalidate_cached_rows(self.utterance_ids)
         self.speaker_model.corpus_model.runFunction.emit(
             "Recalculating speaker ivectors",
             self.finish_recalculate,
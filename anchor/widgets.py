@@ -25,6 +25,7 @@ from montreal_forced_aligner.utils import DatasetType, inspect_database, mfa_ope
 from PySide6 import QtCore, QtGui, QtMultimedia, QtSvgWidgets, QtWidgets
 
 import anchor.resources_rc  # noqa
+from anchor.audio import AudioSource, AudioSourceClosedError
 from anchor.models import (
     AcousticModelTableModel,
     AlignmentAnalysisModel,
@@ -74,6 +75,67 @@ class ErrorButtonBox(QtWidgets.QDialogButtonBox):
         self.addButton(self.report_bug_button, QtWidgets.QDialogButtonBox.ButtonRole.ActionRole)
 
 
+class AudioSourceDevice(QtCore.QIODevice):  # pragma: no cover
+    """
+    Pull-mode device that reads a frame range of an audio source block by block as the audio
+    sink asks for more data, rather than decoding the whole range up front
+
+    Parameters
+    ----------
+    audio_source: :class:`~anchor.audio.AudioSource`
+        Audio source to play
+    begin_frame: int
+        First frame to play
+    end_frame: int
+        Frame to stop playing at
+    fade_length: int
+        Number of frames to fade in over
+    """
+
+    def __init__(
+        self,
+        audio_source: AudioSource,
+        begin_frame: int,
+        end_frame: int,
+        fade_length: int = 0,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.audio_source = audio_source
+        self.begin_frame = begin_frame
+        self.end_frame = end_frame
+        self.current_frame = begin_frame
+        self.fade = np.linspace(0.1, 1.0, fade_length) if fade_length > 0 else None
+        self.frame_size = 2 * audio_source.num_channels
+
+    def isSequential(self) -> bool:
+        return True
+
+    def bytesAvailable(self) -> int:
+        remaining = (self.end_frame - self.current_frame) * self.frame_size
+        return remaining + super().bytesAvailable()
+
+    def readData(self, maxlen: int) -> bytes:
+        num_frames = min(maxlen // self.frame_size, self.end_frame - self.current_frame)
+        if num_frames <= 0:
+            return b""
+        try:
+            y = self.audio_source.read_frames(self.current_frame, self.current_frame + num_frames)
+        except AudioSourceClosedError:
+            return b""
+        if len(y.shape) == 1:
+            y = y[:, np.newaxis]
+        offset = self.current_frame - self.begin_frame
+        if self.fade is not None and offset < self.fade.shape[0]:
+            fade = self.fade[offset : offset + y.shape[0]]
+            y[: fade.shape[0]] *= fade[:, np.newaxis]
+        self.current_frame += y.shape[0]
+        return (np.clip(y, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+    def writeData(self, data) -> int:
+        return -1
+
+
 class MediaPlayer(QtMultimedia.QMediaPlayer):  # pragma: no cover
     timeChanged = QtCore.Signal(object)
     audioReady = QtCore.Signal(object)
@@ -107,10 +169,176 @@ class MediaPlayer(QtMultimedia.QMediaPlayer):  # pragma: no cover
         self.fade_in_anim.setKeyValueAt(0.1, 0.1)
 
         self.file_path = None
+        self.audio_sink: Optional[QtMultimedia.QAudioSink] = None
+        self.audio_device: Optional[AudioSourceDevice] = None
+        self.sink_start_time = None
+        self.sink_paused_time = None
+        self.sink_position = None
+        self.sink_fallback = False
+        self.play_when_loaded = False
+        self.mediaStatusChanged.connect(self.check_play_when_loaded)
+        self.sink_state = QtMultimedia.QMediaPlayer.PlaybackState.StoppedState
+        self.sink_timer = QtCore.QTimer(self)
+        self.sink_timer.setInterval(20)
+        self.sink_timer.timeout.connect(self.update_sink_position)
         self.set_volume(self.settings.value(self.settings.VOLUME))
 
     def setMuted(self, muted: bool):
         self.audioOutput().setMuted(muted)
+        if self.audio_sink is not None:
+            self.audio_sink.setVolume(self.sink_volume())
+
+    def sink_volume(self) -> float:
+        if self.audioOutput().isMuted():
+            return 0.0
+        return self.fade_in_anim.endValue()
+
+    def buffer_playback_available(self) -> bool:
+        if not self.settings.value(self.settings.BUFFER_PLAYBACK) or self.sink_fallback:
+            return False
+        if self.selection_model is None:
+            return False
+        return self.selection_model.model().audio_source is not None
+
+    def playbackState(self) -> QtMultimedia.QMediaPlayer.PlaybackState:
+        if self.audio_sink is not None:
+            return self.sink_state
+        return super(MediaPlayer, self).playbackState()
+
+    def set_sink_state(self, state: QtMultimedia.QMediaPlayer.PlaybackState):
+        if state == self.sink_state:
+            return
+        self.sink_state = state
+        self.playbackStateChanged.emit(state)
+        self.playingChanged.emit(state == QtMultimedia.QMediaPlayer.PlaybackState.PlayingState)
+
+    def play_buffer(self):
+        """
+        Play the selected range straight from the audio source through a
+        :class:`~PySide6.QtMultimedia.QAudioSink`, so that playback starts without opening the
+        file and stops on the last selected sample
+        """
+        if (
+            self.audio_sink is not None
+            and self.sink_state == QtMultimedia.QMediaPlayer.PlaybackState.PausedState
+        ):
+            self.sink_paused_time = None
+            self.audio_sink.resume()
+            self.sink_timer.start()
+            self.set_sink_state(QtMultimedia.QMediaPlayer.PlaybackState.PlayingState)
+            return
+        self.stop_sink()
+        audio_source = self.selection_model.model().audio_source
+        begin = self.startTime()
+        end = self.maxTime()
+        if self.sink_position is not None and begin <= self.sink_position < end:
+            begin = self.sink_position
+        self.sink_position = None
+        begin_frame = audio_source.time_to_frame(begin)
+        end_frame = audio_source.time_to_frame(end)
+        if end_frame <= begin_frame:
+            return
+        audio_format = QtMultimedia.QAudioFormat()
+        audio_format.setSampleRate(audio_source.sample_rate)
+        audio_format.setChannelCount(audio_source.num_channels)
+        audio_format.setSampleFormat(QtMultimedia.QAudioFormat.SampleFormat.Int16)
+        device = self._audio_output.device()
+        if not device.isFormatSupported(audio_format):
+            logger.info(f"{device.description()} does not support {audio_format}")
+            self.fall_back_to_media_player()
+            return
+        fade_length = 0
+        if self.settings.value(self.settings.ENABLE_FADE):
+            fade_length = min(int(0.01 * audio_source.sample_rate), end_frame - begin_frame)
+        self.audio_device = AudioSourceDevice(
+            audio_source, begin_frame, end_frame, fade_length=fade_length, parent=self
+        )
+        self.audio_device.open(QtCore.QIODevice.OpenModeFlag.ReadOnly)
+        self.audio_sink = QtMultimedia.QAudioSink(device, audio_format, self)
+        self.audio_sink.setVolume(self.sink_volume())
+        self.audio_sink.stateChanged.connect(self.handle_sink_state)
+        self.sink_start_time = begin_frame / audio_source.sample_rate
+        self.audio_sink.start(self.audio_device)
+        self.sink_timer.start()
+        self.set_sink_state(QtMultimedia.QMediaPlayer.PlaybackState.PlayingState)
+
+    def fall_back_to_media_player(self):
+        # Anything the sink cannot play for this file goes through the media player instead
+        self.stop_sink()
+        self.sink_fallback = True
+        self.play_when_loaded = True
+        self.load_new_file(fallback=True)
+
+    def check_play_when_loaded(self, status: QtMultimedia.QMediaPlayer.MediaStatus):
+        if not self.play_when_loaded:
+            return
+        if status in {
+            QtMultimedia.QMediaPlayer.MediaStatus.BufferedMedia,
+            QtMultimedia.QMediaPlayer.MediaStatus.LoadedMedia,
+        }:
+            self.play_when_loaded = False
+            self.play()
+        elif status == QtMultimedia.QMediaPlayer.MediaStatus.InvalidMedia:
+            self.play_when_loaded = False
+
+    def handle_sink_state(self, state: QtMultimedia.QAudio.State):
+        if self.audio_sink is None:
+            return
+        if state == QtMultimedia.QAudio.State.IdleState:
+            self.timeChanged.emit(self.maxTime())
+            self.stop_sink()
+        elif state == QtMultimedia.QAudio.State.StoppedState:
+            if self.audio_sink.error() != QtMultimedia.QAudio.Error.NoError:
+                logger.info(f"Audio sink error: {self.audio_sink.error()}")
+                self.fall_back_to_media_player()
+
+    def sink_played_time(self) -> float:
+        """
+        Time of the audio the sink has played so far, which lags the data it has pulled from
+        the device by whatever is still in its buffer
+        """
+        if self.sink_paused_time is not None:
+            return self.sink_paused_time
+        buffered = max(self.audio_sink.bufferSize() - self.audio_sink.bytesFree(), 0)
+        buffered_usecs = self.audio_sink.format().durationForBytes(buffered)
+        played_usecs = self.audio_sink.processedUSecs() - buffered_usecs
+        return self.sink_start_time + max(played_usecs, 0) / 1000000
+
+    def update_sink_position(self):
+        if self.audio_sink is None:
+            self.sink_timer.stop()
+            return
+        self.timeChanged.emit(self.currentTime())
+
+    def stop_sink(self):
+        self.sink_timer.stop()
+        if self.audio_sink is None:
+            return
+        audio_sink = self.audio_sink
+        self.audio_sink = None
+        self.sink_paused_time = None
+        audio_sink.stateChanged.disconnect(self.handle_sink_state)
+        audio_sink.stop()
+        audio_sink.deleteLater()
+        if self.audio_device is not None:
+            self.audio_device.close()
+            self.audio_device.deleteLater()
+            self.audio_device = None
+        self.set_sink_state(QtMultimedia.QMediaPlayer.PlaybackState.StoppedState)
+
+    def pause(self) -> None:
+        if self.audio_sink is not None:
+            # The buffer size is only reported while the sink is active
+            self.sink_paused_time = self.sink_played_time()
+            self.audio_sink.suspend()
+            self.sink_timer.stop()
+            self.set_sink_state(QtMultimedia.QMediaPlayer.PlaybackState.PausedState)
+            return
+        super(MediaPlayer, self).pause()
+
+    def stop(self) -> None:
+        self.stop_sink()
+        super(MediaPlayer, self).stop()
 
     def handle_error(self, *args):
         logger.info("ERROR")
@@ -119,6 +347,9 @@ class MediaPlayer(QtMultimedia.QMediaPlayer):  # pragma: no cover
     def play(self) -> None:
         if self.startTime() is None:
             return
+        if self.buffer_playback_available():
+            self.play_buffer()
+            return
         if self.mediaStatus() not in {
             QtMultimedia.QMediaPlayer.MediaStatus.BufferedMedia,
             QtMultimedia.QMediaPlayer.MediaStatus.LoadedMedia,
@@ -182,6 +413,7 @@ class MediaPlayer(QtMultimedia.QMediaPlayer):  # pragma: no cover
         self.selection_model.fileChanged.connect(self.load_new_file)
         self.selection_model.viewChanged.connect(self.update_times)
         self.selection_model.selectionAudioChanged.connect(self.update_selection_times)
+        self.selection_model.model().waveformReady.connect(self.check_fallback_source)
 
     def set_volume(self, volume: int):
         self.settings.setValue(self.settings.VOLUME, volume)
@@ -194,6 +426,8 @@ class MediaPlayer(QtMultimedia.QMediaPlayer):  # pragma: no cover
         )
         self.audioOutput().setVolume(linearVolume)
         self.fade_in_anim.setEndValue(linearVolume)
+        if self.audio_sink is not None:
+            self.audio_sink.setVolume(self.sink_volume())
 
     def volume(self) -> int:
         if self.audioOutput() is None:
@@ -222,7 +456,23 @@ class MediaPlayer(QtMultimedia.QMediaPlayer):  # pragma: no cover
             self.stop()
             self.setCurrentTime(self.startTime())
 
-    def load_new_file(self, *args):
+    def check_fallback_source(self):
+        # Files that could not be opened for buffer playback go through the media player
+        if not self.settings.value(self.settings.BUFFER_PLAYBACK):
+            return
+        if self.selection_model.model().audio_source is None:
+            self.load_new_file(fallback=True)
+
+    def load_new_file(self, *args, fallback=False):
+        self.stop_sink()
+        if not fallback:
+            self.sink_fallback = False
+            self.play_when_loaded = False
+        if not fallback and self.settings.value(self.settings.BUFFER_PLAYBACK):
+            super(MediaPlayer, self).stop()
+            if self.selection_model.model().audio_source is not None:
+                self.setSource(QtCore.QUrl())
+            return
         if self.playbackState() in {
             QtMultimedia.QMediaPlayer.PlaybackState.PlayingState,
             QtMultimedia.QMediaPlayer.PlaybackState.PausedState,
@@ -244,12 +494,23 @@ class MediaPlayer(QtMultimedia.QMediaPlayer):  # pragma: no cover
         self.setSource(f"file:///{new_file}")
 
     def currentTime(self):
+        if self.audio_sink is not None:
+            return self.sink_played_time()
+        if self.sink_position is not None and self.buffer_playback_available():
+            return self.sink_position
         pos = self.position()
         return pos / 1000
 
     def setCurrentTime(self, time):
         if time is None:
             time = 0
+        if self.audio_sink is not None or self.buffer_playback_available():
+            playing = self.playbackState() == QtMultimedia.QMediaPlayer.PlaybackState.PlayingState
+            self.stop_sink()
+            self.sink_position = time
+            if playing:
+                self.play_buffer()
+            return
         pos = int(time * 1000)
         self.setPosition(pos)
 
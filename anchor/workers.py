@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import collections
+import contextlib
 import csv
 import datetime
 import logging
@@ -11,6 +12,7 @@ import threading
 import time
 import traceback
 import typing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from queue import Empty, Queue
 from threading import Lock
@@ -19,17 +21,16 @@ import dataclassy
 import librosa
 import numpy as np
 import psycopg2.errors
-import scipy
-import scipy.signal
 import soundfile
 import sqlalchemy
 import tqdm
 import yaml
 from _kalpy.feat import compute_pitch
 from _kalpy.ivector import Plda, ivector_normalize_length
-from _kalpy.matrix import DoubleVector, FloatVector
+from _kalpy.matrix import DoubleVector, FloatMatrix, FloatVector
 from kalpy.feat.mfcc import MfccComputer
 from kalpy.feat.pitch import PitchComputer
+from kalpy.utils import read_kaldi_object
 from montreal_forced_aligner import config
 from montreal_forced_aligner.alignment import PretrainedAligner
 from montreal_forced_aligner.config import IVECTOR_DIMENSION, XVECTOR_DIMENSION
@@ -101,6 +102,23 @@ from sklearn import discriminant_analysis
 from sqlalchemy.orm import joinedload, selectinload, subqueryload
 
 import anchor.db
+from anchor.audio import (
+    ArrayCache,
+    AudioSource,
+    AudioSourceClosedError,
+    PeakCache,
+    PeakPyramid,
+    PitchCache,
+    PitchTrack,
+    TRANSCODE_DTYPES,
+    TranscodeCache,
+    ViewAudio,
+    min_max_envelope,
+    needs_transcoding,
+    resample,
+    transcode_audio,
+    transcoded_subtype,
+)
 from anchor.settings import AnchorSettings
 
 if typing.TYPE_CHECKING:
@@ -186,6 +204,242 @@ def load_speaker_space(
     return lda
 
 
+def peak_cache(settings: AnchorSettings) -> PeakCache:
+    return PeakCache(
+        settings.cache_directory.joinpath("peaks"),
+        settings.value(settings.WAVEFORM_CACHE_SIZE) * 1024 * 1024,
+    )
+
+
+def transcode_cache(settings: AnchorSettings) -> TranscodeCache:
+    return TranscodeCache(
+        settings.cache_directory.joinpath("transcoded"),
+        settings.value(settings.TRANSCODE_CACHE_SIZE) * 1024 * 1024,
+    )
+
+
+def pitch_cache(settings: AnchorSettings) -> PitchCache:
+    return PitchCache(
+        settings.cache_directory.joinpath("pitch"),
+        settings.value(settings.PITCH_CACHE_SIZE) * 1024 * 1024,
+    )
+
+
+def pitch_options(settings: AnchorSettings) -> typing.Tuple:
+    return (
+        settings.value(settings.PITCH_MIN_F0),
+        settings.value(settings.PITCH_MAX_F0),
+        settings.value(settings.PITCH_FRAME_LENGTH),
+        settings.value(settings.PITCH_PENALTY_FACTOR),
+        settings.value(settings.PITCH_DELTA_PITCH),
+    )
+
+
+def _seek_equal(column, value):
+    if value is None:
+        return column.is_(None)
+    return column == value
+
+
+def _seek_past(column, value, descending: bool):
+    # Postgres sorts NULLs last in ascending order and first in descending order
+    if descending:
+        if value is None:
+            return column.isnot(None)
+        return column < value
+    if value is None:
+        return None
+    return sqlalchemy.or_(column > value, column.is_(None))
+
+
+def keyset_paginate(
+    query: sqlalchemy.orm.Query,
+    columns: typing.List,
+    order: typing.List[typing.Tuple[int, bool]],
+    seek_key: typing.Optional[typing.Tuple] = None,
+    seek_previous: bool = False,
+    aggregate: bool = False,
+) -> sqlalchemy.orm.Query:
+    """
+    Order a query for pagination and, if a seek key is given, restrict it to the rows
+    following (or preceding) that key so that page flips do not need an OFFSET scan
+
+    Parameters
+    ----------
+    query: :class:`sqlalchemy.orm.Query`
+        Filtered query to paginate
+    columns: list
+        Columns selected by the query
+    order: list[tuple[int, bool]]
+        Indices into ``columns`` to sort by along with whether they are descending, the last
+        of which must be a unique tie-breaker
+    seek_key: tuple, optional
+        Values of the ``order`` columns for the boundary row of the current page
+    seek_previous: bool
+        Flag for seeking the page before ``seek_key``, rows are returned in reverse order
+    aggregate: bool
+        Flag for applying the seek condition to a grouped query
+
+    Returns
+    -------
+    :class:`sqlalchemy.orm.Query`
+        Ordered query
+    """
+    reverse = seek_key is not None and seek_previous
+    query = query.order_by(
+        *[
+            columns[i].desc() if descending != reverse else columns[i].asc()
+            for i, descending in order
+        ]
+    )
+    if seek_key is None:
+        return query
+    clauses = []
+    for position, (i, descending) in enumerate(order):
+        past = _seek_past(columns[i], seek_key[position], descending != seek_previous)
+        if past is None:
+            continue
+        clauses.append(
+            sqlalchemy.and_(
+                *[
+                    _seek_equal(columns[j], seek_key[k])
+                    for k, (j, _) in enumerate(order[:position])
+                ],
+                past,
+            )
+        )
+    condition = sqlalchemy.or_(*clauses) if clauses else sqlalchemy.false()
+    if aggregate:
+        return query.having(condition)
+    return query.filter(condition)
+
+
+def fetch_page(
+    query: sqlalchemy.orm.Query,
+    limit: int,
+    current_offset: int = 0,
+    seek_key: typing.Optional[typing.Tuple] = None,
+    seek_previous: bool = False,
+    with_count: bool = False,
+) -> typing.Tuple[typing.List, typing.Optional[int]]:
+    """
+    Fetch a page of rows from a query ordered by :func:`keyset_paginate`, optionally
+    counting the full result set in the same round trip
+
+    Parameters
+    ----------
+    query: :class:`sqlalchemy.orm.Query`
+        Ordered query
+    limit: int
+        Number of rows per page
+    current_offset: int
+        Offset of the page, ignored when seeking
+    seek_key: tuple, optional
+        Seek key passed to :func:`keyset_paginate`
+    seek_previous: bool
+        Flag for seeking the previous page
+    with_count: bool
+        Flag for also returning the total number of rows matching the query
+
+    Returns
+    -------
+    list
+        Rows of the page in display order
+    int, optional
+        Total number of rows if ``with_count`` is set
+    """
+    page = query
+    if with_count:
+        page = page.add_columns(sqlalchemy.func.count().over())
+    page = page.limit(limit)
+    if seek_key is None:
+        page = page.offset(current_offset)
+    rows = page.all()
+    if seek_key is not None and seek_previous:
+        rows.reverse()
+    total = None
+    if with_count:
+        if rows:
+            total = rows[0][-1]
+            rows = [r[:-1] for r in rows]
+        elif current_offset == 0 and seek_key is None:
+            total = 0
+        else:
+            total = query.count()
+    return rows, total
+
+
+def estimate_count(query: sqlalchemy.orm.Query) -> int:
+    """
+    Estimate the number of rows a query returns from the query planner without running it
+
+    Parameters
+    ----------
+    query: :class:`sqlalchemy.orm.Query`
+        Query to estimate
+
+    Returns
+    -------
+    int
+        Estimated number of rows
+    """
+    statement = query.statement.compile(
+        dialect=query.session.get_bind().dialect, compile_kwargs={"literal_binds": True}
+    )
+    plan = (
+        query.session.connection()
+        .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}")
+        .scalar()
+    )
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def page_keys(
+    rows: typing.List, order: typing.List[typing.Tuple[int, bool]]
+) -> typing.Optional[typing.Tuple[typing.Tuple, typing.Tuple]]:
+    """
+    Get the seek keys for the first and last rows of a page
+
+    Parameters
+    ----------
+    rows: list
+        Rows of the page, in display order
+    order: list[tuple[int, bool]]
+        Sort order passed to :func:`keyset_paginate`
+
+    Returns
+    -------
+    tuple[tuple, tuple], optional
+        Keys of the first and last rows, or None for an empty page
+    """
+    if not rows:
+        return None
+    return (
+        tuple(rows[0][i] for i, _ in order),
+        tuple(rows[-1][i] for i, _ in order),
+    )
+
+
+class ViewGeneration:
+    """
+    Counter shared between a view and the workers it launches, advanced every time the
+    view changes so that workers computing for an older view can bail out early
+    """
+
+    def __init__(self):
+        self._value = 0
+        self._lock = Lock()
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def advance(self) -> int:
+        with self._lock:
+            self._value += 1
+            return self._value
+
+
 class WorkerSignals(QtCore.QObject):
     """
     Defines the signals available from a running worker thread.
@@ -252,12 +506,52 @@ class Worker(QtCore.QRunnable):
         if not use_mp:
             self.kwargs["progress_callback"] = self.progress_callback
         self.kwargs["stopped"] = self.stopped
+        self.generation = None
+        self.generation_token = None
+        self._db_connection = None
+        self._connection_lock = Lock()
 
     def _run(self):
         pass
 
     def cancel(self):
         self.stopped.set()
+        with self._connection_lock:
+            if self._db_connection is not None:
+                try:
+                    self._db_connection.cancel()
+                except Exception:
+                    logger.debug("Could not cancel running statement", exc_info=True)
+
+    @contextlib.contextmanager
+    def cancellable(self, session: sqlalchemy.orm.Session):
+        """
+        Context for statements that should be cancelled on the server when the worker is
+        cancelled, rather than running to completion after their results are no longer needed
+
+        Parameters
+        ----------
+        session: :class:`sqlalchemy.orm.Session`
+            Session to run statements in
+        """
+        connection = session.connection().connection.dbapi_connection
+        with self._connection_lock:
+            self._db_connection = connection
+        try:
+            yield
+        finally:
+            with self._connection_lock:
+                self._db_connection = None
+
+    def set_generation(self, generation: ViewGeneration):
+        self.generation = generation
+        self.generation_token = generation.value
+
+    @property
+    def stale(self) -> bool:
+        if self.stopped.is_set():
+            return True
+        return self.generation is not None and self.generation.value != self.generation_token
 
     @QtCore.Slot()
     def run(self):
@@ -282,8 +576,10 @@ class Worker(QtCore.QRunnable):
                 result = self._run()
         except Exception:
             exctype, value = sys.exc_info()[:2]
-
-            self.signals.error.emit((exctype, value, traceback.format_exc()))
+            if self.stopped.is_set():
+                logger.debug(f"Cancelled worker raised {exctype.__name__}: {value}")
+            else:
+                self.signals.error.emit((exctype, value, traceback.format_exc()))
         else:
             self.signals.result.emit(result)  # Return the result of the processing
         finally:
@@ -1048,7 +1344,7 @@ class QueryUtterancesWorker(Worker):
         self.session = session
 
     def _run(self):
-        with self.session() as session:
+        with self.session() as session, self.cancellable(session):
             c = session.query(Corpus).first()
             count_only = self.kwargs.get("count", False)
             has_ivectors = self.kwargs.get("has_ivectors", False)
@@ -1109,28 +1405,38 @@ class QueryUtterancesWorker(Worker):
                     utterances = utterances.filter(column != None)  # noqa
             if count_only:
                 try:
+                    if self.kwargs.get("estimate", False):
+                        return estimate_count(utterances)
                     return utterances.count()
                 except psycopg2.errors.InvalidRegularExpression:
                     return 0
             if self.progress_callback is not None:
                 self.progress_callback.update_total(self.kwargs.get("limit", 100))
             if sort_index is not None and sort_index + 3 <= len(columns) - 1:
-                sort_column = columns[sort_index + 3]
-                if self.kwargs.get("sort_desc", False):
-                    sort_column = sort_column.desc()
-                utterances = utterances.order_by(sort_column, Utterance.id)
+                order = [(sort_index + 3, self.kwargs.get("sort_desc", False)), (0, False)]
             else:
-                utterances = utterances.order_by(File.name, Utterance.begin)
-            utterances = utterances.limit(self.kwargs.get("limit", 100)).offset(
-                self.kwargs.get("current_offset", 0)
-            )
+                order = [(4, False), (6, False), (0, False)]
+            seek_key = self.kwargs.get("seek_key", None)
+            seek_previous = self.kwargs.get("seek_previous", False)
+            utterances = keyset_paginate(utterances, columns, order, seek_key, seek_previous)
             data = []
             indices = []
             file_indices = []
             speaker_indices = []
             reversed_indices = {}
+            keys = None
+            total = None
             try:
-                for i, u in enumerate(utterances):
+                rows, total = fetch_page(
+                    utterances,
+                    self.kwargs.get("limit", 100),
+                    self.kwargs.get("current_offset", 0),
+                    seek_key,
+                    seek_previous,
+                    self.kwargs.get("with_count", False),
+                )
+                keys = page_keys(rows, order)
+                for i, u in enumerate(rows):
                     if self.stopped is not None and self.stopped.is_set():
                         return
                     data.append(list(u[3:]))
@@ -1143,7 +1449,7 @@ class QueryUtterancesWorker(Worker):
 
             except psycopg2.errors.InvalidRegularExpression:
                 pass
-        return data, indices, file_indices, speaker_indices, reversed_indices
+        return data, indices, file_indices, speaker_indices, reversed_indices, keys, total
 
 
 class QuerySpeakersWorker(Worker):
@@ -1152,7 +1458,7 @@ class QuerySpeakersWorker(Worker):
         self.session = session
 
     def _run(self):
-        with self.session() as session:
+        with self.session() as session, self.cancellable(session):
             c = session.query(Corpus).first()
             text_filter = self.kwargs.get("text_filter", None)
             speaker_filter = self.kwargs.get("speaker_filter", None)
@@ -1163,6 +1469,8 @@ class QuerySpeakersWorker(Worker):
                     filter_regex = text_filter.generate_expression(posix=True)
                     text_column = Speaker.name
                     speakers = speakers.filter(text_column.op("~")(filter_regex))
+                if self.kwargs.get("estimate", False):
+                    return estimate_count(speakers)
                 return speakers.count()
 
             if self.progress_callback is not None:
@@ -1208,16 +1516,25 @@ class QuerySpeakersWorker(Worker):
                     text_column = sqlalchemy.func.lower(text_column)
                 speakers = speakers.filter(text_column.op("~")(filter_regex))
             if sort_index is not None:
-                sort_column = columns[sort_index + 1]
-                if self.kwargs.get("sort_desc", False):
-                    sort_column = sort_column.desc()
-                speakers = speakers.order_by(sort_column)
-            speakers = speakers.limit(self.kwargs.get("limit", 100)).offset(
-                self.kwargs.get("current_offset", 0)
+                order = [(sort_index + 1, self.kwargs.get("sort_desc", False)), (0, False)]
+            else:
+                order = [(0, False)]
+            seek_key = self.kwargs.get("seek_key", None)
+            seek_previous = self.kwargs.get("seek_previous", False)
+            speakers = keyset_paginate(
+                speakers, columns, order, seek_key, seek_previous, aggregate=True
+            )
+            rows, total = fetch_page(
+                speakers,
+                self.kwargs.get("limit", 100),
+                self.kwargs.get("current_offset", 0),
+                seek_key,
+                seek_previous,
+                self.kwargs.get("with_count", False),
             )
             data = []
             indices = []
-            for w in speakers:
+            for w in rows:
                 if self.stopped is not None and self.stopped.is_set():
                     return
                 d = list(w)
@@ -1225,7 +1542,7 @@ class QuerySpeakersWorker(Worker):
                 data.append(d)
                 if self.progress_callback is not None:
                     self.progress_callback.increment_progress(1)
-        return data, indices
+        return data, indices, page_keys(rows, order), total
 
 
 class ClusterSpeakerUtterancesWorker(Worker):
@@ -1519,7 +1836,7 @@ class AlignmentAnalysisWorker(Worker):
         if not count_only and self.progress_callback is not None:
             self.progress_callback.update_total(self.limit)
 
-        with self.session() as session:
+        with self.session() as session, self.cancellable(session):
             indices = []
             file_indices = []
             speaker_indices = []
@@ -1636,22 +1953,33 @@ class AlignmentAnalysisWorker(Worker):
                 query = query.filter(Word.word.op("~")(filter_regex))
             if count_only:
                 try:
+                    if self.kwargs.get("estimate", False):
+                        return estimate_count(query)
                     return query.count()
                 except psycopg2.errors.InvalidRegularExpression:
                     return 0
             if self.sort_index is not None and self.sort_index + 6 <= len(columns) - 1:
-                sort_column = columns[self.sort_index + 6]
-                if self.sort_desc:
-                    sort_column = sort_column.desc()
-                query = query.order_by(sort_column, Utterance.id, PhoneInterval.begin)
+                order = [(self.sort_index + 6, self.sort_desc), (0, False)]
             else:
-                if self.word_mode:
-                    query = query.order_by(duration_column, Utterance.id, WordInterval.id)
-                else:
-                    query = query.order_by(duration_column, Utterance.id, PhoneInterval.begin)
-            query = query.limit(self.limit).offset(self.current_offset)
+                order = [(9, False), (0, False)]
+            seek_key = self.kwargs.get("seek_key", None)
+            seek_previous = self.kwargs.get("seek_previous", False)
+            query = keyset_paginate(
+                query, columns, order, seek_key, seek_previous, aggregate=self.word_mode
+            )
+            keys = None
+            total = None
             try:
-                for i, u in enumerate(query):
+                rows, total = fetch_page(
+                    query,
+                    self.limit,
+                    self.current_offset,
+                    seek_key,
+                    seek_previous,
+                    self.kwargs.get("with_count", False),
+                )
+                keys = page_keys(rows, order)
+                for i, u in enumerate(rows):
                     if self.stopped is not None and self.stopped.is_set():
                         return
                     phone_interval_id = u[0]
@@ -1674,7 +2002,16 @@ class AlignmentAnalysisWorker(Worker):
 
             except psycopg2.errors.InvalidRegularExpression:
                 pass
-        return data, indices, utterance_ids, file_indices, speaker_indices, reversed_indices
+        return (
+            data,
+            indices,
+            utterance_ids,
+            file_indices,
+            speaker_indices,
+            reversed_indices,
+            keys,
+            total,
+        )
 
 
 class SpeakerDiarizationWorker(Worker):
@@ -3126,7 +3463,7 @@ class QueryOovWorker(Worker):
         self.session = session
 
     def _run(self):
-        with self.session() as session:
+        with self.session() as session, self.cancellable(session):
             text_filter = self.kwargs.get("text_filter", None)
             sort_index = self.kwargs.get("sort_index", None)
             columns = [Word.word, Word.count, Word.id]
@@ -3140,21 +3477,28 @@ class QueryOovWorker(Worker):
                 filter_regex = text_filter.generate_expression(posix=True)
                 words = words.filter(text_column.op("~")(filter_regex))
             if self.kwargs.get("count", False):
+                if self.kwargs.get("estimate", False):
+                    return estimate_count(words)
                 return words.count()
             if sort_index is not None and sort_index < len(columns):
-                sort_column = columns[sort_index]
-                if self.kwargs.get("sort_desc", False):
-                    sort_column = sort_column.desc()
+                order = [(sort_index, self.kwargs.get("sort_desc", False)), (2, False)]
             else:
-                sort_column = text_column
-            words = words.order_by(sort_column, Word.id)
-
-            words = words.limit(self.kwargs.get("limit", 100)).offset(
-                self.kwargs.get("current_offset", 0)
+                order = [(0, False), (2, False)]
+            seek_key = self.kwargs.get("seek_key", None)
+            seek_previous = self.kwargs.get("seek_previous", False)
+            words = keyset_paginate(words, columns, order, seek_key, seek_previous)
+
+            rows, total = fetch_page(
+                words,
+                self.kwargs.get("limit", 100),
+                self.kwargs.get("current_offset", 0),
+                seek_key,
+                seek_previous,
+                self.kwargs.get("with_count", False),
             )
             data = []
             indices = []
-            for word, count, w_id in words:
+            for word, count, w_id in rows:
                 if self.stopped is not None and self.stopped.is_set():
                     return
                 data.append([word, count])
@@ -3162,7 +3506,7 @@ class QueryOovWorker(Worker):
                 if self.progress_callback is not None:
                     self.progress_callback.increment_progress(1)
 
-        return data, indices
+        return data, indices, page_keys(rows, order), total
 
 
 class QueryDictionaryWorker(Worker):
@@ -3172,7 +3516,7 @@ class QueryDictionaryWorker(Worker):
         self.dictionary_id = dictionary_id
 
     def _run(self):
-        with self.session() as session:
+        with self.session() as session, self.cancellable(session):
             text_filter = self.kwargs.get("text_filter", None)
             sort_index = self.kwargs.get("sort_index", None)
             filter_unused = self.kwargs.get("filter_unused", False)
@@ -3197,22 +3541,30 @@ class QueryDictionaryWorker(Worker):
                 filter_regex = text_filter.generate_expression(posix=True)
                 words = words.filter(text_column.op("~")(filter_regex))
             if self.kwargs.get("count", False):
+                if self.kwargs.get("estimate", False):
+                    return estimate_count(words)
                 return words.count()
             if sort_index is not None and sort_index < len(columns):
-                sort_column = columns[sort_index]
-                if self.kwargs.get("sort_desc", False):
-                    sort_column = sort_column.desc()
+                order = [(sort_index, self.kwargs.get("sort_desc", False))]
             else:
-                sort_column = text_column
-            words = words.order_by(sort_column, Word.id, Pronunciation.id)
-
-            words = words.limit(self.kwargs.get("limit", 100)).offset(
-                self.kwargs.get("current_offset", 0)
+                order = [(0, False)]
+            order.extend([(4, False), (5, False)])
+            seek_key = self.kwargs.get("seek_key", None)
+            seek_previous = self.kwargs.get("seek_previous", False)
+            words = keyset_paginate(words, columns, order, seek_key, seek_previous)
+
+            rows, total = fetch_page(
+                words,
+                self.kwargs.get("limit", 100),
+                self.kwargs.get("current_offset", 0),
+                seek_key,
+                seek_previous,
+                self.kwargs.get("with_count", False),
             )
             data = []
             indices = []
             pron_indices = []
-            for word, word_type, count, pron, w_id, p_id in words:
+            for word, word_type, count, pron, w_id, p_id in rows:
                 if self.stopped is not None and self.stopped.is_set():
                     return
                 indices.append(w_id)
@@ -3221,7 +3573,7 @@ class QueryDictionaryWorker(Worker):
                 if self.progress_callback is not None:
                     self.progress_callback.increment_progress(1)
 
-        return data, indices, pron_indices
+        return data, indices, pron_indices, page_keys(rows, order), total
 
 
 class ExportLexiconWorker(Worker):
@@ -3342,23 +3694,46 @@ class FunctionWorker(QtCore.QThread):  # pragma: no cover
 
 
 class AutoWaveformWorker(Worker):  # pragma: no cover
-    def __init__(self, y, normalized_min, normalized_max, begin, end, channel, *args):
+    MAX_RAW_FRAMES = 2**22
+
+    def __init__(
+        self,
+        audio_source: AudioSource,
+        normalized_min,
+        normalized_max,
+        begin,
+        end,
+        channel,
+        *args,
+        peaks: typing.Optional[PeakPyramid] = None,
+        num_points=None,
+    ):
         super().__init__("Scaling waveform", *args)
-        self.y = y
+        self.audio_source = audio_source
         self.normalized_min = normalized_min
         self.normalized_max = normalized_max
         self.begin = begin
         self.end = end
         self.channel = channel
+        self.peaks = peaks
+        self.num_points = num_points
 
     def run(self):
-        self.stopped.clear()
-        if self.y.shape[0] == 0:
+        if self.stale:
             return
-        max_val = np.max(np.abs(self.y), axis=0)
+        try:
+            y = self.read_envelope()
+        except AudioSourceClosedError:
+            return
+        if y is None:
+            self.signals.result.emit((None, self.begin, self.end, self.channel))
+            return
+        if y.shape[0] == 0:
+            return
+        max_val = np.max(np.abs(y), axis=0)
         if np.isnan(max_val):
             return
-        normalized = self.y / max_val
+        normalized = y / max_val
         normalized[np.isnan(normalized)] = 0
 
         height = self.normalized_max - self.normalized_min
@@ -3370,6 +3745,26 @@ class AutoWaveformWorker(Worker):  # pragma: no cover
             return
         self.signals.result.emit((normalized, self.begin, self.end, self.channel))
 
+    def read_envelope(self) -> typing.Optional[np.ndarray]:
+        if self.num_points is not None and self.peaks is not None:
+            y = self.peaks.envelope(
+                self.audio_source.time_to_frame(self.begin),
+                self.audio_source.time_to_frame(self.end),
+                self.channel,
+                self.num_points,
+            )
+            if y is not None:
+                return y
+        begin_frame = self.audio_source.time_to_frame(self.begin)
+        end_frame = self.audio_source.time_to_frame(self.end)
+        if self.num_points is not None and end_frame - begin_frame > self.MAX_RAW_FRAMES:
+            # Long views are left blank until the peak pyramid is ready rather than read in full
+            return None
+        y = self.audio_source.read_frames(begin_frame, end_frame, self.channel)
+        if self.num_points is not None:
+            y = min_max_envelope(y, self.num_points)
+        return y
+
 
 class WaveformWorker(Worker):  # pragma: no cover
     def __init__(self, file_path, *args):
@@ -3377,12 +3772,99 @@ class WaveformWorker(Worker):  # pragma: no cover
         self.file_path = file_path
 
     def run(self):
+        peaks = None
         try:
-            y, _ = soundfile.read(self.file_path)
+            audio_source = transcode_cache(self.settings).open(self.file_path)
         except soundfile.LibsndfileError:
             logger.warning(f"Could not read {self.file_path}")
-            y = None
-        self.signals.result.emit((y, self.file_path))
+            audio_source = None
+        else:
+            peaks = peak_cache(self.settings).load(audio_source)
+        self.signals.result.emit((audio_source, peaks, self.file_path))
+
+
+class TranscodeAudioWorker(Worker):  # pragma: no cover
+    def __init__(self, session, *args):
+        super().__init__("Transcoding audio", *args)
+        self.session = session
+
+    def run(self):
+        cache = transcode_cache(self.settings)
+        if cache.max_size <= 0:
+            return
+        with self.session() as session:
+            sound_file_paths = [x for x, in session.query(SoundFile.sound_file_path)]
+        to_transcode = []
+        estimated_size = 0
+        for path in sound_file_paths:
+            if self.stopped.is_set():
+                return
+            if not needs_transcoding(path) or cache.lookup(path) is not None:
+                continue
+            try:
+                info = soundfile.info(path)
+            except soundfile.LibsndfileError:
+                logger.warning(f"Could not read {path} for transcoding")
+                continue
+            size = (
+                info.frames
+                * info.channels
+                * np.dtype(TRANSCODE_DTYPES[transcoded_subtype(info.subtype)]).itemsize
+            )
+            # Anything past the budget would only evict files transcoded earlier in the run
+            if estimated_size + size > cache.max_size:
+                break
+            estimated_size += size
+            to_transcode.append(path)
+        if not to_transcode:
+            return
+        cache.directory.mkdir(parents=True, exist_ok=True)
+        if self.progress_callback is not None:
+            self.progress_callback.update_total(len(to_transcode))
+        num_transcoded = 0
+        # Not used as a context manager, since leaving the with block joins running transcodes
+        # and would hold up cancelling
+        executor = ProcessPoolExecutor(max_workers=config.NUM_JOBS)
+        try:
+            futures = {
+                executor.submit(transcode_audio, path, str(cache.cache_path(path))): path
+                for path in to_transcode
+            }
+            for future in as_completed(futures):
+                if self.stopped.is_set():
+                    break
+                try:
+                    if future.result() is not None:
+                        num_transcoded += 1
+                except (soundfile.LibsndfileError, RuntimeError, OSError):
+                    logger.warning(f"Could not transcode {futures[future]}")
+                if self.progress_callback is not None:
+                    self.progress_callback.increment_progress(1)
+        finally:
+            # Transcodes write to a temporary file first, so abandoned ones never show up in
+            # the cache
+            executor.shutdown(wait=not self.stopped.is_set(), cancel_futures=True)
+        cache.evict()
+        self.signals.result.emit(num_transcoded)
+
+
+class PeakPyramidWorker(Worker):  # pragma: no cover
+    def __init__(self, audio_source: AudioSource, *args):
+        super().__init__("Generating waveform peaks", *args)
+        self.audio_source = audio_source
+
+    def run(self):
+        try:
+            peaks = PeakPyramid.build(self.audio_source, stopped=self.stopped)
+        except AudioSourceClosedError:
+            return
+        except soundfile.LibsndfileError:
+            logger.warning(f"Could not generate peaks for {self.audio_source.path}")
+            peaks = None
+        if peaks is None:
+            return
+        peak_cache(self.settings).save(self.audio_source, peaks)
+        self.signals.result.emit((peaks, self.audio_source.path))
 
 
 class SpeakerTierWorker(Worker):  # pragma: no cover
@@ -3406,8 +3888,14 @@ class SpeakerTierWorker(Worker):  # pragma: no cover
         self.settings = AnchorSettings()
 
     def run(self):
-        if self.session is None:
+        results = self.query_utterances()
+        if results is None:
             return
+        self.signals.result.emit(results)
+
+    def query_utterances(self):
+        if self.session is None:
+            return None
         with self.session() as session:
             file = session.get(File, self.file_id)
             show_phones = self.settings.value(
@@ -3461,93 +3949,264 @@ class SpeakerTierWorker(Worker):  # pragma: no cover
             ):
                 cached_begin = min(cached_begin, utterances[0].begin)
                 cached_end = max(cached_end, utterances[-1].end)
-            self.signals.result.emit((utterances, self.file_id, cached_begin, cached_end))
+        return utterances, self.file_id, cached_begin, cached_end
+
+
+class PrefetchWorker(SpeakerTierWorker):  # pragma: no cover
+    def __init__(
+        self,
+        session,
+        file_id,
+        begin,
+        end,
+        *args,
+        query_alignment=False,
+        load_file=True,
+        tile_cache: typing.Optional[ArrayCache] = None,
+    ):
+        super().__init__(
+            session, file_id, *args, query_alignment=query_alignment, begin=begin, end=end
+        )
+        self.load_file = load_file
+        self.tile_cache = tile_cache
+
+    def run(self):
+        if self.session is None or self.stale:
+            return
+        utterances = None
+        cached_begin = None
+        cached_end = None
+        peaks = None
+        if self.load_file:
+            results = self.query_utterances()
+            if results is None or self.stale:
+                return
+            utterances, _, cached_begin, cached_end = results
+        with self.session() as session:
+            sound_file_path = (
+                session.query(SoundFile.sound_file_path)
+                .filter(SoundFile.file_id == self.file_id)
+                .scalar()
+            )
+        try:
+            audio_source = transcode_cache(self.settings).open(sound_file_path)
+        except (soundfile.LibsndfileError, TypeError):
+            return
+        if self.load_file:
+            peaks = peak_cache(self.settings).load(audio_source)
+        if self.tile_cache is not None:
+            spectrogram_worker = SpectrogramWorker(
+                audio_source, self.begin, self.end, 0, tile_cache=self.tile_cache
+            )
+            spectrogram_worker.stopped = self.stopped
+            spectrogram_worker.compute()
+        if self.stale or not self.load_file:
+            audio_source.close()
+            audio_source = None
+            if self.stale:
+                return
+        self.signals.result.emit(
+            (
+                self.file_id,
+                self.begin,
+                self.end,
+                self.query_alignment,
+                utterances,
+                cached_begin,
+                cached_end,
+                audio_source,
+                peaks,
+            )
+        )
 
 
 class SpectrogramWorker(Worker):  # pragma: no cover
-    def __init__(self, y, sample_rate, begin, end, channel, *args):
+    TILE_FRAMES = 256
+
+    def __init__(
+        self,
+        audio_source: AudioSource,
+        begin,
+        end,
+        channel,
+        *args,
+        tile_cache: typing.Optional[ArrayCache] = None,
+        prefetch_cache: typing.Optional[ArrayCache] = None,
+    ):
         super().__init__("Generating spectrogram", *args)
-        self.y = y
-        self.sample_rate = sample_rate
+        self.audio_source = audio_source
+        self.tile_cache = tile_cache
+        self.prefetch_cache = prefetch_cache
         self.begin = begin
         self.end = end
         self.channel = channel
 
+    def compute_tile(
+        self, tile_index, sample_rate, hop_length, n_fft, window_size_samp, pre_emph_coeff
+    ):
+        tile_samples = self.TILE_FRAMES * hop_length
+        margin = n_fft
+        begin_samp = tile_index * tile_samples - n_fft // 2 - margin
+        end_samp = (tile_index + 1) * tile_samples + n_fft // 2 + margin
+        source_rate = self.audio_source.sample_rate
+        y = self.audio_source.read_padded(
+            begin_samp * source_rate // sample_rate,
+            end_samp * source_rate // sample_rate,
+            self.channel,
+        )
+        y = resample(y, source_rate, sample_rate)
+        y = librosa.effects.preemphasis(y, coef=pre_emph_coeff)
+        y = y[margin : margin + tile_samples + 2 * (n_fft // 2)]
+        stft = np.abs(
+            librosa.stft(
+                y,
+                n_fft=n_fft,
+                win_length=window_size_samp,
+                hop_length=hop_length,
+                center=False,
+            )
+        )[:, : self.TILE_FRAMES]
+        return librosa.amplitude_to_db(stft, top_db=None).astype(np.float32)
+
     def run(self):
+        if self.stale:
+            return
+        try:
+            results = self.compute()
+        except AudioSourceClosedError:
+            return
+        if self.stale:
+            return
+        self.signals.result.emit(results)
+
+    def get_tile(self, key):
+        tile = None
+        if self.tile_cache is not None:
+            tile = self.tile_cache.get(key)
+        if tile is None and self.prefetch_cache is not None:
+            tile = self.prefetch_cache.get(key)
+            if tile is not None and self.tile_cache is not None:
+                self.tile_cache.put(key, tile)
+        return tile
+
+    def compute(self):
         dynamic_range = self.settings.value(self.settings.SPEC_DYNAMIC_RANGE)
         n_fft = self.settings.value(self.settings.SPEC_N_FFT)
         time_steps = self.settings.value(self.settings.SPEC_N_TIME_STEPS)
         window_size = self.settings.value(self.settings.SPEC_WINDOW_SIZE)
         pre_emph_coeff = self.settings.value(self.settings.SPEC_PREEMPH)
         max_freq = self.settings.value(self.settings.SPEC_MAX_FREQ)
-        if self.y.shape[0] == 0:
-            self.signals.result.emit(None)
-            return
-        duration = self.y.shape[0] / self.sample_rate
+        duration = self.end - self.begin
+        if duration <= 0:
+            return None
         if duration > self.settings.value(self.settings.SPEC_MAX_TIME):
-            self.signals.result.emit(None)
-            return
-        max_sr = 2 * max_freq
-        if self.sample_rate > max_sr:
-            self.y = scipy.signal.resample(
-                self.y, int(self.y.shape[0] * max_sr / self.sample_rate)
-            )
-            self.sample_rate = max_sr
-        self.y = librosa.effects.preemphasis(self.y, coef=pre_emph_coeff)
-        begin_samp = int(self.begin * self.sample_rate)
-        end_samp = int(self.end * self.sample_rate)
+            return None
+        sample_rate = int(min(self.audio_source.sample_rate, 2 * max_freq))
         window_size = round(window_size, 6)
-        window_size_samp = int(window_size * self.sample_rate)
-        duration_samp = end_samp - begin_samp
-        if time_steps >= duration_samp:
-            step_size_samples = 1
-        else:
-            step_size_samples = int(duration_samp / time_steps)
-        stft = librosa.amplitude_to_db(
-            np.abs(
-                librosa.stft(
-                    self.y,
-                    n_fft=n_fft,
-                    win_length=window_size_samp,
-                    hop_length=step_size_samples,
-                    center=True,
+        window_size_samp = int(window_size * sample_rate)
+        duration_samp = duration * sample_rate
+        # Quantize the hop to a power of two so that nearby zoom levels share tiles
+        hop_length = int(2 ** round(np.log2(max(duration_samp / time_steps, 1))))
+        begin_frame = int(self.begin * sample_rate / hop_length)
+        end_frame = max(int(np.ceil(self.end * sample_rate / hop_length)), begin_frame + 1)
+        first_tile = begin_frame // self.TILE_FRAMES
+        last_tile = (end_frame - 1) // self.TILE_FRAMES
+        tiles = []
+        for tile_index in range(first_tile, last_tile + 1):
+            if self.stale:
+                return None
+            key = (
+                self.audio_source.path,
+                self.channel,
+                tile_index,
+                sample_rate,
+                hop_length,
+                n_fft,
+                window_size_samp,
+                pre_emph_coeff,
+            )
+            tile = self.get_tile(key)
+            if tile is None:
+                tile = self.compute_tile(
+                    tile_index, sample_rate, hop_length, n_fft, window_size_samp, pre_emph_coeff
                 )
-            ),
-            top_db=dynamic_range,
-        )
+                if self.tile_cache is not None:
+                    self.tile_cache.put(key, tile)
+            tiles.append(tile)
+        offset = first_tile * self.TILE_FRAMES
+        stft = np.concatenate(tiles, axis=1)[:, begin_frame - offset : end_frame - offset]
+        stft = np.maximum(stft, np.max(stft) - dynamic_range)
         min_db, max_db = np.min(stft), np.max(stft)
-        self.signals.result.emit((stft, self.channel, self.begin, self.end, min_db, max_db))
+        return stft, self.channel, self.begin, self.end, min_db, max_db
+
+
+class ViewAudioWorker(Worker):  # pragma: no cover
+    def __init__(self, audio_source: AudioSource, begin, end, channel, *args):
+        super().__init__("Preparing audio", *args)
+        self.audio_source = audio_source
+        self.begin = begin
+        self.end = end
+        self.channel = channel
+
+    def run(self):
+        if self.stale:
+            return
+        try:
+            view_audio = ViewAudio.prepare(self.audio_source, self.begin, self.end, self.channel)
+        except AudioSourceClosedError:
+            return
+        if self.stale:
+            return
+        self.signals.result.emit(view_audio)
 
 
 class MfccWorker(Worker):  # pragma: no cover
-    def __init__(self, y, sample_rate, begin, end, channel, *args):
+    def __init__(
+        self,
+        y,
+        sample_rate,
+        begin,
+        end,
+        channel,
+        *args,
+        feature_segments: typing.Optional[typing.List[typing.Tuple[float, float, str]]] = None,
+        feature_options: typing.Optional[typing.Dict[str, typing.Any]] = None,
+        feature_cache: typing.Optional[ArrayCache] = None,
+    ):
         super().__init__("Generating spectrogram", *args)
         self.y = y
         self.sample_rate = sample_rate
         self.begin = begin
         self.end = end
         self.channel = channel
-
-        self.mfcc_computer = MfccComputer(
-            use_energy=False,
-            raw_energy=False,
-            frame_shift=10,
-            frame_length=25,
-            snip_edges=False,
-            low_frequency=20,
-            high_frequency=7800,
-            sample_frequency=16000,
-            allow_downsample=True,
-            allow_upsample=True,
-            dither=0.0,
-            energy_floor=0.0,
-            num_coefficients=13,
-            num_mel_bins=23,
-            cepstral_lifter=22,
-            preemphasis_coefficient=0.97,
-        )
+        self.feature_segments = feature_segments
+        self.feature_options = feature_options
+        self.feature_cache = feature_cache
+        self.frame_shift = 0.01
+        self.mfcc_options = {
+            "use_energy": False,
+            "raw_energy": False,
+            "frame_shift": 10,
+            "frame_length": 25,
+            "snip_edges": False,
+            "low_frequency": 20,
+            "high_frequency": 7800,
+            "sample_frequency": 16000,
+            "allow_downsample": True,
+            "allow_upsample": True,
+            "dither": 0.0,
+            "energy_floor": 0.0,
+            "num_coefficients": 13,
+            "num_mel_bins": 23,
+            "cepstral_lifter": 22,
+            "preemphasis_coefficient": 0.97,
+        }
+
+        self.mfcc_computer = MfccComputer(**self.mfcc_options)
 
     def run(self):
+        if self.stale:
+            return
         if self.y.shape[0] == 0:
             self.signals.result.emit(None)
             return
@@ -3556,20 +4215,191 @@ class MfccWorker(Worker):  # pragma: no cover
             self.signals.result.emit(None)
             return
         if self.sample_rate > self.mfcc_computer.sample_frequency:
-            self.y = scipy.signal.resample(
-                self.y,
-                int(self.y.shape[0] * self.mfcc_computer.sample_frequency / self.sample_rate),
-            )
+            self.y = resample(self.y, self.sample_rate, self.mfcc_computer.sample_frequency)
             self.sample_rate = self.mfcc_computer.sample_frequency
-        stft = self.mfcc_computer.compute_mfccs(self.y).T
+        if self.stale:
+            return
+        mfccs = None
+        if self.feature_segments and self.archives_match():
+            mfccs = self.mfccs_from_archives()
+        if self.stale:
+            return
+        if mfccs is None:
+            mfccs = self.mfcc_computer.compute_mfccs(self.y)
+        stft = mfccs.T
         min_db, max_db = np.min(stft), np.max(stft)
         self.signals.result.emit((stft, self.channel, self.begin, self.end, min_db, max_db))
 
+    def read_features(self, specifier: str) -> typing.Optional[np.ndarray]:
+        features = None
+        if self.feature_cache is not None:
+            features = self.feature_cache.get(specifier)
+        if features is None:
+            try:
+                features = read_kaldi_object(FloatMatrix, specifier).numpy()
+            except (RuntimeError, OSError):
+                # Kaldi read errors are raised as RuntimeError
+                logger.debug(f"Could not read features from {specifier}")
+                return None
+            if len(features.shape) != 2:
+                return None
+            if features.shape[1] != self.mfcc_computer.num_coefficients:
+                return None
+            if self.feature_cache is not None:
+                self.feature_cache.put(specifier, features)
+        return features
+
+    def archives_match(self) -> bool:
+        """
+        Check that the feature archives of the corpus hold the same plain MFCCs as are computed
+        for display, rather than normalized, stacked or transformed features
+
+        MFA applies CMVN by default, so the archives are only used for corpora whose features
+        were generated without CMVN, otherwise the view is always computed live
+        """
+        options = self.feature_options
+        if not options or options.get("type", None) != "mfcc":
+            return False
+        # Resampling flags only affect how audio is read, the energy options are unused without
+        # energy, and dither only adds noise at the level of the least significant bit
+        ignored = {"allow_downsample", "allow_upsample", "raw_energy", "energy_floor", "dither"}
+        for key, value in self.mfcc_options.items():
+            if key in ignored:
+                continue
+            if options.get(key, None) != value:
+                return False
+        return (
+            not options.get("uses_cmvn", True)
+            and not options.get("uses_deltas", True)
+            and not options.get("uses_splices", True)
+            and not options.get("uses_voiced", True)
+            and not options.get("use_pitch", True)
+        )
+
+    def mfccs_from_archives(self) -> typing.Optional[np.ndarray]:
+        """
+        Assemble the view from the feature archives generated by MFA for the utterances
+        overlapping it, or return None if they do not cover the whole view so that it is
+        computed live instead
+        """
+        num_frames = int(round((self.end - self.begin) / self.frame_shift))
+        mfccs = np.full((num_frames, self.mfcc_computer.num_coefficients), np.nan)
+        for begin, end, specifier in self.feature_segments:
+            if self.stale:
+                return None
+            features = self.read_features(specifier)
+            if features is None:
+                continue
+            # Frames are dropped when MFA only keeps voiced frames, so the archive can only be
+            # used when it still lines up with the utterance
+            if abs(features.shape[0] - (end - begin) / self.frame_shift) > 2:
+                continue
+            offset = int(round((begin - self.begin) / self.frame_shift))
+            first = max(-offset, 0)
+            last = min(features.shape[0], num_frames - offset)
+            if last > first:
+                mfccs[offset + first : offset + last] = features[first:last]
+        if np.any(np.isnan(mfccs[:, 0])):
+            return None
+        return mfccs
+
+
+class PitchTrackWorker(Worker):  # pragma: no cover
+    def __init__(
+        self,
+        audio_source: AudioSource,
+        channel: int,
+        *args,
+        chunk_duration: float = 60.0,
+        context_duration: float = 1.0,
+    ):
+        super().__init__("Generating file pitch track", *args)
+        self.audio_source = audio_source
+        self.channel = channel
+        self.chunk_duration = chunk_duration
+        self.context_duration = context_duration
+
+    def run(self):
+        options = pitch_options(self.settings)
+        frame_shift = self.settings.value(self.settings.PITCH_FRAME_SHIFT) / 1000
+        cache = pitch_cache(self.settings)
+        pitch_track = cache.load(self.audio_source, self.channel, frame_shift, options)
+        if pitch_track is None:
+            try:
+                pitch_track = self.compute(options, frame_shift)
+            except AudioSourceClosedError:
+                return
+            except soundfile.LibsndfileError:
+                logger.warning(f"Could not generate pitch track for {self.audio_source.path}")
+                return
+            if pitch_track is None:
+                return
+            cache.save(self.audio_source, self.channel, options, pitch_track)
+        self.signals.result.emit((pitch_track, self.channel, self.audio_source.path))
+
+    def compute(self, options, frame_shift) -> typing.Optional[PitchTrack]:
+        min_f0, max_f0, frame_length, penalty_factor, delta_pitch = options
+        source_rate = self.audio_source.sample_rate
+        sample_rate = min(source_rate, 16000)
+        pitch_computer = PitchComputer(
+            frame_shift=frame_shift * 1000,
+            frame_length=frame_length,
+            sample_frequency=sample_rate,
+            min_f0=min_f0,
+            max_f0=max_f0,
+            penalty_factor=penalty_factor,
+            delta_pitch=delta_pitch,
+            add_pov_feature=True,
+            add_normalized_log_pitch=False,
+            add_delta_pitch=False,
+            add_raw_log_pitch=True,
+        )
+        chunk_frames = int(round(self.chunk_duration / frame_shift))
+        context_frames = int(round(self.context_duration / frame_shift))
+        num_frames = int(self.audio_source.duration / frame_shift)
+        chunks = []
+        # Pitch is computed over overlapping chunks so that memory use does not depend on
+        # the file length, and only the frames away from the chunk edges are kept
+        for first_frame in range(0, num_frames, chunk_frames):
+            if self.stale:
+                return None
+            begin_frame = max(first_frame - context_frames, 0)
+            end_frame = first_frame + chunk_frames + context_frames
+            y = self.audio_source.read_frames(
+                int(begin_frame * frame_shift * source_rate),
+                int(end_frame * frame_shift * source_rate),
+                self.channel,
+                dtype="float32",
+            )
+            y = resample(y, source_rate, sample_rate)
+            track = compute_pitch(
+                y, pitch_computer.extraction_opts, pitch_computer.process_opts
+            ).numpy()
+            if len(track.shape) < 2:
+                track = np.zeros((0, 2))
+            offset = first_frame - begin_frame
+            chunks.append(track[offset : offset + chunk_frames])
+        data = np.concatenate(chunks, axis=0) if chunks else np.zeros((0, 2))
+        data[:, 1] = np.exp(data[:, 1])
+        return PitchTrack(data.astype(np.float32), frame_shift)
+
 
 class PitchWorker(Worker):  # pragma: no cover
-    def __init__(self, y, sample_rate, begin, end, channel, normalized_min, normalized_max, *args):
+    def __init__(
+        self,
+        y,
+        sample_rate,
+        begin,
+        end,
+        channel,
+        normalized_min,
+        normalized_max,
+        *args,
+        pitch_track: typing.Optional[PitchTrack] = None,
+    ):
         super().__init__("Generating pitch track", *args)
         self.y = y
+        self.pitch_track = pitch_track
         self.sample_rate = sample_rate
         self.begin = begin
         self.end = end
@@ -3597,25 +4427,37 @@ class PitchWorker(Worker):  # pragma: no cover
         )
 
     def run(self):
-        if self.y.shape[0] == 0:
+        if self.stale:
             return
-        duration = self.end - self.begin
-        if duration < 0.1:
-            self.signals.result.emit(None)
-            return
-        if duration > self.settings.value(self.settings.PITCH_MAX_TIME):
-            self.signals.result.emit(None)
-            return
-        pitch_track = compute_pitch(
-            self.y, self.pitch_computer.extraction_opts, self.pitch_computer.process_opts
-        ).numpy()
-        if len(pitch_track.shape) < 2:
+        if self.pitch_track is not None:
+            if self.end - self.begin < 0.1:
+                self.signals.result.emit(None)
+                return
+            pitch_track = self.pitch_track.slice(self.begin, self.end)
+        else:
+            if self.y.shape[0] == 0:
+                return
+            duration = self.end - self.begin
+            if duration < 0.1:
+                self.signals.result.emit(None)
+                return
+            if duration > self.settings.value(self.settings.PITCH_MAX_TIME):
+                self.signals.result.emit(None)
+                return
+            pitch_track = compute_pitch(
+                self.y, self.pitch_computer.extraction_opts, self.pitch_computer.process_opts
+            ).numpy()
+            if self.stale:
+                return
+            if len(pitch_track.shape) == 2:
+                pitch_track[:, 1] = np.exp(pitch_track[:, 1])
+        if len(pitch_track.shape) < 2 or pitch_track.shape[0] == 0:
             self.signals.result.emit(
                 (None, None, self.channel, self.begin, self.end, self.min_f0, self.max_f0)
             )
             return
         voiced_track = pitch_track[:, 0]
-        pitch_track = np.exp(pitch_track[:, 1])
+        pitch_track = pitch_track[:, 1]
         min_nccf = np.min(voiced_track)
         max_nccf = np.max(voiced_track)
         threshold = min_nccf + (max_nccf - min_nccf) * 0.45